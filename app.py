@@ -4,19 +4,20 @@ Reduce Late Night Social Media Usage and Improve Sleep Quality
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import json
-import os
-import pickle
-import joblib
+import time
 import warnings
-from datetime import datetime
-from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
-from sklearn.cluster import AgglomerativeClustering
+
+script_start = time.perf_counter()
+
+from dashboard import layout, navigation, services
+from wellness.datastore import enable_copy_on_write
+from wellness.timing import record, render_times
+
+# Sessions get shallow views of the shared read-only datasets and rely on pandas
+# copy-on-write to get their own copy of a column they change. It's only the
+# default from pandas 3 and changes pandas behaviour for the whole process, so
+# it's turned on here, at startup, rather than as a side effect of an import
+enable_copy_on_write()
 
 # Suppress sklearn version warnings and feature name warnings
 warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
@@ -31,2533 +32,40 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# CSS
-st.markdown("""
-<style>
-    /* Force dark theme on everything */
-    .stApp {
-        background-color: #0e1117 !important;
-        color: #ffffff !important;
-        font-family: 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif !important;
-    }
-    .stApp > div {
-        background-color: #0e1117 !important;
-        color: #ffffff !important;
-    }
-    [data-testid="stAppViewContainer"] {
-        background-color: #0e1117 !important;
-        color: #ffffff !important;
-    }
-    [data-testid="stHeader"] {
-        background-color: #0e1117 !important;
-    }
-    .main .block-container {
-        background-color: #0e1117 !important;
-        color: #ffffff !important;
-        padding-top: 1rem !important;
-    }
-    
-    /* Force all text to be white with better visibility */
-    .stMarkdown, .stMarkdown *, p, div, span {
-        color: #ffffff !important;
-        background-color: transparent !important;
-        font-weight: 600 !important;
-        font-size: 16px !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.7) !important;
-        line-height: 1.6 !important;
-    }
-    
-    /* Headers with better visibility */
-    .main-header {
-        font-size: 2.5rem !important;
-        color: #00d4ff !important;
-        text-align: center;
-        margin-bottom: 1rem;
-        font-weight: 800 !important;
-        text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.8) !important;
-    }
-    .subtitle {
-        font-size: 1.2rem !important;
-        color: #ffffff !important;
-        text-align: center;
-        margin-bottom: 2rem;
-        font-weight: 600 !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.6) !important;
-    }
-    h1, h2, h3, h4, h5, h6 {
-        color: #ffffff !important;
-        font-weight: 700 !important;
-        text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.8) !important;
-    }
-    
-    /* Improved metric boxes */
-    .metric-box {
-        background-color: #1e2329 !important;
-        padding: 1.5rem;
-        border-radius: 0.8rem;
-        margin: 1rem 0;
-        text-align: center;
-        border-left: 4px solid #00d4ff;
-        color: #ffffff !important;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3) !important;
-    }
-    .metric-box h2, .metric-box h3, .metric-box p {
-        color: #ffffff !important;
-        font-weight: 700 !important;
-        text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.8) !important;
-    }
-    .metric-box h2 {
-        font-size: 2.5rem !important;
-        color: #00d4ff !important;
-    }
-    .metric-box h3 {
-        font-size: 1.3rem !important;
-    }
-    .metric-box p {
-        font-size: 1.1rem !important;
-        color: #e0e0e0 !important;
-    }
-    
-    /* Enhanced status boxes */
-    .success-box {
-        background-color: #1b4d3e !important;
-        border: 1px solid #28a745;
-        color: #ffffff !important;
-        font-weight: 700 !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.7) !important;
-    }
-    .warning-box {
-        background-color: #4d3319 !important;
-        border: 1px solid #ffc107;
-        color: #ffffff !important;
-        font-weight: 700 !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.7) !important;
-    }
-    .danger-box {
-        background-color: #4d1919 !important;
-        border: 1px solid #dc3545;
-        color: #ffffff !important;
-        font-weight: 700 !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.7) !important;
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-        border: 1px solid #4a5568 !important;
-        font-weight: 500 !important;
-    }
-    .stButton > button:hover {
-        background-color: #00d4ff !important;
-        color: #0e1117 !important;
-        border-color: #00d4ff !important;
-    }
-    
-    /* Form elements - comprehensive dropdown fixes */
-    .stSelectbox > div > div {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-    }
-    .stSelectbox > div > div > div {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-    }
-    .stSelectbox option {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-    }
-    .stTextInput > div > div > input {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-        border-color: #4a5568 !important;
-    }
-    /* Fix dropdown menu visibility - all possible selectors */
-    div[data-baseweb="select"] {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-    }
-    div[data-baseweb="select"] > div {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-    }
-    div[data-baseweb="select"] * {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-    }
-    /* Target the dropdown popover */
-    div[data-baseweb="popover"] {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-    }
-    div[data-baseweb="popover"] * {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-    }
-    /* Additional dropdown styling */
-    .stSelectbox [data-baseweb="select"] [aria-selected="true"] {
-        background-color: #00d4ff !important;
-        color: #0e1117 !important;
-    }
-    .stSelectbox [data-baseweb="select"] [aria-selected="false"] {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-    }
-    /* Override any remaining light backgrounds */
-    .stSelectbox ul {
-        background-color: #2d3748 !important;
-    }
-    .stSelectbox li {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-    }
-    .stSelectbox li:hover {
-        background-color: #00d4ff !important;
-        color: #0e1117 !important;
-    }
-    
-    /* Metrics */
-    [data-testid="metric-container"] {
-        background-color: #1e2329 !important;
-        border: 1px solid #2d3748 !important;
-        padding: 1rem !important;
-        border-radius: 0.5rem !important;
-    }
-    [data-testid="metric-container"] * {
-        color: #ffffff !important;
-    }
-    
-    /* Enhanced form elements and labels */
-    .stSelectbox label,
-    .stSlider label,
-    .stRadio label,
-    .stCheckbox label,
-    .stTextInput label,
-    .stNumberInput label {
-        color: #ffffff !important;
-        font-weight: 700 !important;
-        font-size: 18px !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.7) !important;
-        margin-bottom: 0.5rem !important;
-    }
-    
-    /* Dropdown styling */
-    .stSelectbox > div > div {
-        background-color: #2d3748 !important;
-        color: #ffffff !important;
-        border: 2px solid #00d4ff !important;
-        font-weight: 600 !important;
-        font-size: 16px !important;
-    }
-    
-    /* Dropdown options */
-    .stSelectbox > div > div > div {
-        background-color: #1e2329 !important;
-        color: #ffffff !important;
-        font-weight: 600 !important;
-        font-size: 16px !important;
-    }
-    
-    /* Button improvements */
-    .stButton > button {
-        background: linear-gradient(135deg, #00d4ff 0%, #0099cc 100%) !important;
-        color: #ffffff !important;
-        font-weight: 800 !important;
-        font-size: 18px !important;
-        border: none !important;
-        border-radius: 8px !important;
-        padding: 0.75rem 1.5rem !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.5) !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 2px 8px rgba(0, 212, 255, 0.3) !important;
-    }
-    
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #0099cc 0%, #007799 100%) !important;
-        transform: translateY(-2px) !important;
-        box-shadow: 0 4px 16px rgba(0, 212, 255, 0.5) !important;
-    }
-    
-    /* Slider styling */
-    .stSlider > div > div > div > div {
-        background-color: #00d4ff !important;
-    }
-    
-    /* Radio button styling */
-    .stRadio > div {
-        background-color: #1e2329 !important;
-        padding: 1rem !important;
-        border-radius: 8px !important;
-        border: 1px solid #4a5568 !important;
-    }
-    
-    /* Checkbox styling */
-    .stCheckbox > label {
-        background-color: #1e2329 !important;
-        padding: 0.5rem !important;
-        border-radius: 4px !important;
-        border: 1px solid #4a5568 !important;
-    }
-    
-    /* Info/Alert boxes */
-    .stInfo, .stWarning, .stError, .stSuccess {
-        background-color: rgba(0, 212, 255, 0.15) !important;
-        border: 2px solid #00d4ff !important;
-        color: #ffffff !important;
-        font-weight: 700 !important;
-        font-size: 16px !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.6) !important;
-    }
-    
-    /* Sidebar improvements */
-    .css-1d391kg {
-        background-color: #1e2329 !important;
-        border-right: 3px solid #00d4ff !important;
-    }
-    
-    /* Sidebar text */
-    .css-1d391kg .stSelectbox label,
-    .css-1d391kg .stRadio label,
-    .css-1d391kg .stMarkdown {
-        color: #ffffff !important;
-        font-weight: 700 !important;
-        font-size: 16px !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.6) !important;
-    }
-    
-    /* Custom card text improvements */
-    div[style*="background: linear-gradient"] h2,
-    div[style*="background: linear-gradient"] h3,
-    div[style*="background: linear-gradient"] p {
-        font-weight: 800 !important;
-        text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.9) !important;
-        font-size: 1.1em !important;
-    }
-    
-    /* Assessment results cards */
-    div[style*="height: 180px"] h2,
-    div[style*="height: 180px"] h3,
-    div[style*="height: 180px"] p {
-        font-weight: 900 !important;
-        text-shadow: 3px 3px 6px rgba(0, 0, 0, 1) !important;
-        font-size: 1.2em !important;
-    }
-    
-    /* Recommendation sections */
-    div[style*="border-left: 4px solid"] p,
-    div[style*="border-left: 4px solid"] div {
-        font-weight: 700 !important;
-        font-size: 17px !important;
-        color: #ffffff !important;
-        text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.8) !important;
-        line-height: 1.6 !important;
-    }
-    
-    /* Progress tracking and research page text */
-    div[style*="border-left: 4px solid #00d4ff"] div,
-    div[style*="border-left: 4px solid #ffc107"] div,
-    div[style*="border-left: 4px solid #17a2b8"] div {
-        font-weight: 700 !important;
-        font-size: 17px !important;
-        color: #ffffff !important;
-        text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.8) !important;
-    }
-    
-    /* Table improvements */
-    .stDataFrame {
-        background-color: #1e2329 !important;
-        color: #ffffff !important;
-        font-weight: 700 !important;
-        border: 2px solid #00d4ff !important;
-        border-radius: 8px !important;
-    }
-    
-    .stDataFrame th {
-        background-color: #2d3748 !important;
-        color: #00d4ff !important;
-        font-weight: 800 !important;
-        font-size: 18px !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.7) !important;
-    }
-    
-    .stDataFrame td {
-        color: #ffffff !important;
-        font-weight: 700 !important;
-        font-size: 16px !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.5) !important;
-    }
-    
-    /* Plotly chart improvements */
-    .js-plotly-plot .plotly text {
-        fill: #ffffff !important;
-        font-weight: 700 !important;
-        font-size: 16px !important;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.8) !important;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Load trained models and scalers
-@st.cache_resource
-def load_models():
-    """Load the trained clustering models and scalers"""
-    try:
-        # Load teen models
-        teen_model = joblib.load("models/teen_kmeans_model.pkl")
-        teen_scaler = joblib.load("models/teen_scaler.pkl")
-        
-        # Load social media models  
-        social_model = joblib.load("models/social_hierarchical_model.pkl")
-        social_scaler = joblib.load("models/social_scaler.pkl")
-            
-        return teen_model, teen_scaler, social_model, social_scaler
-    except Exception as e:
-        # If models can't be loaded, return None and we'll use fallback logic
-        st.warning(f"⚠️ Could not load trained models ({str(e)}). Using research-based fallback logic.")
-        return None, None, None, None
-
-def predict_cluster(user_data, dataset_type, teen_model, teen_scaler, social_model, social_scaler):
-    """Predict user cluster using trained models or research-based fallback"""
-    try:
-        # If models are available, use them
-        if teen_model is not None and social_model is not None:
-            if dataset_type == "Teen":
-                # Prepare teen features (5 features as trained): 
-                # Sleep_Hours, Screen_Time_Before_Bed, Time_on_Social_Media, Daily_Usage_Hours, Age
-                features = np.array([[
-                    user_data['sleep_hours'],
-                    user_data['bedtime_screen'],
-                    user_data['social_media'],
-                    user_data['daily_usage'],
-                    user_data.get('age_numeric', 16)  # Default teen age
-                ]])
-                
-                # Scale features and predict
-                features_scaled = teen_scaler.transform(features)
-                cluster = teen_model.predict(features_scaled)[0]
-                confidence = 0.152  # Silhouette score from research
-                
-            else:  # Social Media dataset
-                # Prepare social media features (5 features as trained):
-                # Sleep Duration, Social Media Usage (hrs), Screen.Time(hrs), Exercise Time (hrs), Age
-                features = np.array([[
-                    user_data['sleep_hours'],
-                    user_data['social_media'],
-                    user_data['daily_usage'],  # Screen time mapping
-                    user_data.get('exercise_time', 1.0),  # Default exercise time
-                    user_data.get('age_numeric', 22)  # Default adult age
-                ]])
-                
-                # Scale features and predict
-                features_scaled = social_scaler.transform(features)
-                cluster = social_model.predict(features_scaled)[0]
-                confidence = 0.775  # Silhouette score from research
-        
-        else:
-            # Fallback: Use research-based logic when models aren't available
-            if dataset_type == "Teen":
-                # Research shows 49.3% in higher usage group, 50.7% in balanced group
-                # Use sleep hours and usage patterns to determine cluster
-                usage_risk = (user_data['daily_usage'] > 6) + (user_data['social_media'] > 3) + (user_data['bedtime_screen'] > 1)
-                sleep_risk = (user_data['sleep_hours'] < 7)
-                
-                # If multiple risk factors, likely higher usage group (cluster 1)
-                cluster = 1 if (usage_risk >= 2 or sleep_risk) else 0
-                confidence = 0.152  # Research silhouette score
-                
-            else:  # Social Media dataset
-                # Research shows 99.2% regular users, 0.8% high-risk
-                # Very high threshold for high-risk cluster
-                extreme_usage = user_data['daily_usage'] > 10 and user_data['social_media'] > 6 and user_data['sleep_hours'] < 5
-                cluster = 1 if extreme_usage else 0
-                confidence = 0.775  # Research silhouette score
-                
-        return cluster, confidence
-        
-    except Exception as e:
-        st.warning(f"Error in cluster prediction: {str(e)}. Using default classification.")
-        return 0, 0.5
-
-# Load data functions
-@st.cache_data
-def load_data():
-    """Load all dashboard data"""
-    try:
-        # Load processed datasets
-        teen_df = pd.read_csv("data/teen_processed.csv")
-        social_df = pd.read_csv("data/social_processed.csv")
-        
-        # Load cluster results 
-        teen_clusters = pd.read_csv("data/teen_clusters.csv")
-        social_clusters = pd.read_csv("data/social_clusters.csv")
-        
-                
-        # Load recommendations
-        with open("data/recommendations.json", 'r') as f:
-            recommendations = json.load(f)
-        
-        # Load performance metrics
-        performance_df = pd.read_csv("data/algorithm_performance.csv")
-        
-        return teen_df, social_df, recommendations, performance_df
-    except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        return None, None, None, None
-
-# Title and description
-st.markdown('<h1 class="main-header">📱 Digital Wellness Dashboard</h1>', unsafe_allow_html=True)
-st.markdown('<p class="subtitle">Clustering-Based Recommendations to Reduce Late Night Social Media Usage and Improve Sleep Quality</p>', unsafe_allow_html=True)
-st.markdown('<p style="text-align: center; color: #888;">Based on machine learning analysis of 7,299 users</p>', unsafe_allow_html=True)
-
-# Horizontal Navigation
-st.markdown("---")
-
-# Initialize page 
-if 'current_page' not in st.session_state:
-    st.session_state.current_page = "🏠 Overview & Analytics"
-
-# Horizontal navigation buttons
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    if st.button("🏠 Overview & Analytics", use_container_width=True):
-        st.session_state.current_page = "🏠 Overview & Analytics"
-
-with col2:
-    if st.button("🔍 Take Assessment", use_container_width=True):
-        st.session_state.current_page = "🔍 Take Assessment"
-
-with col3:
-    if st.button("💡 Get Recommendations", use_container_width=True):
-        st.session_state.current_page = "💡 Get Recommendations"
-
-with col4:
-    if st.button("📊 Research Results", use_container_width=True):
-        st.session_state.current_page = "📊 Research Results"
-
-st.markdown("---")
-
-# Load data and models
-teen_df, social_df, recommendations, performance_df = load_data()
-teen_model, teen_scaler, social_model, social_scaler = load_models()
+layout.apply_styles()
+layout.header()
 
-if teen_df is None:
+# Load data; models are optional and loaded when an assessment is submitted
+if services.load_data() is None:
     st.error("⚠️ Could not load data. Please ensure all data files are in the 'data' folder.")
     st.stop()
 
-# Models are optional - app will work with research-based fallback if models can't be loaded
+# Notes the page adds with layout.add_diagnostic, shown in the diagnostics panel below
+st.session_state[layout.DIAGNOSTIC_NOTES] = []
 
-page = st.session_state.current_page
+# Only the selected page's module is imported and rendered, see dashboard/navigation.py
+page = navigation.run()
 
-# OVERVIEW & ANALYTICS PAGE
-if page == "🏠 Overview & Analytics":
-    st.header("📊 Research Overview & Data Analytics")
-    
-    # Key statistics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="metric-box">
-            <h3>👥 Total Users</h3>
-            <h2>7,299</h2>
-            <p>User data analyzed</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-box">
-            <h3>🧠 Live Models</h3>
-            <h2>3</h2>
-            <p>Trained clustering algorithms deployed</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="metric-box">
-            <h3>🎯 Best Score</h3>
-            <h2>0.775</h2>
-            <p>Silhouette score achieved</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-box">
-            <h3>✅ Accuracy</h3>
-            <h2>±0.000</h2>
-            <p>Cross-validation stability</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Real-time clustering info
-    st.markdown("---")
-    
-    # Check if models are loaded
-    model_status = "✅ Active" if teen_model is not None else "⚠️ Fallback Mode"
-    model_description = ("Your user input is processed through trained StandardScaler and clustering models" 
-                        if teen_model is not None else 
-                        "Using research-validated logic based on your clustering analysis")
-    
-    st.markdown(f"""
-    <div style="
-        background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-        border-left: 4px solid #00d4ff;
-        border-radius: 10px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-    ">
-        <h3 style="color: #00d4ff !important; margin-bottom: 1rem; font-size: 1.3rem;">🤖 AI Clustering System ({model_status})</h3>
-        <div style="color: #ffffff !important; font-size: 1rem; line-height: 1.6;">
-            <p><strong>This dashboard implements your research methodology:</strong></p>
-            <p>• <strong>Teen Assessment:</strong> K-Means clustering approach (Silhouette: 0.152)</p>
-            <p>• <strong>Adult Assessment:</strong> Hierarchical clustering approach (Silhouette: 0.775)</p>
-            <p>• <strong>Real-time prediction:</strong> {model_description}</p>
-            <p>• <strong>Evidence-based results:</strong> Cluster assignments match your research findings with 7,299 validated profiles</p>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Dataset comparison
-    st.subheader("📱 Dataset Analysis")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("#### Teen Dataset (Ages 13-18)")
-        st.markdown(f"**Total Users:** {len(teen_df):,}")
-        
-        # Teen cluster distribution
-        teen_cluster_counts = teen_df['cluster'].value_counts().sort_index()
-        fig_teen = px.bar(
-            x=[0, 1],
-            y=teen_cluster_counts.values,
-            title="Teen User Groups",
-            color=[0, 1],
-            color_discrete_sequence=['#2E8B57', '#FF6347']
-        )
-        fig_teen.update_layout(
-            height=400,
-            showlegend=False,
-            xaxis_title="",
-            yaxis_title="Number of Users",
-            margin=dict(l=50, r=50, t=50, b=50),
-            xaxis=dict(showticklabels=False)
-        )
-        fig_teen.update_traces(texttemplate='%{y}', textposition='inside', textfont=dict(color='white', size=16))
-        
-        # Add text annotations for labels
-        fig_teen.add_annotation(x=0, y=-200, text="Balanced Usage", showarrow=False, font=dict(size=12))
-        fig_teen.add_annotation(x=1, y=-200, text="Higher Usage", showarrow=False, font=dict(size=12))
-        st.plotly_chart(fig_teen, use_container_width=True)
-        
-        # Teen statistics
-        st.markdown(f"""
-        **Average Sleep:** {teen_df['Sleep_Hours'].mean():.1f} hours
-        **Average Social Media:** {teen_df['Time_on_Social_Media'].mean():.1f} hours  
-        **Average Bedtime Screens:** {teen_df['Screen_Time_Before_Bed'].mean():.1f} hours
-        """)
-    
-    with col2:
-        st.markdown("#### Social Media Dataset (Ages 15-35+)")
-        st.markdown(f"**Total Users:** {len(social_df):,}")
-        
-        # Social cluster distribution  
-        social_cluster_counts = social_df['cluster'].value_counts().sort_index()
-        fig_social = px.bar(
-            x=['Regular Users', 'High-Risk Users'],
-            y=social_cluster_counts.values,
-            title="Social Media User Groups",
-            color=['Regular Users', 'High-Risk Users'],
-            color_discrete_sequence=['#4169E1', '#DC143C']
-        )
-        fig_social.update_layout(
-            height=450,
-            showlegend=False,
-            xaxis_title="User Groups",
-            yaxis_title="Number of Users",
-            margin=dict(l=50, r=50, t=50, b=120),
-            xaxis=dict(tickangle=0, tickmode='array', tickvals=[0, 1], ticktext=['Regular<br>Users', 'High-Risk<br>Users'])
-        )
-        fig_social.update_traces(texttemplate='%{y}', textposition='inside', textfont=dict(color='white', size=16))
-        st.plotly_chart(fig_social, use_container_width=True)
-        
-        # Social statistics
-        st.markdown(f"""
-        **Average Sleep:** {social_df[' Sleep Duration '].mean():.1f} hours
-        **Average Social Media:** {social_df['Social Media Usage (hrs)'].mean():.1f} hours
-        **Average Screen Time:** {social_df['Screen.Time(hrs)'].mean():.1f} hours
-        """)
-    
-    # Key insights visualization
-    st.subheader("🎯 Key Research Insights")
-    
-    # Sleep vs Screen Time correlation
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Teen sleep vs social media
-        fig_teen_corr = px.scatter(
-            teen_df.sample(500),
-            x='Time_on_Social_Media',
-            y='Sleep_Hours', 
-            color='cluster',
-            title="Teen Dataset: Social Media vs Sleep",
-            labels={'Time_on_Social_Media': 'Social Media Hours', 'Sleep_Hours': 'Sleep Hours'},
-            color_discrete_map={0: '#2E8B57', 1: '#FF6347'}
-        )
-        fig_teen_corr.add_annotation(
-            x=teen_df['Time_on_Social_Media'].max() * 0.7,
-            y=teen_df['Sleep_Hours'].max() * 0.3,
-            text="More social media →<br>Less sleep",
-            showarrow=True,
-            arrowhead=2
-        )
-        st.plotly_chart(fig_teen_corr, use_container_width=True)
-    
-    with col2:
-        # Bedtime screen time impact
-        fig_bedtime = px.box(
-            teen_df,
-            x='cluster',
-            y='Screen_Time_Before_Bed',
-            title="Bedtime Screen Time by Group",
-            labels={'cluster': 'User Group', 'Screen_Time_Before_Bed': 'Hours Before Bed'}
-        )
-        fig_bedtime.update_layout(xaxis=dict(ticktext=['Balanced Group', 'Higher Usage'], tickvals=[0, 1]))
-        st.plotly_chart(fig_bedtime, use_container_width=True)
-    
-    # Late night usage patterns
-    st.subheader("🌙 User Behavior Analysis")
-    
-    # Analyze actual bedtime screen usage
-    teen_bedtime_by_cluster = teen_df.groupby('cluster')['Screen_Time_Before_Bed'].agg(['mean', 'std', 'count']).reset_index()
-    teen_bedtime_by_cluster['Group'] = teen_bedtime_by_cluster['cluster'].map({0: 'Balanced Usage', 1: 'Higher Usage'})
-    
-    # Create distribution plot of actual bedtime screen time
-    fig_bedtime_dist = px.histogram(
-        teen_df,
-        x='Screen_Time_Before_Bed',
-        color='cluster',
-        title="Hours of Screen Time Before Bed",
-        labels={'Screen_Time_Before_Bed': 'Hours Before Bed', 'count': 'Number of Users'},
-        color_discrete_map={0: '#2E8B57', 1: '#FF6347'},
-        nbins=30,
-        opacity=0.7
-    )
-    
-    # Add vertical lines for group averages
-    balanced_avg = teen_df[teen_df['cluster'] == 0]['Screen_Time_Before_Bed'].mean()
-    higher_avg = teen_df[teen_df['cluster'] == 1]['Screen_Time_Before_Bed'].mean()
-    
-    fig_bedtime_dist.add_vline(
-        x=balanced_avg, 
-        line_dash="dash", 
-        line_color="#2E8B57",
-        annotation_text=f"Balanced Avg: {balanced_avg:.1f}h"
-    )
-    fig_bedtime_dist.add_vline(
-        x=higher_avg, 
-        line_dash="dash", 
-        line_color="#FF6347",
-        annotation_text=f"Higher Usage Avg: {higher_avg:.1f}h"
-    )
-    
-    fig_hourly = fig_bedtime_dist
-    
-    # Add bedtime zone
-    fig_hourly.add_vrect(
-        x0=2, x1=3,
-        fillcolor="red", opacity=0.2,
-        line_width=0,
-        annotation_text="Critical Sleep Impact Zone"
-    )
-    
-    fig_hourly.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='white'
-    )
-    
-    st.plotly_chart(fig_hourly, use_container_width=True)
-    
-    # Add data insights below the chart
-    col1, col2, col3 = st.columns(3)
-    
-    # Calculate daily usage averages (the actual differentiator)
-    balanced_daily = teen_df[teen_df['cluster'] == 0]['Daily_Usage_Hours'].mean()
-    higher_daily = teen_df[teen_df['cluster'] == 1]['Daily_Usage_Hours'].mean()
-    
-    with col1:
-        st.markdown(f"""
-        <div class="metric-box">
-            <h3>Balanced Group</h3>
-            <h2>{balanced_daily:.1f}h</h2>
-            <p>Avg daily screen time</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="metric-box">
-            <h3>Higher Usage Group</h3>
-            <h2>{higher_daily:.1f}h</h2>
-            <p>Avg daily screen time</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        difference = higher_daily - balanced_daily
-        st.markdown(f"""
-        <div class="metric-box">
-            <h3>Difference</h3>
-            <h2>+{difference:.1f}h</h2>
-            <p>Higher usage impact</p>
-        </div>
-        """, unsafe_allow_html=True)
+layout.footer()
 
-# ASSESSMENT PAGE
-elif page == "🔍 Take Assessment":
-    st.header("🔍 Personal Digital Wellness Assessment")
-    st.markdown("Answer these questions to find out which user group you belong to and get personalized recommendations.")
-    
-    with st.form("assessment_form"):
-        st.subheader("📱 Daily Usage Patterns")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            age = st.selectbox(
-                "Your age group:",
-                ["13-15 (Early Teen)", "16-18 (Late Teen)", "19-22 (Young Adult)", "23-27 (Adult)", "27+ (Adult)"],
-                help="This helps us use the right model for your age group"
-            )
-            
-            daily_usage = st.slider(
-                "Total daily screen time (hours):",
-                1, 16, 6,
-                help="All devices: phone, computer, tablet, TV"
-            )
-            
-            social_media = st.slider(
-                "Daily social media time (hours):",
-                0, 12, 3,
-                help="Instagram, TikTok, Facebook, Twitter, Snapchat, etc."
-            )
-        
-        with col2:
-            sleep_hours = st.slider(
-                "Average sleep per night (hours):",
-                3, 12, 7,
-                help="Actual sleep time, not time in bed"
-            )
-            
-            bedtime_screen = st.slider(
-                "Screen time before bed (hours):",
-                0, 5, 1,
-                help="Device use in the 2 hours before sleep"
-            )
-            
-            late_night_usage = st.selectbox(
-                "How often do you use social media after 10 PM?",
-                ["Never", "Rarely (1-2 times/week)", "Sometimes (3-4 times/week)", "Often (5-6 times/week)", "Every night"],
-                help="Late night usage is linked to poor sleep quality"
-            )
-        
-        st.subheader("😴 Sleep & Wellbeing")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            sleep_quality = st.selectbox(
-                "How is your sleep quality?",
-                ["Very Poor", "Poor", "Average", "Good", "Excellent"],
-                index=2
-            )
-            
-            morning_tiredness = st.selectbox(
-                "How tired are you in the morning?",
-                ["Always exhausted", "Usually tired", "Sometimes tired", "Usually refreshed", "Always energetic"],
-                index=2
-            )
-        
-        with col2:
-            phone_bed = st.selectbox(
-                "Do you keep your phone in the bedroom?",
-                ["Yes, next to my bed", "Yes, but across the room", "No, I charge it outside"],
-                help="Phone location affects sleep quality"
-            )
-            
-            difficulty_sleeping = st.selectbox(
-                "After using devices at night, do you have trouble falling asleep?",
-                ["Always", "Often", "Sometimes", "Rarely", "Never"],
-                index=2
-            )
-        
-        submitted = st.form_submit_button("🔍 Analyze My Digital Wellness", use_container_width=True, type="primary")
-        
-        if submitted:
-            # Prepare user data for clustering prediction
-            age_mapping = {
-                "13-15 (Early Teen)": 14,
-                "16-18 (Late Teen)": 17,
-                "19-25 (Young Adult)": 22,
-                "26-35 (Adult)": 30,
-                "36-45 (Mature Adult)": 40,
-                "46+ (Senior Adult)": 50
-            }
-            
-            user_data = {
-                'daily_usage': daily_usage,
-                'sleep_hours': sleep_hours,
-                'bedtime_screen': bedtime_screen,
-                'social_media': social_media,
-                'age_numeric': age_mapping.get(age, 22),
-                'phone_checks': 50,  # Reasonable default
-                'anxiety_level': 5,  # Neutral default
-                'depression_level': 5,  # Neutral default
-                'exercise_time': 1.0,  # Default exercise time
-                'late_night_usage': late_night_usage,
-                'sleep_quality': sleep_quality,
-                'phone_bed': phone_bed
-            }
-            
-            # Determine dataset type based on age
-            if age in ["13-15 (Early Teen)", "16-18 (Late Teen)"]:
-                dataset_used = "Teen"
-            else:
-                dataset_used = "Social Media"
-            
-            # Use real clustering models to predict user cluster
-            cluster, confidence = predict_cluster(user_data, dataset_used, teen_model, teen_scaler, social_model, social_scaler)
-            
-            # Calculate risk factors for interpretability
-            risk_factors = []
-            risk_score = 0
-            
-            # Age-based analysis
-            if dataset_used == "Teen":
-                if daily_usage > 6:
-                    risk_score += 2
-                    risk_factors.append("High daily screen time for teens")
-                if social_media > 3:
-                    risk_score += 2
-                    risk_factors.append("Excessive social media use for teen age group")
-            else:
-                if daily_usage > 8:
-                    risk_score += 2
-                    risk_factors.append("High daily screen time for adults")
-                if social_media > 4:
-                    risk_score += 2
-                    risk_factors.append("Excessive social media use for adult age group")
-            
-            # Sleep impact factors
-            if sleep_hours < 6:
-                risk_score += 3
-                risk_factors.append("Insufficient sleep duration")
-            elif sleep_hours < 7:
-                risk_score += 1
-                risk_factors.append("Below optimal sleep duration")
-            
-            if bedtime_screen > 2:
-                risk_score += 3
-                risk_factors.append("Excessive bedtime screen exposure")
-            elif bedtime_screen > 1:
-                risk_score += 1
-                risk_factors.append("Some bedtime screen use")
-            
-            # Late night usage penalty
-            late_night_scores = {"Never": 0, "Rarely (1-2 times/week)": 1, "Sometimes (3-4 times/week)": 2, "Often (5-6 times/week)": 3, "Every night": 4}
-            late_score = late_night_scores[late_night_usage]
-            risk_score += late_score
-            if late_score > 2:
-                risk_factors.append("Frequent late-night social media use")
-            
-            # Sleep quality factors
-            sleep_qual_scores = {"Very Poor": 3, "Poor": 2, "Average": 1, "Good": 0, "Excellent": 0}
-            risk_score += sleep_qual_scores[sleep_quality]
-            if sleep_quality in ["Very Poor", "Poor"]:
-                risk_factors.append("Poor sleep quality")
-            
-            # Phone in bedroom penalty
-            if phone_bed == "Yes, next to my bed":
-                risk_score += 2
-                risk_factors.append("Phone too close to bed")
-            
-            # Determine user group and risk level based on REAL clustering results
-            algorithm_used = "K-Means model" if teen_model is not None else "K-Means research logic"
-            hierarchical_used = "Hierarchical model" if social_model is not None else "Hierarchical research logic"
-            
-            if dataset_used == "Teen":
-                if cluster == 1:  # Higher usage cluster from K-Means
-                    user_group = "Higher Usage Group"
-                    risk_level = "High Risk" if risk_score >= 8 else "Moderate Risk"
-                    risk_color = "danger" if risk_score >= 8 else "warning"
-                    cluster_info = f"{algorithm_used} (confidence: {confidence:.3f}) places you in the 49.3% of teens with elevated usage patterns"
-                else:  # Balanced usage cluster
-                    user_group = "Balanced Usage Group"
-                    risk_level = "Low Risk"
-                    risk_color = "success"
-                    cluster_info = f"{algorithm_used} (confidence: {confidence:.3f}) places you in the 50.7% of teens with balanced habits"
-            else:
-                if cluster == 1:  # High-risk cluster from Hierarchical clustering
-                    user_group = "High-Risk Users"
-                    risk_level = "Very High Risk"
-                    risk_color = "danger"
-                    cluster_info = f"{hierarchical_used} (confidence: {confidence:.3f}) places you in the 0.8% requiring immediate intervention"
-                else:  # Regular users cluster
-                    user_group = "Regular Users"
-                    risk_level = "Moderate Risk" if risk_score >= 4 else "Low Risk"
-                    risk_color = "warning" if risk_score >= 4 else "success"
-                    cluster_info = f"{hierarchical_used} (confidence: {confidence:.3f}) places you in the 99.2% with typical usage patterns"
-            
-            # Display results
-            st.markdown("---")
-            st.markdown("""
-            <div style="text-align: center; margin: 2rem 0;">
-                <h1 style="color: #00d4ff; font-size: 2rem; margin-bottom: 0.5rem;">
-                    📊 Assessment Results
-                </h1>
-                <p style="color: #a0a0a0; font-size: 1.1rem;">
-                    Your personalized digital wellness analysis
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Main results cards
-            col1, col2, col3 = st.columns([1, 1, 1], gap="medium")
-            
-            with col1:
-                # Risk level with color
-                risk_icon = "🟢" if "Low" in risk_level else "🟡" if "Moderate" in risk_level else "🔴"
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                    border-left: 4px solid {'#28a745' if 'Low' in risk_level else '#ffc107' if 'Moderate' in risk_level else '#dc3545'};
-                    border-radius: 10px;
-                    padding: 1rem;
-                    text-align: center;
-                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                    margin-bottom: 0.5rem;
-                    height: 180px;
-                    display: flex;
-                    flex-direction: column;
-                    justify-content: center;
-                ">
-                    <div style="font-size: 1.8rem; margin-bottom: 0.4rem; color: #ffffff !important;">{risk_icon}</div>
-                    <h3 style="color: #00d4ff !important; margin-bottom: 0.4rem; font-size: 0.9rem;">Risk Assessment</h3>
-                    <h2 style="color: #ffffff !important; margin-bottom: 0.2rem; font-size: 1.2rem;">{risk_level}</h2>
-                    <p style="color: #a0a0a0 !important; font-size: 0.8rem;">Score: {risk_score}/15</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                # User group with professional styling
-                group_icon = "👥" if "Regular" in user_group else "⚡" if "Higher" in user_group else "🎯"
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                    border-left: 4px solid #00d4ff;
-                    border-radius: 10px;
-                    padding: 1rem;
-                    text-align: center;
-                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                    margin-bottom: 0.5rem;
-                    height: 180px;
-                    display: flex;
-                    flex-direction: column;
-                    justify-content: center;
-                ">
-                    <div style="font-size: 1.8rem; margin-bottom: 0.4rem; color: #ffffff !important;">{group_icon}</div>
-                    <h3 style="color: #00d4ff !important; margin-bottom: 0.4rem; font-size: 0.9rem;">Your Profile</h3>
-                    <h2 style="color: #ffffff !important; margin-bottom: 0.2rem; font-size: 1.1rem; line-height: 1.1;">{user_group}</h2>
-                    <p style="color: #a0a0a0 !important; font-size: 0.75rem; line-height: 1.1;">{cluster_info}</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                # Analysis model with tech styling
-                model_icon = "🧠" if dataset_used == "Teen" else "📊"
-                algorithm = f"K-Means {'Model' if teen_model is not None else 'Logic'}" if dataset_used == "Teen" else f"Hierarchical {'Model' if social_model is not None else 'Logic'}"
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                    border-left: 4px solid #6f42c1;
-                    border-radius: 10px;
-                    padding: 1rem;
-                    text-align: center;
-                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                    margin-bottom: 0.5rem;
-                    height: 180px;
-                    display: flex;
-                    flex-direction: column;
-                    justify-content: center;
-                ">
-                    <div style="font-size: 1.8rem; margin-bottom: 0.4rem; color: #ffffff !important;">{model_icon}</div>
-                    <h3 style="color: #00d4ff !important; margin-bottom: 0.4rem; font-size: 0.9rem;">Analysis Method</h3>
-                    <h2 style="color: #ffffff !important; margin-bottom: 0.2rem; font-size: 1.1rem;">{dataset_used} Dataset</h2>
-                    <p style="color: #a0a0a0 !important; font-size: 0.75rem;">{algorithm}</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Risk factors section with compact styling
-            if risk_factors:
-                st.markdown("---")
-                st.markdown("""
-                <div style="margin: 1rem 0;">
-                    <h3 style="color: #ffc107; font-size: 1.4rem; margin-bottom: 0.5rem;">
-                        ⚠️ Areas for Improvement
-                    </h3>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Display risk factors in a more compact grid
-                if len(risk_factors) > 3:
-                    col1, col2 = st.columns(2)
-                    for i, factor in enumerate(risk_factors):
-                        col = col1 if i % 2 == 0 else col2
-                        with col:
-                            st.markdown(f"""
-                            <div style="
-                                background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                                border-left: 3px solid #ffc107;
-                                border-radius: 6px;
-                                padding: 0.75rem 1rem;
-                                margin: 0.25rem 0;
-                                color: #ffffff !important;
-                                font-size: 0.9rem;
-                            ">
-                                <strong>{i+1}.</strong> {factor}
-                            </div>
-                            """, unsafe_allow_html=True)
-                else:
-                    for i, factor in enumerate(risk_factors, 1):
-                        st.markdown(f"""
-                        <div style="
-                            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                            border-left: 3px solid #ffc107;
-                            border-radius: 6px;
-                            padding: 0.75rem 1rem;
-                            margin: 0.25rem 0;
-                            color: #ffffff !important;
-                            font-size: 0.9rem;
-                        ">
-                            <strong>{i}.</strong> {factor}
-                        </div>
-                        """, unsafe_allow_html=True)
-            
-            # Call to action
-            st.markdown("---")
-            
-            # Store results in session state for recommendations page
-            st.session_state.results = {
-                'user_group': user_group,
-                'risk_level': risk_level,
-                'risk_score': risk_score,
-                'risk_factors': risk_factors,
-                'dataset_used': dataset_used,
-                'cluster': cluster,
-                'confidence': confidence,
-                'cluster_info': cluster_info,
-                'user_data': user_data
-            }
-            
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                border: 1px solid #4a5568;
-                border-radius: 10px;
-                padding: 1.5rem;
-                text-align: center;
-                margin: 1rem 0;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            ">
-                <h3 style="color: #00d4ff !important; margin-bottom: 0.5rem; font-size: 1.3rem;">🎯 Next Steps</h3>
-                <p style="color: #ffffff !important; font-size: 1rem; margin-bottom: 0.75rem;">
-                    Get your personalized action plan to improve your digital wellness
-                </p>
-                <p style="color: #a0a0a0 !important; font-size: 0.9rem;">
-                    👉 Click "Get Recommendations" above to see your customized plan
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Store results for recommendations
-            st.session_state.assessment_results = {
-                'risk_level': risk_level,
-                'risk_score': risk_score,
-                'user_group': user_group,
-                'dataset_used': dataset_used,
-                'risk_factors': risk_factors,
-                'user_data': {
-                    'age_group': age,
-                    'daily_usage': daily_usage,
-                    'social_media': social_media,
-                    'sleep_hours': sleep_hours,
-                    'bedtime_screen': bedtime_screen,
-                    'late_night_usage': late_night_usage,
-                    'sleep_quality': sleep_quality
-                }
-            }
-            
-            st.info("💡 Go to 'Get Recommendations' to see your personalized action plan!")
+# Numbers for operators, kept in the collapsed diagnostics panel
+page_times = services.render_stats().report()[page]
+render_note = (f"Page rendered in {render_times(st.session_state)['page']:.0f} ms "
+               f"(in this server process: first render {page_times['cold_ms']:.0f} ms")
+if page_times['warm_ms'] is not None:
+    render_note += f", typical {page_times['warm_ms']:.0f} ms"
+diagnostic_notes = [render_note + ")"]
+first_content = render_times(st.session_state).get('first_content')
+if page == "research" and first_content is not None:
+    diagnostic_notes.append(f"First content in {first_content:.0f} ms")
+if page in ("overview", "research"):
+    figure_stats = services.load_figure_cache().stats()
+    diagnostic_notes.append(f"Figure cache: {figure_stats['hits']} hits, {figure_stats['misses']} misses, "
+                            f"{figure_stats['figures']} figures ({figure_stats['bytes'] / 1024:.0f} KB)")
 
-# RECOMMENDATIONS PAGE
-elif page == "💡 Get Recommendations":
-    st.header("💡 Your Personalized Digital Wellness Plan")
-    
-    if 'assessment_results' in st.session_state:
-        results = st.session_state.assessment_results
-        
-        # Find matching recommendations based on dataset and user group
-        user_group = results['user_group']
-        dataset_used = results['dataset_used']
-        matching_rec = None
-        
-        # Map user groups to recommendation structure
-        if dataset_used == "Teen":
-            if "Balanced" in user_group:
-                matching_rec = {
-                    'cluster': 'Balanced Usage Group',
-                    'recommendations': recommendations['teen_dataset']['cluster_0']['recommendations'],
-                    'sleep_tips': [
-                        "Set a consistent bedtime (even on weekends)",
-                        "Stop all screens 1 hour before sleep",
-                        "Keep bedroom cool, dark, and quiet",
-                        "Try reading or meditation before bed",
-                        "Avoid caffeine after 2 PM"
-                    ]
-                }
-            else:  # Higher Usage Group
-                matching_rec = {
-                    'cluster': 'Higher Usage Group',
-                    'recommendations': recommendations['teen_dataset']['cluster_1']['recommendations'],
-                    'sleep_tips': [
-                        "Urgently reduce screen time before bed",
-                        "Move all devices out of bedroom",
-                        "Set phone to 'Do Not Disturb' at 9 PM",
-                        "Practice relaxation techniques",
-                        "Consider sleep hygiene consultation"
-                    ]
-                }
-        else:  # Social Media Dataset
-            if "Regular" in user_group:
-                matching_rec = {
-                    'cluster': 'Regular Users',
-                    'recommendations': recommendations['social_dataset']['cluster_0']['recommendations'],
-                    'sleep_tips': [
-                        "Maintain current healthy patterns",
-                        "Use blue light filters after sunset",
-                        "Keep consistent sleep schedule",
-                        "Monitor for any pattern changes",
-                        "Share tips with friends and family"
-                    ]
-                }
-            else:  # High-Risk Users
-                matching_rec = {
-                    'cluster': 'High-Risk Users',
-                    'recommendations': recommendations['social_dataset']['cluster_1']['recommendations'],
-                    'sleep_tips': [
-                        "Immediate intervention needed",
-                        "Consider professional help",
-                        "Remove all devices from bedroom",
-                        "Set strict usage limits",
-                        "Practice digital detox"
-                    ]
-                }
-        
-        if matching_rec is None:
-            # Fallback recommendations
-            matching_rec = {
-                'cluster': 'General',
-                'recommendations': [
-                    "Limit screen time before bed",
-                    "Practice good sleep hygiene",
-                    "Set device boundaries",
-                    "Take regular digital breaks",
-                    "Stay physically active"
-                ],
-                'sleep_tips': [
-                    "Maintain consistent sleep schedule",
-                    "Create a relaxing bedtime routine",
-                    "Keep bedroom cool and dark",
-                    "Avoid caffeine late in the day",
-                    "Exercise regularly but not before bed"
-                ]
-            }
-        
-        # Assessment Summary Cards
-        st.markdown("---")
-        st.markdown("""
-        <div style="text-align: center; margin: 1.5rem 0;">
-            <h2 style="color: #00d4ff; font-size: 1.8rem; margin-bottom: 0.5rem;">
-                📊 Your Assessment Summary
-            </h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3, gap="medium")
-        
-        with col1:
-            risk_color = "#28a745" if "Low" in results['risk_level'] else "#ffc107" if "Moderate" in results['risk_level'] else "#dc3545"
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                border-left: 4px solid {risk_color};
-                border-radius: 10px;
-                padding: 1.5rem;
-                text-align: center;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                margin-bottom: 1rem;
-            ">
-                <h3 style="color: #00d4ff !important; margin-bottom: 0.5rem; font-size: 1rem;">Risk Level</h3>
-                <h2 style="color: #ffffff !important; font-size: 1.3rem;">{results['risk_level']}</h2>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                border-left: 4px solid #00d4ff;
-                border-radius: 10px;
-                padding: 1.5rem;
-                text-align: center;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                margin-bottom: 1rem;
-            ">
-                <h3 style="color: #00d4ff !important; margin-bottom: 0.5rem; font-size: 1rem;">User Group</h3>
-                <h2 style="color: #ffffff !important; font-size: 1.3rem;">{results['user_group']}</h2>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                border-left: 4px solid #6f42c1;
-                border-radius: 10px;
-                padding: 1.5rem;
-                text-align: center;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                margin-bottom: 1rem;
-            ">
-                <h3 style="color: #00d4ff !important; margin-bottom: 0.5rem; font-size: 1rem;">Risk Score</h3>
-                <h2 style="color: #ffffff !important; font-size: 1.3rem;">{results['risk_score']}/15</h2>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Main Recommendations Section
-        st.markdown("---")
-        risk_level = results['risk_level']
-        
-        if "High" in risk_level or "Very High" in risk_level:
-            # High Risk Recommendations
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #4d1919 0%, #dc3545 100%);
-                border-radius: 10px;
-                padding: 1.5rem;
-                text-align: center;
-                margin: 1rem 0;
-                box-shadow: 0 4px 12px rgba(220, 53, 69, 0.3);
-            ">
-                <h2 style="color: #ffffff !important; margin-bottom: 0.5rem;">🚨 Immediate Action Required</h2>
-                <p style="color: #ffffff !important; font-size: 1.1rem;">
-                    Your digital habits require urgent attention for your health and wellbeing
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2, gap="large")
-            
-            with col1:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                    border-left: 4px solid #dc3545;
-                    border-radius: 10px;
-                    padding: 1.5rem;
-                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                    margin-bottom: 1rem;
-                ">
-                    <h3 style="color: #dc3545 !important; margin-bottom: 1rem; font-size: 1.2rem;">🆘 Priority Actions (This Week)</h3>
-                """, unsafe_allow_html=True)
-                
-                for i, rec in enumerate(matching_rec['recommendations'][:3], 1):
-                    st.markdown(f"""
-                    <div style="
-                        background-color: rgba(220, 53, 69, 0.1);
-                        border-radius: 8px;
-                        padding: 0.75rem;
-                        margin: 0.5rem 0;
-                        border-left: 3px solid #dc3545;
-                    ">
-                        <p style="color: #ffffff !important; margin: 0; font-size: 0.95rem;">
-                            <strong>{i}.</strong> {rec}
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                st.markdown("</div>", unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                    border-left: 4px solid #ffc107;
-                    border-radius: 10px;
-                    padding: 1.5rem;
-                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                    margin-bottom: 1rem;
-                ">
-                    <h3 style="color: #ffc107 !important; margin-bottom: 1rem; font-size: 1.2rem;">⏰ Emergency Daily Schedule</h3>
-                    <div style="color: #ffffff !important; font-size: 0.9rem; line-height: 1.6;">
-                        <p><strong>7:00 AM</strong> - Morning routine (phone-free first hour)</p>
-                        <p><strong>9:00 AM</strong> - Check messages (15 min limit)</p>
-                        <p><strong>12:00 PM</strong> - Lunch break phone time (15 min)</p>
-                        <p><strong>6:00 PM</strong> - Last social media check of day</p>
-                        <p><strong>8:00 PM</strong> - All devices to charging station</p>
-                        <p><strong>9:00 PM</strong> - Relaxing activities only</p>
-                        <p><strong>10:00 PM</strong> - Bedtime routine begins</p>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        elif "Moderate" in risk_level:
-            # Moderate Risk Recommendations
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #4d3319 0%, #ffc107 100%);
-                border-radius: 10px;
-                padding: 1.5rem;
-                text-align: center;
-                margin: 1rem 0;
-                box-shadow: 0 4px 12px rgba(255, 193, 7, 0.3);
-            ">
-                <h2 style="color: #000000 !important; margin-bottom: 0.5rem;">⚠️ Gradual Improvements Needed</h2>
-                <p style="color: #000000 !important; font-size: 1.1rem;">
-                    Your habits need some adjustments to optimize your digital wellness
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2, gap="large")
-            
-            with col1:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                    border-left: 4px solid #ffc107;
-                    border-radius: 10px;
-                    padding: 1.5rem;
-                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                    margin-bottom: 1rem;
-                ">
-                    <h3 style="color: #ffc107 !important; margin-bottom: 1rem; font-size: 1.2rem;">🎯 4-Week Improvement Plan</h3>
-                    <div style="color: #ffffff !important; font-size: 0.95rem; line-height: 1.5;">
-                        <p><strong>Week 1:</strong> Reduce daily screen time by 30 minutes</p>
-                        <p><strong>Week 2:</strong> Stop social media use 1 hour before bed</p>
-                        <p><strong>Week 3:</strong> Move phone charging outside bedroom</p>
-                        <p><strong>Week 4:</strong> Add 30 minutes more sleep nightly</p>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                    border-left: 4px solid #00d4ff;
-                    border-radius: 10px;
-                    padding: 1.5rem;
-                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                    margin-bottom: 1rem;
-                ">
-                    <h3 style="color: #00d4ff !important; margin-bottom: 1rem; font-size: 1.2rem;">💡 Practical Tips</h3>
-                """, unsafe_allow_html=True)
-                
-                for rec in matching_rec['recommendations']:
-                    st.markdown(f"""
-                    <div style="
-                        background-color: rgba(0, 212, 255, 0.1);
-                        border-radius: 6px;
-                        padding: 0.5rem;
-                        margin: 0.3rem 0;
-                        border-left: 2px solid #00d4ff;
-                    ">
-                        <p style="color: #ffffff !important; margin: 0; font-size: 0.9rem;">• {rec}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                st.markdown("</div>", unsafe_allow_html=True)
-        
-        else:  # Low Risk
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #1b4d3e 0%, #28a745 100%);
-                border-radius: 10px;
-                padding: 1.5rem;
-                text-align: center;
-                margin: 1rem 0;
-                box-shadow: 0 4px 12px rgba(40, 167, 69, 0.3);
-            ">
-                <h2 style="color: #ffffff !important; margin-bottom: 0.5rem;">✅ Great Habits! Keep It Up</h2>
-                <p style="color: #ffffff !important; font-size: 1.1rem;">
-                    You have excellent digital wellness habits - maintain and enhance them
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2, gap="large")
-            
-            with col1:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                    border-left: 4px solid #28a745;
-                    border-radius: 10px;
-                    padding: 1.5rem;
-                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                    margin-bottom: 1rem;
-                ">
-                    <h3 style="color: #28a745 !important; margin-bottom: 1rem; font-size: 1.2rem;">🌟 Maintenance Strategies</h3>
-                """, unsafe_allow_html=True)
-                
-                for rec in matching_rec['recommendations']:
-                    st.markdown(f"""
-                    <div style="
-                        background-color: rgba(40, 167, 69, 0.1);
-                        border-radius: 6px;
-                        padding: 0.5rem;
-                        margin: 0.3rem 0;
-                        border-left: 2px solid #28a745;
-                    ">
-                        <p style="color: #ffffff !important; margin: 0; font-size: 0.9rem;">• {rec}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                st.markdown("</div>", unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                    border-left: 4px solid #00d4ff;
-                    border-radius: 10px;
-                    padding: 1.5rem;
-                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                    margin-bottom: 1rem;
-                ">
-                    <h3 style="color: #00d4ff !important; margin-bottom: 1rem; font-size: 1.2rem;">📊 Your Healthy Patterns</h3>
-                """, unsafe_allow_html=True)
-                
-                # Show positive habits
-                good_habits = []
-                user_data = results['user_data']
-                
-                if user_data['sleep_hours'] >= 7:
-                    good_habits.append("✅ Healthy sleep duration")
-                if user_data['bedtime_screen'] <= 1:
-                    good_habits.append("✅ Limited bedtime screen use")
-                if user_data['daily_usage'] <= 6:
-                    good_habits.append("✅ Reasonable daily screen time")
-                if "Never" in user_data['late_night_usage'] or "Rarely" in user_data['late_night_usage']:
-                    good_habits.append("✅ Good late-night habits")
-                
-                for habit in good_habits:
-                    st.markdown(f"""
-                    <div style="
-                        background-color: rgba(40, 167, 69, 0.1);
-                        border-radius: 6px;
-                        padding: 0.5rem;
-                        margin: 0.3rem 0;
-                        border-left: 2px solid #28a745;
-                    ">
-                        <p style="color: #ffffff !important; margin: 0; font-size: 0.9rem;">{habit}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                st.markdown("</div>", unsafe_allow_html=True)
-        
-        # Sleep Quality Section
-        st.markdown("---")
-        st.markdown("""
-        <div style="text-align: center; margin: 1.5rem 0;">
-            <h2 style="color: #00d4ff; font-size: 1.8rem; margin-bottom: 0.5rem;">
-                😴 Sleep Quality Improvement Plan
-            </h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2, gap="large")
-        
-        with col1:
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                border-left: 4px solid #6f42c1;
-                border-radius: 10px;
-                padding: 1.5rem;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                margin-bottom: 1rem;
-            ">
-                <h3 style="color: #6f42c1 !important; margin-bottom: 1rem; font-size: 1.2rem;">🌙 Evening Routine</h3>
-            """, unsafe_allow_html=True)
-            
-            for tip in matching_rec['sleep_tips']:
-                st.markdown(f"""
-                <div style="
-                    background-color: rgba(111, 66, 193, 0.1);
-                    border-radius: 6px;
-                    padding: 0.5rem;
-                    margin: 0.3rem 0;
-                    border-left: 2px solid #6f42c1;
-                ">
-                    <p style="color: #ffffff !important; margin: 0; font-size: 0.9rem;">• {tip}</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("</div>", unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                border-left: 4px solid #17a2b8;
-                border-radius: 10px;
-                padding: 1.5rem;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                margin-bottom: 1rem;
-            ">
-                <h3 style="color: #17a2b8 !important; margin-bottom: 1rem; font-size: 1.2rem;">📱 Technology Guidelines</h3>
-                <div style="color: #ffffff !important; font-size: 0.9rem; line-height: 1.5;">
-                    <p><strong>2 hours before bed:</strong> Stop all social media</p>
-                    <p><strong>1 hour before bed:</strong> No screens except e-readers</p>
-                    <p><strong>30 min before bed:</strong> Phone on airplane mode</p>
-                    <p><strong>Bedtime:</strong> Phone charges outside bedroom</p>
-                    <p><strong>Morning:</strong> Don't check phone for first 30 minutes</p>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Progress Tracking Section
-        st.markdown("---")
-        st.markdown("""
-        <div style="text-align: center; margin: 1.5rem 0;">
-            <h2 style="color: #00d4ff; font-size: 1.8rem; margin-bottom: 0.5rem;">
-                📈 Track Your Progress
-            </h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2, gap="large")
-        
-        with col1:
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                border-left: 4px solid #00d4ff;
-                border-radius: 10px;
-                padding: 1.5rem;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                margin-bottom: 1rem;
-            ">
-                <h3 style="color: #00d4ff !important; margin-bottom: 1rem; font-size: 1.2rem;">🎯 Weekly Check-in Questions</h3>
-                <div style="color: #ffffff !important; font-size: 0.9rem; line-height: 1.6;">
-                    <div style="margin-bottom: 0.8rem;">
-                        <strong>1.</strong> How many nights did you avoid screens 1 hour before bed? 
-                        <span style="color: #28a745;">(Goal: 5-7 nights)</span>
-                    </div>
-                    <div style="margin-bottom: 0.8rem;">
-                        <strong>2.</strong> What was your average sleep duration this week? 
-                        <span style="color: #28a745;">(Goal: 7-9 hours)</span>
-                    </div>
-                    <div style="margin-bottom: 0.8rem;">
-                        <strong>3.</strong> How many times did you use social media after 10 PM? 
-                        <span style="color: #28a745;">(Goal: 0-2 times)</span>
-                    </div>
-                    <div style="margin-bottom: 0.8rem;">
-                        <strong>4.</strong> How refreshed did you feel in the mornings? 
-                        <span style="color: #28a745;">(Goal: Refreshed 5+ days)</span>
-                    </div>
-                    <div style="margin-bottom: 0.8rem;">
-                        <strong>5.</strong> Did you keep your phone outside the bedroom? 
-                        <span style="color: #28a745;">(Goal: Every night)</span>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                border-left: 4px solid #ffc107;
-                border-radius: 10px;
-                padding: 1.5rem;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                margin-bottom: 1rem;
-            ">
-                <h3 style="color: #ffc107 !important; margin-bottom: 1rem; font-size: 1.2rem;">🏆 Success Indicators (2-4 weeks)</h3>
-            """, unsafe_allow_html=True)
-            
-            success_indicators = [
-                "Fall asleep faster (within 15-20 minutes)",
-                "Feel more refreshed in the morning",
-                "Less urge to check phone late at night",
-                "Better mood and energy during the day",
-                "Improved focus and productivity"
-            ]
-            
-            for indicator in success_indicators:
-                st.markdown(f"""
-                <div style="
-                    background-color: rgba(255, 193, 7, 0.1);
-                    border-radius: 6px;
-                    padding: 0.5rem;
-                    margin: 0.3rem 0;
-                    border-left: 2px solid #ffc107;
-                ">
-                    <p style="color: #ffffff !important; margin: 0; font-size: 0.9rem;">• {indicator}</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("</div>", unsafe_allow_html=True)
-    
-    else:
-        st.info("👆 Please complete the Assessment first to get your personalized recommendations!")
-        
-        # General tips for users who haven't taken assessment
-        st.subheader("🌟 Universal Digital Wellness Tips")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### 📱 General Guidelines")
-            st.markdown("""
-            • **Daily screen time:** Aim for under 6 hours total
-            • **Social media:** Limit to 2-3 hours maximum
-            • **Evening cutoff:** Stop scrolling 2 hours before bed
-            • **Phone location:** Charge outside the bedroom
-            • **Morning routine:** No phones for first 30 minutes
-            """)
-        
-        with col2:
-            st.markdown("#### 😴 Sleep Hygiene Basics")
-            st.markdown("""
-            • **Sleep duration:** 7-9 hours for most adults
-            • **Consistency:** Same bedtime and wake time daily
-            • **Environment:** Cool, dark, and quiet bedroom
-            • **Pre-sleep:** Reading, meditation, or gentle stretching
-            • **Avoid:** Caffeine, large meals, screens before bed
-            """)
+diagnostic_notes += st.session_state.pop(layout.DIAGNOSTIC_NOTES, [])
 
-# RESEARCH RESULTS PAGE
-elif page == "📊 Research Results":
-    st.header("📊 How This Assessment Works")
-    st.markdown("""
-    <div style="text-align: center; margin: 1rem 0;">
-        <p style="color: #a0a0a0; font-size: 1.1rem;">
-            Understanding the science behind your personalized recommendations
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Algorithm Performance Comparison
-    st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; margin: 1.5rem 0;">
-        <h2 style="color: #00d4ff; font-size: 1.8rem; margin-bottom: 0.5rem;">
-            🤖 Algorithm Performance Comparison
-        </h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Real algorithm performance from your research
-    algorithms = ['K-Means', 'DBSCAN', 'Hierarchical']
-    teen_scores = [0.152, 0.623, 0.091]  # Real scores from your data
-    social_scores = [0.203, 0.589, 0.775]  # Real scores from your data
-    
-    # Algorithm comparison chart
-    col1, col2 = st.columns(2, gap="large")
-    
-    with col1:
-        # Performance comparison bar chart
-        performance_data = pd.DataFrame({
-            'Algorithm': algorithms + algorithms,
-            'Silhouette Score': teen_scores + social_scores,
-            'Dataset': ['Teen Dataset'] * 3 + ['Social Media Dataset'] * 3
-        })
-        
-        fig_performance = px.bar(
-            performance_data,
-            x='Algorithm',
-            y='Silhouette Score',
-            color='Dataset',
-            title="Algorithm Performance by Dataset",
-            color_discrete_sequence=['#FF6347', '#4169E1'],
-            text='Silhouette Score'
-        )
-        fig_performance.update_traces(texttemplate='%{text:.3f}', textposition='outside')
-        fig_performance.update_layout(
-            height=400,
-            yaxis_range=[0, 1],
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='white'
-        )
-        fig_performance.add_hline(y=0.7, line_dash="dash", line_color="green", 
-                                annotation_text="Excellent Threshold (0.7)")
-        st.plotly_chart(fig_performance, use_container_width=True)
-    
-    with col2:
-        # Real cross-validation results from your research
-        cv_data = pd.DataFrame({
-            'Fold': ['Fold 1', 'Fold 2', 'Fold 3', 'Fold 4', 'Fold 5'],
-            'Teen K-Means': [0.152, 0.152, 0.152, 0.152, 0.152],  # Your actual teen score
-            'Social Hierarchical': [0.775, 0.775, 0.775, 0.775, 0.775]  # Your actual social score
-        })
-        
-        fig_cv = px.line(
-            cv_data.melt(id_vars=['Fold'], var_name='Model', value_name='Score'),
-            x='Fold',
-            y='Score',
-            color='Model',
-            title="Cross-Validation Stability",
-            color_discrete_sequence=['#FF6347', '#4169E1'],
-            markers=True
-        )
-        fig_cv.update_layout(
-            height=400,
-            yaxis_range=[0.7, 0.8],
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='white'
-        )
-        fig_cv.add_annotation(
-            x=2, y=0.76,
-            text="Perfect Stability<br>±0.000 variance",
-            showarrow=True,
-            arrowhead=2,
-            bgcolor="rgba(0, 212, 255, 0.8)",
-            bordercolor="white"
-        )
-        st.plotly_chart(fig_cv, use_container_width=True)
-    
-    # What this means for users
-    st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; margin: 1.5rem 0;">
-        <h2 style="color: #00d4ff; font-size: 1.8rem; margin-bottom: 0.5rem;">
-            🧠 What Makes This Assessment Accurate?
-        </h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns(3, gap="large")
-    
-    with col1:
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-            border-left: 4px solid #28a745;
-            border-radius: 10px;
-            padding: 1.5rem;
-            text-align: center;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            margin-bottom: 1rem;
-        ">
-            <div style="font-size: 2rem; margin-bottom: 0.5rem;">👥</div>
-            <h3 style="color: #28a745 !important; margin-bottom: 0.5rem; font-size: 1.2rem;">Research Data</h3>
-            <h2 style="color: #ffffff !important; margin-bottom: 0.5rem; font-size: 1.5rem;">7,299 Users</h2>
-            <p style="color: #a0a0a0 !important; font-size: 0.9rem;">
-                Your assessment is based on patterns from thousands of users, not theoretical models
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-            border-left: 4px solid #00d4ff;
-            border-radius: 10px;
-            padding: 1.5rem;
-            text-align: center;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            margin-bottom: 1rem;
-        ">
-            <div style="font-size: 2rem; margin-bottom: 0.5rem;">🎯</div>
-            <h3 style="color: #00d4ff !important; margin-bottom: 0.5rem; font-size: 1.2rem;">Accuracy Score</h3>
-            <h2 style="color: #ffffff !important; margin-bottom: 0.5rem; font-size: 1.5rem;">77.5%</h2>
-            <p style="color: #a0a0a0 !important; font-size: 0.9rem;">
-                Our best algorithm correctly groups similar users with 77.5% accuracy - excellent for behavioral patterns
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-            border-left: 4px solid #6f42c1;
-            border-radius: 10px;
-            padding: 1.5rem;
-            text-align: center;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            margin-bottom: 1rem;
-        ">
-            <div style="font-size: 2rem; margin-bottom: 0.5rem;">🔬</div>
-            <h3 style="color: #6f42c1 !important; margin-bottom: 0.5rem; font-size: 1.2rem;">AI Technology</h3>
-            <h2 style="color: #ffffff !important; margin-bottom: 0.5rem; font-size: 1.5rem;">3 Algorithms</h2>
-            <p style="color: #a0a0a0 !important; font-size: 0.9rem;">
-                We tested multiple machine learning methods to find the most accurate way to understand your habits
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # How it works section
-    st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; margin: 1.5rem 0;">
-        <h2 style="color: #00d4ff; font-size: 1.8rem; margin-bottom: 0.5rem;">
-            🔍 How We Analyze Your Digital Habits
-        </h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Dataset Distribution Visualization
-    col1, col2 = st.columns(2, gap="large")
-    
-    with col1:
-        # Dataset size comparison
-        dataset_sizes = pd.DataFrame({
-            'Dataset': ['Teen Dataset\n(Ages 13-18)', 'Social Media Dataset\n(Ages 15-35+)'],
-            'Users': [3000, 4299],
-            'Color': ['#FF6347', '#4169E1']
-        })
-        
-        fig_sizes = px.pie(
-            dataset_sizes,
-            values='Users',
-            names='Dataset',
-            title="Research Dataset Composition",
-            color_discrete_sequence=['#FF6347', '#4169E1']
-        )
-        fig_sizes.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            textfont_size=12
-        )
-        fig_sizes.update_layout(
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='white'
-        )
-        st.plotly_chart(fig_sizes, use_container_width=True)
-    
-    with col2:
-        # Clustering visualization using actual project data
-        teen_sample = teen_df.sample(300, random_state=42)
-        social_sample = social_df.sample(300, random_state=42)
-        
-        # Create clustering visualization
-        cluster_data = pd.DataFrame({
-            'Social Media Hours': list(teen_sample['Time_on_Social_Media']) + list(social_sample['Social Media Usage (hrs)']),
-            'Sleep Hours': list(teen_sample['Sleep_Hours']) + list(social_sample[' Sleep Duration ']),
-            'Group': (['Teen Balanced'] * len(teen_sample[teen_sample['cluster'] == 0]) +
-                     ['Teen Higher Usage'] * len(teen_sample[teen_sample['cluster'] == 1]) +
-                     ['Social Regular'] * len(social_sample[social_sample['cluster'] == 0]) +
-                     ['Social High-Risk'] * len(social_sample[social_sample['cluster'] == 1])),
-            'Dataset': (['Teen'] * len(teen_sample) + ['Social Media'] * len(social_sample))
-        })
-        
-        fig_clusters = px.scatter(
-            cluster_data,
-            x='Social Media Hours',
-            y='Sleep Hours',
-            color='Group',
-            title="User Groups from Research Data",
-            color_discrete_sequence=['#2E8B57', '#FF6347', '#4169E1', '#DC143C'],
-            opacity=0.7
-        )
-        fig_clusters.update_layout(
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='white',
-            xaxis_title="Daily Social Media Hours",
-            yaxis_title="Sleep Hours"
-        )
-        fig_clusters.add_annotation(
-            x=7, y=6.5,
-            text="Your assessment uses<br>this data pattern",
-            showarrow=True,
-            arrowhead=2,
-            bgcolor="rgba(0, 212, 255, 0.8)",
-            bordercolor="white"
-        )
-        st.plotly_chart(fig_clusters, use_container_width=True)
-    
-    col1, col2 = st.columns(2, gap="large")
-    
-    with col1:
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-            border-left: 4px solid #ffc107;
-            border-radius: 10px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            margin-bottom: 1rem;
-        ">
-            <h3 style="color: #ffc107 !important; margin-bottom: 1rem; font-size: 1.2rem;">📊 Pattern Recognition</h3>
-            <div style="color: #ffffff !important; font-size: 0.95rem; line-height: 1.6;">
-                <p><strong>What we analyze:</strong></p>
-                <p>• Your daily screen time patterns</p>
-                <p>• Sleep duration and quality</p>
-                <p>• Bedtime device usage</p>
-                <p>• Social media habits</p>
-                <p>• Age-appropriate behaviors</p>
-                <br>
-                <p><strong>How it works:</strong></p>
-                <p>Our AI finds users with similar digital habits and groups them together to identify common patterns and effective solutions.</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-            border-left: 4px solid #17a2b8;
-            border-radius: 10px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            margin-bottom: 1rem;
-        ">
-            <h3 style="color: #17a2b8 !important; margin-bottom: 1rem; font-size: 1.2rem;">🎯 Personalized Matching</h3>
-            <div style="color: #ffffff !important; font-size: 0.95rem; line-height: 1.6;">
-                <p><strong>Your unique profile:</strong></p>
-                <p>• Based on your specific age group</p>
-                <p>• Matched to similar lifestyle patterns</p>
-                <p>• Considers your current habits</p>
-                <p>• Identifies your risk level</p>
-                <p>• Suggests proven strategies</p>
-                <br>
-                <p><strong>Why this matters:</strong></p>
-                <p>Recommendations that worked for people like you are more likely to work for you too.</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # What the data revealed
-    st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; margin: 1.5rem 0;">
-        <h2 style="color: #00d4ff; font-size: 1.8rem; margin-bottom: 0.5rem;">
-            💡 Key Discoveries From Our Research
-        </h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Risk Distribution Analysis
-    col1, col2 = st.columns(2, gap="large")
-    
-    with col1:
-        # Real risk level distribution
-       
-        total_users = len(teen_df) + len(social_df)
-        
-        # From research: teens have 49.3% higher usage, social media has 0.8% high-risk
-        teen_higher_risk = len(teen_df[teen_df['cluster'] == 1])  # 1478 users
-        social_high_risk = len(social_df[social_df['cluster'] == 1])  # 36 users
-        
-        high_risk_total = teen_higher_risk + social_high_risk
-        moderate_risk_total = len(teen_df[teen_df['cluster'] == 0])  # Teen balanced users
-        low_risk_total = len(social_df[social_df['cluster'] == 0])  # Social regular users
-        
-        risk_data = pd.DataFrame({
-            'Risk Level': ['Low Risk (Social Regular)', 'Moderate Risk (Teen Balanced)', 'High Risk (Higher Usage)'],
-            'Count': [low_risk_total, moderate_risk_total, high_risk_total],
-            'Percentage': [
-                (low_risk_total / total_users) * 100,
-                (moderate_risk_total / total_users) * 100,
-                (high_risk_total / total_users) * 100
-            ]
-        })
-        
-        fig_risk = px.pie(
-            risk_data,
-            values='Percentage',
-            names='Risk Level',
-            title="Digital Wellness Risk Distribution from Research",
-            color_discrete_sequence=['#28a745', '#ffc107', '#dc3545']
-        )
-        fig_risk.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            textfont_size=11
-        )
-        fig_risk.update_layout(
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='white'
-        )
-        st.plotly_chart(fig_risk, use_container_width=True)
-    
-    with col2:
-        # Sleep vs Screen Time Correlation from your project data
-        
-        combined_screen = list(teen_df['Daily_Usage_Hours']) + list(social_df['Screen.Time(hrs)'])
-        combined_sleep = list(teen_df['Sleep_Hours']) + list(social_df[' Sleep Duration '])
-        combined_dataset = ['Teen'] * len(teen_df) + ['Social Media'] * len(social_df)
-        
-        # Sample for better visualization performance
-        sample_size = 1000
-        indices = np.random.choice(len(combined_screen), sample_size, replace=False)
-        
-        correlation_data = pd.DataFrame({
-            'Daily Screen Time (hours)': [combined_screen[i] for i in indices],
-            'Sleep Hours': [combined_sleep[i] for i in indices],
-            'Dataset': [combined_dataset[i] for i in indices]
-        })
-        
-        # Add risk levels based on your research findings
-        correlation_data['Risk Level'] = correlation_data.apply(
-            lambda row: 'Low' if row['Sleep Hours'] >= 7 and row['Daily Screen Time (hours)'] <= 6 
-            else 'High' if row['Sleep Hours'] < 5 or row['Daily Screen Time (hours)'] > 10 
-            else 'Moderate', axis=1
-        )
-        
-        fig_corr = px.scatter(
-            correlation_data,
-            x='Daily Screen Time (hours)',
-            y='Sleep Hours',
-            color='Risk Level',
-            title="Screen Time vs Sleep Data from Research",
-            color_discrete_map={'Low': '#28a745', 'Moderate': '#ffc107', 'High': '#dc3545'},
-            opacity=0.6
-        )
-        
-        # Calculate real correlation
-        screen_data = correlation_data['Daily Screen Time (hours)']
-        sleep_data = correlation_data['Sleep Hours']
-        correlation_coef = np.corrcoef(screen_data, sleep_data)[0, 1]
-        
-        # Add trend line
-        z = np.polyfit(screen_data, sleep_data, 1)
-        p = np.poly1d(z)
-        x_trend = np.linspace(screen_data.min(), screen_data.max(), 100)
-        fig_corr.add_scatter(
-            x=x_trend,
-            y=p(x_trend),
-            mode='lines',
-            name=f'Trend (r={correlation_coef:.3f})',
-            line=dict(color='white', width=2, dash='dash')
-        )
-        
-        fig_corr.update_layout(
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='white'
-        )
-        fig_corr.add_annotation(
-            x=correlation_data['Daily Screen Time (hours)'].max() * 0.8,
-            y=correlation_data['Sleep Hours'].max() * 0.8,
-            text=f"Real Data Correlation: {correlation_coef:.3f}",
-            showarrow=True,
-            arrowhead=2,
-            bgcolor="rgba(220, 53, 69, 0.8)",
-            bordercolor="white"
-        )
-        st.plotly_chart(fig_corr, use_container_width=True)
-    
-    col1, col2 = st.columns(2, gap="large")
-    
-    with col1:
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-            border-left: 4px solid #dc3545;
-            border-radius: 10px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            margin-bottom: 1rem;
-        ">
-            <h3 style="color: #dc3545 !important; margin-bottom: 1rem; font-size: 1.2rem;">🚨 High-Risk Patterns</h3>
-            <div style="color: #ffffff !important; font-size: 0.95rem; line-height: 1.6;">
-                <p><strong>Only 0.8% of users</strong> fall into the high-risk category, but they show:</p>
-                <br>
-                <p>• <strong>9+ hours</strong> daily screen time</p>
-                <p>• <strong>Less than 6 hours</strong> of sleep</p>
-                <p>• <strong>3+ hours</strong> of bedtime screen use</p>
-                <p>• <strong>Daily</strong> late-night social media</p>
-                <br>
-                <p style="color: #ffc107 !important;"><strong>Good news:</strong> With the right plan, these habits can be changed quickly!</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-            border-left: 4px solid #28a745;
-            border-radius: 10px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            margin-bottom: 1rem;
-        ">
-            <h3 style="color: #28a745 !important; margin-bottom: 1rem; font-size: 1.2rem;">✅ Healthy Habits</h3>
-            <div style="color: #ffffff !important; font-size: 0.95rem; line-height: 1.6;">
-                <p><strong>Most users (99.2%)</strong> have manageable digital habits with:</p>
-                <br>
-                <p>• <strong>6-8 hours</strong> daily screen time</p>
-                <p>• <strong>7+ hours</strong> of sleep</p>
-                <p>• <strong>Limited</strong> bedtime device use</p>
-                <p>• <strong>Occasional</strong> late-night usage</p>
-                <br>
-                <p style="color: #00d4ff !important;"><strong>Opportunity:</strong> Small tweaks can lead to significant wellness improvements!</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Age group differences
-    st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; margin: 1.5rem 0;">
-        <h2 style="color: #00d4ff; font-size: 1.8rem; margin-bottom: 0.5rem;">
-            👶➡️👨 Age Group Analysis
-        </h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Age group comparison charts
-    col1, col2 = st.columns(2, gap="large")
-    
-    with col1:
-        # Real age group usage patterns
-        age_patterns = pd.DataFrame({
-            'Dataset': ['Teen Dataset\n(Ages 13-19)', 'Social Media Dataset\n(Ages 14-28+)'],
-            'Avg Screen Time': [5.0, 10.8],
-            'Avg Sleep Hours': [6.5, 4.6],
-            'Dataset Size': [3000, 4299]
-        })
-        
-        fig_age = px.bar(
-            age_patterns,
-            x='Dataset',
-            y=['Avg Screen Time', 'Avg Sleep Hours'],
-            title="Digital Habits: Teen vs Young Adult Users",
-            barmode='group',
-            color_discrete_sequence=['#FF6347', '#4169E1']
-        )
-        fig_age.update_layout(
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='white',
-            yaxis_title="Hours per Day"
-        )
-        fig_age.add_annotation(
-            x=1, y=10,
-            text="2x more screen time<br>50% less sleep!",
-            showarrow=True,
-            arrowhead=2,
-            bgcolor="rgba(220, 20, 60, 0.8)",
-            bordercolor="white"
-        )
-        st.plotly_chart(fig_age, use_container_width=True)
-    
-    with col2:
-        # Real cluster distribution
-        cluster_data = pd.DataFrame({
-            'Dataset': ['Teen Dataset', 'Social Media Dataset'],
-            'Balanced/Regular Users': [50.7, 99.2],
-            'Higher Usage/High-Risk Users': [49.3, 0.8]
-        })
-        
-        fig_clusters = px.bar(
-            cluster_data.melt(id_vars=['Dataset'], var_name='User Type', value_name='Percentage'),
-            x='Dataset',
-            y='Percentage',
-            color='User Type',
-            title="Clustering Results from Research",
-            color_discrete_sequence=['#28a745', '#dc3545']
-        )
-        fig_clusters.update_layout(
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='white',
-            yaxis_title="Percentage of Users"
-        )
-        fig_clusters.add_annotation(
-            x=1, y=50,
-            text="Only 0.8% high-risk<br>vs 49.3% teens!",
-            showarrow=True,
-            arrowhead=2,
-            bgcolor="rgba(220, 20, 60, 0.8)",
-            bordercolor="white"
-        )
-        st.plotly_chart(fig_clusters, use_container_width=True)
-    
-    col1, col2 = st.columns(2, gap="large")
-    
-    with col1:
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-            border-left: 4px solid #ff6347;
-            border-radius: 10px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            margin-bottom: 1rem;
-        ">
-            <h3 style="color: #ff6347 !important; margin-bottom: 1rem; font-size: 1.2rem;">👦 Teens (13-18)</h3>
-            <div style="color: #ffffff !important; font-size: 0.95rem; line-height: 1.6;">
-                <p><strong>What we found:</strong></p>
-                <p>• More similar usage patterns</p>
-                <p>• Higher social media engagement</p>
-                <p>• More bedtime screen time</p>
-                <p>• 50/50 split between balanced and higher usage</p>
-                <br>
-                <p><strong>Why:</strong> Teenage brains are still developing, making digital habits more similar within this age group.</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-        with col2:
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-                border-left: 4px solid #4169e1;
-                border-radius: 10px;
-                padding: 1.5rem;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-                margin-bottom: 1rem;
-            ">
-                <h3 style="color: #4169e1 !important; margin-bottom: 1rem; font-size: 1.2rem;">👨 Adults (19-35+)</h3>
-                <div style="color: #ffffff !important; font-size: 0.95rem; line-height: 1.6;">
-                    <p><strong>What we found:</strong></p>
-                    <p>• More diverse usage patterns</p>
-                    <p>• Better sleep habits overall</p>
-                    <p>• More controlled screen time</p>
-                    <p>• Clearer distinction between user types</p>
-                    <p>• Professional responsibilities influence habits</p>
-                    <br>
-                    <p><strong>Why:</strong> Adult brains have better self-regulation, and work/family responsibilities create more structured digital habits.</p>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)    # Trust and reliability
-    st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; margin: 1.5rem 0;">
-        <h2 style="color: #00d4ff; font-size: 1.8rem; margin-bottom: 0.5rem;">
-            🛡️ Why You Can Trust These Results
-        </h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Model validation metrics
-    col1, col2 = st.columns(2, gap="large")
-    
-    with col1:
-        # Silhouette score explanation
-        score_ranges = pd.DataFrame({
-            'Score Range': ['0.7 - 1.0', '0.5 - 0.7', '0.25 - 0.5', '0.0 - 0.25'],
-            'Interpretation': ['Excellent', 'Good', 'Weak', 'Poor'],
-            'Count': [2, 1, 0, 0]  # Our models fall in excellent and good ranges
-        })
-        
-        fig_scores = px.bar(
-            score_ranges,
-            x='Score Range',
-            y='Count',
-            color='Interpretation',
-            title="Silhouette Score Quality Assessment",
-            color_discrete_map={'Excellent': '#28a745', 'Good': '#00d4ff', 'Weak': '#ffc107', 'Poor': '#dc3545'}
-        )
-        fig_scores.update_layout(
-            height=350,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='white',
-            yaxis_title="Number of Our Models"
-        )
-        fig_scores.add_annotation(
-            x=0, y=2.2,
-            text="Our best model (0.775)<br>falls in Excellent range",
-            showarrow=True,
-            arrowhead=2,
-            bgcolor="rgba(40, 167, 69, 0.8)",
-            bordercolor="white"
-        )
-        st.plotly_chart(fig_scores, use_container_width=True)
-    
-    with col2:
-        # Model comparison radar chart
-        categories = ['Accuracy', 'Stability', 'Speed', 'Interpretability', 'Scalability']
-        
-        models_data = pd.DataFrame({
-            'Metric': categories * 3,
-            'Score': [0.775, 0.95, 0.85, 0.90, 0.80,  # Hierarchical
-                     0.745, 0.95, 0.90, 0.85, 0.85,  # K-Means  
-                     0.623, 0.70, 0.60, 0.75, 0.70], # DBSCAN
-            'Model': ['Hierarchical'] * 5 + ['K-Means'] * 5 + ['DBSCAN'] * 5
-        })
-        
-        fig_radar = px.line_polar(
-            models_data,
-            r='Score',
-            theta='Metric',
-            color='Model',
-            line_close=True,
-            title="Model Performance Comparison",
-            color_discrete_sequence=['#4169E1', '#FF6347', '#28a745']
-        )
-        fig_radar.update_layout(
-            height=350,
-            polar=dict(
-                bgcolor='rgba(0,0,0,0)',
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 1],
-                    gridcolor='gray'
-                )
-            ),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='white'
-        )
-        st.plotly_chart(fig_radar, use_container_width=True)
-    
-    # Academic validation metrics
-    col1, col2, col3 = st.columns(3, gap="medium")
-    
-    with col1:
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-            border-left: 4px solid #28a745;
-            border-radius: 10px;
-            padding: 1rem;
-            text-align: center;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            margin-bottom: 1rem;
-        ">
-            <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">📈</div>
-            <h3 style="color: #28a745 !important; margin-bottom: 0.5rem; font-size: 1rem;">Tested Accuracy</h3>
-            <h2 style="color: #ffffff !important; margin-bottom: 0.3rem; font-size: 1.2rem;">77.5%</h2>
-            <p style="color: #a0a0a0 !important; font-size: 0.8rem;">
-                Excellent score for behavioral clustering
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-            border-left: 4px solid #ffc107;
-            border-radius: 10px;
-            padding: 1rem;
-            text-align: center;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            margin-bottom: 1rem;
-        ">
-            <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">🔄</div>
-            <h3 style="color: #ffc107 !important; margin-bottom: 0.5rem; font-size: 1rem;">Consistent Results</h3>
-            <h2 style="color: #ffffff !important; margin-bottom: 0.3rem; font-size: 1.2rem;">±0.000</h2>
-            <p style="color: #a0a0a0 !important; font-size: 0.8rem;">
-                Same results every time it runs
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-            border-left: 4px solid #17a2b8;
-            border-radius: 10px;
-            padding: 1rem;
-            text-align: center;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            margin-bottom: 1rem;
-        ">
-            <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">🎓</div>
-            <h3 style="color: #17a2b8 !important; margin-bottom: 0.5rem; font-size: 1rem;">Academic Standard</h3>
-            <h2 style="color: #ffffff !important; margin-bottom: 0.3rem; font-size: 1.2rem;">Research Grade</h2>
-            <p style="color: #a0a0a0 !important; font-size: 0.8rem;">
-                University-level methodology
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Call to action
-    st.markdown("---")
-    st.markdown("""
-    <div style="
-        background: linear-gradient(135deg, #1e2329 0%, #2d3748 100%);
-        border: 1px solid #4a5568;
-        border-radius: 10px;
-        padding: 2rem;
-        text-align: center;
-        margin: 2rem 0;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-    ">
-        <h3 style="color: #00d4ff !important; margin-bottom: 1rem; font-size: 1.4rem;">🎯 Ready to Improve Your Digital Wellness?</h3>
-        <p style="color: #ffffff !important; font-size: 1.1rem; margin-bottom: 1rem;">
-            Based on analysis of 7,299 real users, our AI can help you develop healthier digital habits
-        </p>
-        <p style="color: #a0a0a0 !important; font-size: 1rem;">
-            Take the assessment to get your personalized recommendations ↗️
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Data transparency note
-    st.markdown("---")
-    st.markdown("""
-    <div style="
-        background: linear-gradient(135deg, #2d1b4d 0%, #6f42c1 100%);
-        border-radius: 10px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: 0 4px 12px rgba(111, 66, 193, 0.3);
-    ">
-        <h3 style="color: #ffffff !important; margin-bottom: 1rem; font-size: 1.2rem;">📊 Data Transparency & Limitations</h3>
-        <div style="color: #ffffff !important; font-size: 0.95rem; line-height: 1.6;">
-            <p><strong>Original Dataset Limitations:</strong></p>
-            <p>• Teen dataset: Comprehensive coverage (ages 13-18)</p>
-            <p>• Social media dataset: Originally focused on younger demographics (14-28)</p>
-            <p>• Assessment expanded: Now includes professional and mature adults (35+)</p>
-            <br>
-            <p><strong>How we address this:</strong></p>
-            <p>• Algorithms trained on available data provide baseline patterns</p>
-            <p>• Extended age groups use extrapolated behavioral models</p>
-            <p>• Recommendations adapt based on life stage and responsibilities</p>
-            <p>• Future versions will incorporate broader age-specific datasets</p>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+store = services.load_data()
+layout.diagnostics(store.report, store.load_seconds, diagnostic_notes)
 
-# Footer
-st.markdown("---")
-st.markdown("""
-<div style="text-align: center; padding: 1.5rem; background-color: #1e2329; border-radius: 0.8rem; margin-top: 2rem; border: 1px solid #4a5568;">
-    <h4 style="color: #00d4ff !important;">Digital Wellness Dashboard</h4>
-    <p style="color: #ffffff !important;"><strong>AI-Powered Recommendations for Healthier Digital Habits</strong></p>
-    <p style="color: #a0a0a0 !important;">📊 <strong>7,299</strong> users analyzed | 🎯 <strong>77.5%</strong> accuracy | 🏆 <strong>Research-grade</strong> methodology</p>
-    <p style="color: #a0a0a0 !important;"><em>Evidence-based interventions for better sleep and digital wellness 📱💤</em></p>
-</div>
-""", unsafe_allow_html=True)
+record(st.session_state, "script", time.perf_counter() - script_start)
@@ -0,0 +1,4 @@
+"""
+Digital Wellness Dashboard app
+Page layout, shared services and the pages of the Streamlit app (started with `streamlit run app.py`)
+"""
@@ -0,0 +1,87 @@
+"""
+Cold and warm render time of each dashboard page on its own
+
+Each page is rendered through Streamlit's AppTest in a fresh interpreter,
+without the header, navigation or other pages. The first render is cold
+(page import, data and cache loading); the following ones are warm.
+
+The HTML column is what a warm rerun sends over the websocket in markdown
+elements, the page's styles included. --inline-css measures it with the
+stylesheet inlined, as it is when static serving is off. Pages that draw
+their charts progressively also report the cold render's time to first
+content, when all of their text is out (see dashboard/progressive.py).
+
+Usage:
+    python -m dashboard.benchmark [--page research] [--runs 10] [--inline-css]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from dashboard.navigation import PAGES
+
+PAGE_SCRIPT = """
+import importlib
+import streamlit as st
+from dashboard import layout
+from wellness.timing import timed
+layout.apply_styles()
+with timed(st.session_state, "page"):
+    importlib.import_module("dashboard.pages.{page}").render()
+"""
+
+
+def _measure(page, runs, inline_css=False):
+    """Render times in ms of one page (cold first), the cold time to first content and the HTML bytes"""
+    code = (
+        "import json\n"
+        "from streamlit import config\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        f"config.set_option('server.enableStaticServing', {not inline_css})\n"
+        f"at = AppTest.from_string({PAGE_SCRIPT.format(page=page)!r}, default_timeout=120)\n"
+        "times, first = [], []\n"
+        f"for _ in range({runs + 1}):\n"
+        "    at.run()\n"
+        "    if at.exception:\n"
+        "        raise SystemExit(at.exception[0].value)\n"
+        "    times.append(at.session_state['render_times']['page'] * 1000)\n"
+        "    first.append(at.session_state['render_times'].get('first_content', float('nan')) * 1000)\n"
+        "html = sum(element.proto.ByteSize() for element in at.markdown)\n"
+        "print(json.dumps([times, first[0], html]))\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=root)
+    if result.returncode != 0:
+        raise RuntimeError(f"Rendering {page} failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark(pages=None, runs=10, inline_css=False):
+    """{page: (cold ms, median warm ms, HTML bytes per rerun, cold ms to first content or NaN)}"""
+    report = {}
+    for page in pages or PAGES:
+        times, first, html = _measure(page, runs, inline_css)
+        warm = sorted(times[1:])
+        report[page] = (times[0], warm[len(warm) // 2], html, first)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold and warm render time per dashboard page")
+    parser.add_argument("--page", choices=list(PAGES), action="append", help="page to measure (default: all)")
+    parser.add_argument("--runs", type=int, default=10, help="warm renders per page")
+    parser.add_argument("--inline-css", action="store_true", help="inline the stylesheet instead of linking it")
+    args = parser.parse_args(argv)
+
+    print(f"{'page':<18}{'cold':>10}{'warm':>10}{'html':>10}{'first':>10}")
+    for page, (cold, warm, html, first) in benchmark(args.page, args.runs, args.inline_css).items():
+        first = f"{first:>7.1f} ms" if first == first else f"{'-':>10}"
+        print(f"{page:<18}{cold:>7.1f} ms{warm:>7.1f} ms{html / 1024:>7.1f} KB{first}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Page chrome shared by every dashboard page: styles, header, footer and the
+diagnostics panel
+
+The styles live in static/dashboard.css. When Streamlit serves it as a
+static file, the browser downloads it once and every rerun only sends a
+<link> to it; otherwise it's inlined on every rerun as before.
+"""
+
+import hashlib
+import os
+
+import streamlit as st
+
+# Served from /app/static/dashboard.css when static serving is on (.streamlit/config.toml)
+# Session state key for the notes a page adds to this run's diagnostics panel
+DIAGNOSTIC_NOTES = "diagnostic_notes"
+
+CSS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static", "dashboard.css")
+
+with open(CSS_PATH, encoding="utf-8") as f:
+    CSS = f.read()
+
+# Part of the stylesheet's URL, so browsers cache it until the file changes
+CSS_VERSION = hashlib.sha1(CSS.encode("utf-8")).hexdigest()[:12]
+STYLESHEET = f'<link rel="stylesheet" href="app/static/dashboard.css?v={CSS_VERSION}">'
+
+try:
+    # Releases before the Starlette server send unknown static files as text/plain,
+    # which browsers won't apply as a stylesheet
+    from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+    CSS_SERVED_AS_CSS = ".css" in SAFE_APP_STATIC_FILE_EXTENSIONS
+except ImportError:
+    CSS_SERVED_AS_CSS = True
+
+
+def css_served():
+    """Whether the browser can load static/dashboard.css on its own"""
+    return CSS_SERVED_AS_CSS and bool(st.get_option("server.enableStaticServing"))
+
+
+def apply_styles():
+    """Link the stylesheet, or inline it if it isn't served as a static file"""
+    if css_served():
+        st.markdown(STYLESHEET, unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>{CSS}</style>", unsafe_allow_html=True)
+
+
+def header():
+    st.markdown('<h1 class="main-header">📱 Digital Wellness Dashboard</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="subtitle">Clustering-Based Recommendations to Reduce Late Night Social Media Usage and Improve Sleep Quality</p>', unsafe_allow_html=True)
+    st.markdown('<p class="tagline">Based on machine learning analysis of 7,299 users</p>', unsafe_allow_html=True)
+    st.markdown("---")
+
+
+def footer():
+    st.markdown("---")
+    st.markdown("""
+<div class="page-footer">
+    <h4>Digital Wellness Dashboard</h4>
+    <p><strong>AI-Powered Recommendations for Healthier Digital Habits</strong></p>
+    <p class="note">📊 <strong>7,299</strong> users analyzed | 🎯 <strong>77.5%</strong> accuracy | 🏆 <strong>Research-grade</strong> methodology</p>
+    <p class="note"><em>Evidence-based interventions for better sleep and digital wellness 📱💤</em></p>
+</div>
+""", unsafe_allow_html=True)
+
+
+def add_diagnostic(note):
+    """Note for this run's diagnostics panel: numbers for operators, not for the people taking the assessment"""
+    st.session_state.setdefault(DIAGNOSTIC_NOTES, []).append(note)
+
+
+def diagnostics(report, load_seconds, notes=()):
+    """Collapsed panel for operators: each startup asset's load time and size, then the notes"""
+    from wellness.datastore import UNUSED_FILES
+    with st.expander("🔧 Diagnostics"):
+        rows = "\n".join(
+            f"| {entry['asset']} | `{entry['file']}` | {entry['used_by']} | {entry['ms']:.1f} ms "
+            f"| {entry['file_bytes'] / 1024:.1f} KB | {entry['loaded_bytes'] / 1024:.1f} KB |"
+            for entry in report
+        )
+        st.markdown("| Asset | File | Used by | Load time | On disk | Loaded |\n|---|---|---|---|---|---|\n" + rows)
+        st.caption(f"{len(report)} assets loaded concurrently in {load_seconds * 1000:.1f} ms "
+                   f"(slowest {max(entry['ms'] for entry in report):.1f} ms). "
+                   f"Not loaded, no page reads them: {', '.join(UNUSED_FILES)}")
+        for note in notes:
+            st.caption(note)
@@ -0,0 +1,50 @@
+"""
+Dashboard pages and lazy page loading
+
+Each page lives in dashboard/pages/<name>.py and exposes render(). A page
+module is only imported the first time the page is visited, so starting the
+app doesn't compile pages nobody opens. Every render is timed for the
+session (st.session_state.render_times['page']) and for the process
+(cold and warm times in services.render_stats()).
+"""
+
+import importlib
+
+import streamlit as st
+
+from dashboard import services
+from wellness.timing import timed
+
+# Page module name -> (title, icon), in navigation order
+PAGES = {
+    "overview": ("Overview & Analytics", "🏠"),
+    "assessment": ("Take Assessment", "🔍"),
+    "recommendations": ("Get Recommendations", "💡"),
+    "research": ("Research Results", "📊")
+}
+DEFAULT_PAGE = "overview"
+
+
+def render_page(name):
+    """Import a page module (first visit only) and render it"""
+    with timed(st.session_state, "page"), services.render_stats().timed(name):
+        importlib.import_module(f"dashboard.pages.{name}").render()
+
+
+def page(name):
+    """st.Page for one of PAGES"""
+    title, icon = PAGES[name]
+
+    def render():
+        render_page(name)
+
+    render.__name__ = name
+    return st.Page(render, title=title, icon=icon, url_path=name, default=name == DEFAULT_PAGE)
+
+
+def run():
+    """Show the top navigation bar and render the selected page, returns the page's name"""
+    pages = {name: page(name) for name in PAGES}
+    current = st.navigation(list(pages.values()), position="top")
+    current.run()
+    return next(name for name, (title, _) in PAGES.items() if title == current.title)
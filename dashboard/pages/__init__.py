@@ -0,0 +1,5 @@
+"""
+Dashboard pages, one module per page with a render() function
+
+Page modules are imported the first time their page is visited, see dashboard/navigation.py.
+"""
@@ -0,0 +1,254 @@
+"""
+Take Assessment page: questionnaire, cluster prediction and risk assessment
+"""
+
+import time
+
+import streamlit as st
+
+from dashboard import layout, services, templates
+from wellness.scoring import AGE_GROUPS, AGE_MAPPING, DEFAULT_AGE
+
+
+def render():
+    st.header("🔍 Personal Digital Wellness Assessment")
+    st.markdown("Answer these questions to find out which user group you belong to and get personalized recommendations.")
+    
+    with st.form("assessment_form"):
+        st.subheader("📱 Daily Usage Patterns")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            age = st.selectbox(
+                "Your age group:",
+                AGE_GROUPS,
+                help="This helps us use the right model for your age group"
+            )
+            
+            daily_usage = st.slider(
+                "Total daily screen time (hours):",
+                1, 16, 6,
+                help="All devices: phone, computer, tablet, TV"
+            )
+            
+            social_media = st.slider(
+                "Daily social media time (hours):",
+                0, 12, 3,
+                help="Instagram, TikTok, Facebook, Twitter, Snapchat, etc."
+            )
+        
+        with col2:
+            sleep_hours = st.slider(
+                "Average sleep per night (hours):",
+                3, 12, 7,
+                help="Actual sleep time, not time in bed"
+            )
+            
+            bedtime_screen = st.slider(
+                "Screen time before bed (hours):",
+                0, 5, 1,
+                help="Device use in the 2 hours before sleep"
+            )
+            
+            late_night_usage = st.selectbox(
+                "How often do you use social media after 10 PM?",
+                ["Never", "Rarely (1-2 times/week)", "Sometimes (3-4 times/week)", "Often (5-6 times/week)", "Every night"],
+                help="Late night usage is linked to poor sleep quality"
+            )
+        
+        st.subheader("😴 Sleep & Wellbeing")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            sleep_quality = st.selectbox(
+                "How is your sleep quality?",
+                ["Very Poor", "Poor", "Average", "Good", "Excellent"],
+                index=2
+            )
+            
+            morning_tiredness = st.selectbox(
+                "How tired are you in the morning?",
+                ["Always exhausted", "Usually tired", "Sometimes tired", "Usually refreshed", "Always energetic"],
+                index=2
+            )
+        
+        with col2:
+            phone_bed = st.selectbox(
+                "Do you keep your phone in the bedroom?",
+                ["Yes, next to my bed", "Yes, but across the room", "No, I charge it outside"],
+                help="Phone location affects sleep quality"
+            )
+            
+            difficulty_sleeping = st.selectbox(
+                "After using devices at night, do you have trouble falling asleep?",
+                ["Always", "Often", "Sometimes", "Rarely", "Never"],
+                index=2
+            )
+        
+        submitted = st.form_submit_button("🔍 Analyze My Digital Wellness", use_container_width=True, type="primary")
+        
+        if submitted:
+            # Prepare user data for clustering prediction
+            user_data = {
+                'daily_usage': daily_usage,
+                'sleep_hours': sleep_hours,
+                'bedtime_screen': bedtime_screen,
+                'social_media': social_media,
+                'age_numeric': AGE_MAPPING.get(age, DEFAULT_AGE),
+                'phone_checks': 50,  # Reasonable default
+                'anxiety_level': 5,  # Neutral default
+                'depression_level': 5,  # Neutral default
+                'exercise_time': 1.0,  # Default exercise time
+                'late_night_usage': late_night_usage,
+                'sleep_quality': sleep_quality,
+                'phone_bed': phone_bed
+            }
+            
+            # Scored in-process with this server's models, or by the scoring service when
+            # SCORING_SERVICE_URL is set (python -m wellness.service)
+            scoring = services.scoring_client()
+            score_start = time.perf_counter()
+            try:
+                result = scoring.assess(dict(user_data, age_group=age))
+            except (OSError, RuntimeError) as e:
+                st.error(f"Scoring service at {scoring.url} is unavailable: {e}")
+                return
+            score_seconds = time.perf_counter() - score_start
+            
+            dataset_used = result['dataset_used']
+            cluster, confidence = result['cluster'], result['confidence']
+            risk_score, risk_level, risk_factors = result['risk_score'], result['risk_level'], result['risk_factors']
+            
+            # Determine user group based on REAL clustering results
+            algorithm_used = "K-Means model" if result['model'] else "K-Means research logic"
+            hierarchical_used = "Hierarchical model" if result['model'] else "Hierarchical research logic"
+            
+            if dataset_used == "Teen":
+                if cluster == 1:  # Higher usage cluster from K-Means
+                    user_group = "Higher Usage Group"
+                    risk_color = "danger" if risk_score >= 8 else "warning"
+                    cluster_info = f"{algorithm_used} (confidence: {confidence:.3f}) places you in the 49.3% of teens with elevated usage patterns"
+                else:  # Balanced usage cluster
+                    user_group = "Balanced Usage Group"
+                    risk_color = "success"
+                    cluster_info = f"{algorithm_used} (confidence: {confidence:.3f}) places you in the 50.7% of teens with balanced habits"
+            else:
+                if cluster == 1:  # High-risk cluster from Hierarchical clustering
+                    user_group = "High-Risk Users"
+                    risk_color = "danger"
+                    cluster_info = f"{hierarchical_used} (confidence: {confidence:.3f}) places you in the 0.8% requiring immediate intervention"
+                else:  # Regular users cluster
+                    user_group = "Regular Users"
+                    risk_color = "warning" if risk_score >= 4 else "success"
+                    cluster_info = f"{hierarchical_used} (confidence: {confidence:.3f}) places you in the 99.2% with typical usage patterns"
+            
+            # Display results
+            st.markdown("---")
+            templates.show("page_title", {
+                "title": "📊 Assessment Results",
+                "subtitle": "Your personalized digital wellness analysis"
+            })
+            
+            # Main results cards
+            col1, col2, col3 = st.columns([1, 1, 1], gap="medium")
+            
+            with col1:
+                # Risk level with color
+                risk_icon = "🟢" if "Low" in risk_level else "🟡" if "Moderate" in risk_level else "🔴"
+                templates.show("stat_card", {
+                    "variant": "fixed",
+                    "accent": "green" if "Low" in risk_level else "yellow" if "Moderate" in risk_level else "red",
+                    "icon": risk_icon,
+                    "title": "Risk Assessment",
+                    "value": risk_level,
+                    "caption": f"Score: {risk_score}/15"
+                })
+            
+            with col2:
+                # User group with professional styling
+                group_icon = "👥" if "Regular" in user_group else "⚡" if "Higher" in user_group else "🎯"
+                templates.show("stat_card", {
+                    "variant": "fixed",
+                    "accent": "blue",
+                    "icon": group_icon,
+                    "title": "Your Profile",
+                    "value": user_group,
+                    "caption": cluster_info
+                })
+            
+            with col3:
+                # Analysis model with tech styling
+                model_icon = "🧠" if dataset_used == "Teen" else "📊"
+                algorithm = f"K-Means {'Model' if result['model'] else 'Logic'}" if dataset_used == "Teen" else f"Hierarchical {'Model' if result['model'] else 'Logic'}"
+                templates.show("stat_card", {
+                    "variant": "fixed",
+                    "accent": "purple",
+                    "icon": model_icon,
+                    "title": "Analysis Method",
+                    "value": f"{dataset_used} Dataset",
+                    "caption": algorithm
+                })
+                if scoring.url:
+                    layout.add_diagnostic(f"Scored by {scoring.url} in {score_seconds * 1000:.1f} ms")
+                else:
+                    layout.add_diagnostic(f"Model cold load: {services.load_model(dataset_used)[1] * 1000:.1f} ms "
+                                          f"(once per server process)")
+            
+            # Risk factors section with compact styling
+            if risk_factors:
+                st.markdown("---")
+                templates.show("subheading", {"accent": "yellow", "title": "⚠️ Areas for Improvement"})
+                
+                # Display risk factors in a more compact grid
+                rows = [{"number": i, "text": factor} for i, factor in enumerate(risk_factors, 1)]
+                if len(risk_factors) > 3:
+                    col1, col2 = st.columns(2)
+                    for col, column_rows in zip([col1, col2], [rows[0::2], rows[1::2]]):
+                        with col:
+                            templates.show_rows("risk_factor", column_rows)
+                else:
+                    templates.show_rows("risk_factor", rows)
+            
+            # Call to action
+            st.markdown("---")
+            
+            # Store results in session state for recommendations page
+            st.session_state.results = {
+                'user_group': user_group,
+                'risk_level': risk_level,
+                'risk_score': risk_score,
+                'risk_factors': risk_factors,
+                'dataset_used': dataset_used,
+                'cluster': cluster,
+                'confidence': confidence,
+                'cluster_info': cluster_info,
+                'user_data': user_data
+            }
+            
+            templates.show("call_to_action", {
+                "title": "🎯 Next Steps",
+                "text": "Get your personalized action plan to improve your digital wellness",
+                "hint": '👉 Click "Get Recommendations" above to see your customized plan'
+            })
+            
+            # Store results for recommendations
+            st.session_state.assessment_results = {
+                'risk_level': risk_level,
+                'risk_score': risk_score,
+                'user_group': user_group,
+                'dataset_used': dataset_used,
+                'risk_factors': risk_factors,
+                'user_data': {
+                    'age_group': age,
+                    'daily_usage': daily_usage,
+                    'social_media': social_media,
+                    'sleep_hours': sleep_hours,
+                    'bedtime_screen': bedtime_screen,
+                    'late_night_usage': late_night_usage,
+                    'sleep_quality': sleep_quality
+                }
+            }
+            
+            st.info("💡 Go to 'Get Recommendations' to see your personalized action plan!")
@@ -0,0 +1,263 @@
+"""
+Overview & Analytics page: dataset statistics and research charts
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from dashboard import services, templates
+from wellness.charts import box_figure, histogram_figure
+from wellness.density import SCATTER_MODES, density_figure
+from wellness.timing import timed
+
+
+def render():
+    teen_df = services.session_data().teen_df
+    dashboard_summary = services.dashboard_summary()
+    chart_samples = services.chart_samples()
+    models_available = services.models_available()
+    
+    st.header("📊 Research Overview & Data Analytics")
+    
+    # Key statistics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    for col, (title, value, caption) in zip([col1, col2, col3, col4], [
+        ("👥 Total Users", "7,299", "User data analyzed"),
+        ("🧠 Live Models", "3", "Trained clustering algorithms deployed"),
+        ("🎯 Best Score", "0.775", "Silhouette score achieved"),
+        ("✅ Accuracy", "±0.000", "Cross-validation stability")
+    ]):
+        with col:
+            templates.show("metric", {"title": title, "value": value, "caption": caption})
+    
+    # Real-time clustering info
+    st.markdown("---")
+    
+    # Check if models are loaded
+    model_status = "✅ Active" if models_available else "⚠️ Fallback Mode"
+    model_description = ("Your user input is processed through trained StandardScaler and clustering models" 
+                        if models_available else 
+                        "Using research-validated logic based on your clustering analysis")
+    
+    templates.show("info_card", {
+        "accent": "blue",
+        "title": f"🤖 AI Clustering System ({model_status})",
+        "body": templates.fragment(f"""
+            <p><strong>This dashboard implements your research methodology:</strong></p>
+            <p>• <strong>Teen Assessment:</strong> K-Means clustering approach (Silhouette: 0.152)</p>
+            <p>• <strong>Adult Assessment:</strong> Hierarchical clustering approach (Silhouette: 0.775)</p>
+            <p>• <strong>Real-time prediction:</strong> {model_description}</p>
+            <p>• <strong>Evidence-based results:</strong> Cluster assignments match your research findings with 7,299 validated profiles</p>
+        """)
+    })
+    
+    # Dataset comparison
+    st.subheader("📱 Dataset Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Teen Dataset (Ages 13-18)")
+        st.markdown(f"**Total Users:** {dashboard_summary.rows('Teen'):,}")
+        
+        # Teen cluster distribution
+        def build_teen_groups():
+            teen_cluster_counts = dashboard_summary.cluster_counts("Teen")
+            fig_teen = px.bar(
+                x=[0, 1],
+                y=teen_cluster_counts,
+                title="Teen User Groups",
+                color=[0, 1],
+                color_discrete_sequence=['#2E8B57', '#FF6347']
+            )
+            fig_teen.update_layout(
+                height=400,
+                showlegend=False,
+                xaxis_title="",
+                yaxis_title="Number of Users",
+                margin=dict(l=50, r=50, t=50, b=50),
+                xaxis=dict(showticklabels=False)
+            )
+            fig_teen.update_traces(texttemplate='%{y}', textposition='inside', textfont=dict(color='white', size=16))
+            
+            # Add text annotations for labels
+            fig_teen.add_annotation(x=0, y=-200, text="Balanced Usage", showarrow=False, font=dict(size=12))
+            fig_teen.add_annotation(x=1, y=-200, text="Higher Usage", showarrow=False, font=dict(size=12))
+            return fig_teen
+        
+        st.plotly_chart(services.chart_figure('overview_teen_groups', build_teen_groups), use_container_width=True)
+        
+        # Teen statistics
+        st.markdown(f"""
+        **Average Sleep:** {dashboard_summary.mean("Teen", 'Sleep_Hours'):.1f} hours
+        **Average Social Media:** {dashboard_summary.mean("Teen", 'Time_on_Social_Media'):.1f} hours  
+        **Average Bedtime Screens:** {dashboard_summary.mean("Teen", 'Screen_Time_Before_Bed'):.1f} hours
+        """)
+    
+    with col2:
+        st.markdown("#### Social Media Dataset (Ages 15-35+)")
+        st.markdown(f"**Total Users:** {dashboard_summary.rows('Social Media'):,}")
+        
+        # Social cluster distribution  
+        def build_social_groups():
+            social_cluster_counts = dashboard_summary.cluster_counts("Social Media")
+            fig_social = px.bar(
+                x=['Regular Users', 'High-Risk Users'],
+                y=social_cluster_counts,
+                title="Social Media User Groups",
+                color=['Regular Users', 'High-Risk Users'],
+                color_discrete_sequence=['#4169E1', '#DC143C']
+            )
+            fig_social.update_layout(
+                height=450,
+                showlegend=False,
+                xaxis_title="User Groups",
+                yaxis_title="Number of Users",
+                margin=dict(l=50, r=50, t=50, b=120),
+                xaxis=dict(tickangle=0, tickmode='array', tickvals=[0, 1], ticktext=['Regular<br>Users', 'High-Risk<br>Users'])
+            )
+            fig_social.update_traces(texttemplate='%{y}', textposition='inside', textfont=dict(color='white', size=16))
+            return fig_social
+        
+        st.plotly_chart(services.chart_figure('overview_social_groups', build_social_groups), use_container_width=True)
+        
+        # Social statistics
+        st.markdown(f"""
+        **Average Sleep:** {dashboard_summary.mean("Social Media", ' Sleep Duration '):.1f} hours
+        **Average Social Media:** {dashboard_summary.mean("Social Media", 'Social Media Usage (hrs)'):.1f} hours
+        **Average Screen Time:** {dashboard_summary.mean("Social Media", 'Screen.Time(hrs)'):.1f} hours
+        """)
+    
+    # Key insights visualization
+    st.subheader("🎯 Key Research Insights")
+    # Changing the scatter mode only reruns these charts
+    @st.fragment
+    @timed(st.session_state, "fragment:overview_scatter")
+    def scatter_plots():
+        scatter_mode = st.radio("Scatter plots:", SCATTER_MODES, horizontal=True,
+                                help="Density views include every user, binned on the server")
+        
+        # Sleep vs Screen Time correlation
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Teen sleep vs social media
+            def build_teen_scatter():
+                if scatter_mode == "Sample points":
+                    fig_teen_corr = px.scatter(
+                        chart_samples.sample('overview_teen_scatter', teen_df, 500),
+                        x='Time_on_Social_Media',
+                        y='Sleep_Hours', 
+                        color='cluster',
+                        title="Teen Dataset: Social Media vs Sleep",
+                        labels={'Time_on_Social_Media': 'Social Media Hours', 'Sleep_Hours': 'Sleep Hours'},
+                        color_discrete_map={0: '#2E8B57', 1: '#FF6347'}
+                    )
+                else:
+                    teen_sample = None
+                    if scatter_mode == "Density + sample":
+                        overlay = chart_samples.sample('overview_teen_overlay', teen_df, 200)
+                        teen_sample = (overlay['Time_on_Social_Media'], overlay['Sleep_Hours'], overlay['cluster'].astype(str))
+                    fig_teen_corr = density_figure(
+                        services.density_grids()['teen_social_sleep'],
+                        colors={"0": '#2E8B57', "1": '#FF6347'},
+                        title="Teen Dataset: Social Media vs Sleep",
+                        labels={'x': 'Social Media Hours', 'y': 'Sleep Hours'},
+                        sample=teen_sample
+                    )
+                fig_teen_corr.add_annotation(
+                    x=dashboard_summary.stats("Teen", 'Time_on_Social_Media')['max'] * 0.7,
+                    y=dashboard_summary.stats("Teen", 'Sleep_Hours')['max'] * 0.3,
+                    text="More social media →<br>Less sleep",
+                    showarrow=True,
+                    arrowhead=2
+                )
+                return fig_teen_corr
+            
+            st.plotly_chart(services.chart_figure(f'overview_teen_scatter:{scatter_mode}', build_teen_scatter), use_container_width=True)
+        
+        with col2:
+            # Bedtime screen time impact
+            # Quartiles come from the summary, so no rows are sent to the browser
+            def build_bedtime_box():
+                fig_bedtime = box_figure(
+                    dashboard_summary,
+                    "Teen",
+                    'Screen_Time_Before_Bed',
+                    title="Bedtime Screen Time by Group",
+                    labels={'cluster': 'User Group', 'Screen_Time_Before_Bed': 'Hours Before Bed'}
+                )
+                fig_bedtime.update_layout(xaxis=dict(ticktext=['Balanced Group', 'Higher Usage'], tickvals=[0, 1]))
+                return fig_bedtime
+            
+            st.plotly_chart(services.chart_figure('overview_bedtime_box', build_bedtime_box), use_container_width=True)
+    
+    scatter_plots()
+    
+    # Late night usage patterns
+    st.subheader("🌙 User Behavior Analysis")
+    
+    # Create distribution plot of actual bedtime screen time
+    def build_bedtime_histogram():
+        fig_bedtime_dist = histogram_figure(
+            dashboard_summary,
+            "Teen",
+            'Screen_Time_Before_Bed',
+            colors={0: '#2E8B57', 1: '#FF6347'},
+            title="Hours of Screen Time Before Bed",
+            labels={'Screen_Time_Before_Bed': 'Hours Before Bed', 'count': 'Number of Users'},
+            opacity=0.7
+        )
+        
+        # Add vertical lines for group averages
+        balanced_avg = dashboard_summary.mean("Teen", 'Screen_Time_Before_Bed', cluster=0)
+        higher_avg = dashboard_summary.mean("Teen", 'Screen_Time_Before_Bed', cluster=1)
+        
+        fig_bedtime_dist.add_vline(
+            x=balanced_avg, 
+            line_dash="dash", 
+            line_color="#2E8B57",
+            annotation_text=f"Balanced Avg: {balanced_avg:.1f}h"
+        )
+        fig_bedtime_dist.add_vline(
+            x=higher_avg, 
+            line_dash="dash", 
+            line_color="#FF6347",
+            annotation_text=f"Higher Usage Avg: {higher_avg:.1f}h"
+        )
+        
+        fig_hourly = fig_bedtime_dist
+        
+        # Add bedtime zone
+        fig_hourly.add_vrect(
+            x0=2, x1=3,
+            fillcolor="red", opacity=0.2,
+            line_width=0,
+            annotation_text="Critical Sleep Impact Zone"
+        )
+        
+        fig_hourly.update_layout(
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font_color='white'
+        )
+        return fig_hourly
+    
+    st.plotly_chart(services.chart_figure('overview_bedtime_histogram', build_bedtime_histogram), use_container_width=True)
+    
+    # Add data insights below the chart
+    col1, col2, col3 = st.columns(3)
+    
+    # Calculate daily usage averages (the actual differentiator)
+    balanced_daily = dashboard_summary.mean("Teen", 'Daily_Usage_Hours', cluster=0)
+    higher_daily = dashboard_summary.mean("Teen", 'Daily_Usage_Hours', cluster=1)
+    
+    difference = higher_daily - balanced_daily
+    for col, (title, value, caption) in zip([col1, col2, col3], [
+        ("Balanced Group", f"{balanced_daily:.1f}h", "Avg daily screen time"),
+        ("Higher Usage Group", f"{higher_daily:.1f}h", "Avg daily screen time"),
+        ("Difference", f"+{difference:.1f}h", "Higher usage impact")
+    ]):
+        with col:
+            templates.show("metric", {"title": title, "value": value, "caption": caption})
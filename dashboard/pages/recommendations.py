@@ -0,0 +1,300 @@
+"""
+Get Recommendations page: the action plan for the last assessment
+"""
+
+import streamlit as st
+
+from dashboard import services, templates
+
+
+def render():
+    recommendations = services.session_data().recommendations
+    
+    st.header("💡 Your Personalized Digital Wellness Plan")
+    
+    if 'assessment_results' in st.session_state:
+        results = st.session_state.assessment_results
+        
+        # Find matching recommendations based on dataset and user group
+        user_group = results['user_group']
+        dataset_used = results['dataset_used']
+        matching_rec = None
+        
+        # Map user groups to recommendation structure
+        if dataset_used == "Teen":
+            if "Balanced" in user_group:
+                matching_rec = {
+                    'cluster': 'Balanced Usage Group',
+                    'recommendations': recommendations['teen_dataset']['cluster_0']['recommendations'],
+                    'sleep_tips': [
+                        "Set a consistent bedtime (even on weekends)",
+                        "Stop all screens 1 hour before sleep",
+                        "Keep bedroom cool, dark, and quiet",
+                        "Try reading or meditation before bed",
+                        "Avoid caffeine after 2 PM"
+                    ]
+                }
+            else:  # Higher Usage Group
+                matching_rec = {
+                    'cluster': 'Higher Usage Group',
+                    'recommendations': recommendations['teen_dataset']['cluster_1']['recommendations'],
+                    'sleep_tips': [
+                        "Urgently reduce screen time before bed",
+                        "Move all devices out of bedroom",
+                        "Set phone to 'Do Not Disturb' at 9 PM",
+                        "Practice relaxation techniques",
+                        "Consider sleep hygiene consultation"
+                    ]
+                }
+        else:  # Social Media Dataset
+            if "Regular" in user_group:
+                matching_rec = {
+                    'cluster': 'Regular Users',
+                    'recommendations': recommendations['social_dataset']['cluster_0']['recommendations'],
+                    'sleep_tips': [
+                        "Maintain current healthy patterns",
+                        "Use blue light filters after sunset",
+                        "Keep consistent sleep schedule",
+                        "Monitor for any pattern changes",
+                        "Share tips with friends and family"
+                    ]
+                }
+            else:  # High-Risk Users
+                matching_rec = {
+                    'cluster': 'High-Risk Users',
+                    'recommendations': recommendations['social_dataset']['cluster_1']['recommendations'],
+                    'sleep_tips': [
+                        "Immediate intervention needed",
+                        "Consider professional help",
+                        "Remove all devices from bedroom",
+                        "Set strict usage limits",
+                        "Practice digital detox"
+                    ]
+                }
+        
+        if matching_rec is None:
+            # Fallback recommendations
+            matching_rec = {
+                'cluster': 'General',
+                'recommendations': [
+                    "Limit screen time before bed",
+                    "Practice good sleep hygiene",
+                    "Set device boundaries",
+                    "Take regular digital breaks",
+                    "Stay physically active"
+                ],
+                'sleep_tips': [
+                    "Maintain consistent sleep schedule",
+                    "Create a relaxing bedtime routine",
+                    "Keep bedroom cool and dark",
+                    "Avoid caffeine late in the day",
+                    "Exercise regularly but not before bed"
+                ]
+            }
+        
+        # Assessment Summary Cards
+        st.markdown("---")
+        templates.show("section_title", {"title": "📊 Your Assessment Summary"})
+        
+        col1, col2, col3 = st.columns(3, gap="medium")
+        
+        with col1:
+            risk_accent = "green" if "Low" in results['risk_level'] else "yellow" if "Moderate" in results['risk_level'] else "red"
+            templates.show("summary_card", {"accent": risk_accent, "title": "Risk Level", "value": results['risk_level']})
+        
+        with col2:
+            templates.show("summary_card", {"accent": "blue", "title": "User Group", "value": results['user_group']})
+        
+        with col3:
+            templates.show("summary_card", {"accent": "purple", "title": "Risk Score", "value": f"{results['risk_score']}/15"})
+        
+        # Main Recommendations Section
+        st.markdown("---")
+        risk_level = results['risk_level']
+        
+        if "High" in risk_level or "Very High" in risk_level:
+            # High Risk Recommendations
+            templates.show("banner", {
+                "tone": "danger",
+                "title": "🚨 Immediate Action Required",
+                "text": "Your digital habits require urgent attention for your health and wellbeing"
+            })
+            
+            col1, col2 = st.columns(2, gap="large")
+            
+            with col1:
+                templates.show("info_card", {
+                    "accent": "red",
+                    "title": "🆘 Priority Actions (This Week)",
+                    "body": templates.join("numbered_item", [
+                        {"number": i, "text": rec} for i, rec in enumerate(matching_rec['recommendations'][:3], 1)
+                    ])
+                })
+            
+            with col2:
+                templates.show("info_card", {
+                    "accent": "yellow",
+                    "title": "⏰ Emergency Daily Schedule",
+                    "body": templates.fragment("""
+                        <p><strong>7:00 AM</strong> - Morning routine (phone-free first hour)</p>
+                        <p><strong>9:00 AM</strong> - Check messages (15 min limit)</p>
+                        <p><strong>12:00 PM</strong> - Lunch break phone time (15 min)</p>
+                        <p><strong>6:00 PM</strong> - Last social media check of day</p>
+                        <p><strong>8:00 PM</strong> - All devices to charging station</p>
+                        <p><strong>9:00 PM</strong> - Relaxing activities only</p>
+                        <p><strong>10:00 PM</strong> - Bedtime routine begins</p>
+                    """)
+                })
+        
+        elif "Moderate" in risk_level:
+            # Moderate Risk Recommendations
+            templates.show("banner", {
+                "tone": "warning",
+                "title": "⚠️ Gradual Improvements Needed",
+                "text": "Your habits need some adjustments to optimize your digital wellness"
+            })
+            
+            col1, col2 = st.columns(2, gap="large")
+            
+            with col1:
+                templates.show("info_card", {
+                    "accent": "yellow",
+                    "title": "🎯 4-Week Improvement Plan",
+                    "body": templates.fragment("""
+                        <p><strong>Week 1:</strong> Reduce daily screen time by 30 minutes</p>
+                        <p><strong>Week 2:</strong> Stop social media use 1 hour before bed</p>
+                        <p><strong>Week 3:</strong> Move phone charging outside bedroom</p>
+                        <p><strong>Week 4:</strong> Add 30 minutes more sleep nightly</p>
+                    """)
+                })
+            
+            with col2:
+                templates.show("info_card", {
+                    "accent": "blue",
+                    "title": "💡 Practical Tips",
+                    "body": templates.join("item", [{"text": f"• {rec}"} for rec in matching_rec['recommendations']])
+                })
+        
+        else:  # Low Risk
+            templates.show("banner", {
+                "tone": "success",
+                "title": "✅ Great Habits! Keep It Up",
+                "text": "You have excellent digital wellness habits - maintain and enhance them"
+            })
+            
+            col1, col2 = st.columns(2, gap="large")
+            
+            with col1:
+                templates.show("info_card", {
+                    "accent": "green",
+                    "title": "🌟 Maintenance Strategies",
+                    "body": templates.join("item", [{"text": f"• {rec}"} for rec in matching_rec['recommendations']])
+                })
+            
+            with col2:
+                # Show positive habits
+                good_habits = []
+                user_data = results['user_data']
+                
+                if user_data['sleep_hours'] >= 7:
+                    good_habits.append("✅ Healthy sleep duration")
+                if user_data['bedtime_screen'] <= 1:
+                    good_habits.append("✅ Limited bedtime screen use")
+                if user_data['daily_usage'] <= 6:
+                    good_habits.append("✅ Reasonable daily screen time")
+                if "Never" in user_data['late_night_usage'] or "Rarely" in user_data['late_night_usage']:
+                    good_habits.append("✅ Good late-night habits")
+                
+                templates.show("info_card", {
+                    "accent": "blue",
+                    "title": "📊 Your Healthy Patterns",
+                    "body": templates.join("item", [{"text": habit} for habit in good_habits])
+                })
+        
+        # Sleep Quality Section
+        st.markdown("---")
+        templates.show("section_title", {"title": "😴 Sleep Quality Improvement Plan"})
+        
+        col1, col2 = st.columns(2, gap="large")
+        
+        with col1:
+            templates.show("info_card", {
+                "accent": "purple",
+                "title": "🌙 Evening Routine",
+                "body": templates.join("item", [{"text": f"• {tip}"} for tip in matching_rec['sleep_tips']])
+            })
+        
+        with col2:
+            templates.show("info_card", {
+                "accent": "teal",
+                "title": "📱 Technology Guidelines",
+                "body": templates.fragment("""
+                    <p><strong>2 hours before bed:</strong> Stop all social media</p>
+                    <p><strong>1 hour before bed:</strong> No screens except e-readers</p>
+                    <p><strong>30 min before bed:</strong> Phone on airplane mode</p>
+                    <p><strong>Bedtime:</strong> Phone charges outside bedroom</p>
+                    <p><strong>Morning:</strong> Don't check phone for first 30 minutes</p>
+                """)
+            })
+        
+        # Progress Tracking Section
+        st.markdown("---")
+        templates.show("section_title", {"title": "📈 Track Your Progress"})
+        
+        col1, col2 = st.columns(2, gap="large")
+        
+        with col1:
+            templates.show("info_card", {
+                "accent": "blue",
+                "title": "🎯 Weekly Check-in Questions",
+                "body": templates.fragment("""
+                    <div class="question"><strong>1.</strong> How many nights did you avoid screens 1 hour before bed? <span class="goal">(Goal: 5-7 nights)</span></div>
+                    <div class="question"><strong>2.</strong> What was your average sleep duration this week? <span class="goal">(Goal: 7-9 hours)</span></div>
+                    <div class="question"><strong>3.</strong> How many times did you use social media after 10 PM? <span class="goal">(Goal: 0-2 times)</span></div>
+                    <div class="question"><strong>4.</strong> How refreshed did you feel in the mornings? <span class="goal">(Goal: Refreshed 5+ days)</span></div>
+                    <div class="question"><strong>5.</strong> Did you keep your phone outside the bedroom? <span class="goal">(Goal: Every night)</span></div>
+                """)
+            })
+        
+        with col2:
+            success_indicators = [
+                "Fall asleep faster (within 15-20 minutes)",
+                "Feel more refreshed in the morning",
+                "Less urge to check phone late at night",
+                "Better mood and energy during the day",
+                "Improved focus and productivity"
+            ]
+            
+            templates.show("info_card", {
+                "accent": "yellow",
+                "title": "🏆 Success Indicators (2-4 weeks)",
+                "body": templates.join("item", [{"text": f"• {indicator}"} for indicator in success_indicators])
+            })
+    
+    else:
+        st.info("👆 Please complete the Assessment first to get your personalized recommendations!")
+        
+        # General tips for users who haven't taken assessment
+        st.subheader("🌟 Universal Digital Wellness Tips")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 📱 General Guidelines")
+            st.markdown("""
+            • **Daily screen time:** Aim for under 6 hours total
+            • **Social media:** Limit to 2-3 hours maximum
+            • **Evening cutoff:** Stop scrolling 2 hours before bed
+            • **Phone location:** Charge outside the bedroom
+            • **Morning routine:** No phones for first 30 minutes
+            """)
+        
+        with col2:
+            st.markdown("#### 😴 Sleep Hygiene Basics")
+            st.markdown("""
+            • **Sleep duration:** 7-9 hours for most adults
+            • **Consistency:** Same bedtime and wake time daily
+            • **Environment:** Cool, dark, and quiet bedroom
+            • **Pre-sleep:** Reading, meditation, or gentle stretching
+            • **Avoid:** Caffeine, large meals, screens before bed
+            """)
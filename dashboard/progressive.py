@@ -0,0 +1,91 @@
+"""
+Progressive chart rendering
+
+In a function decorated with progressive_charts() (or inside the block), a
+page writes its text straight away and chart() leaves an st.empty()
+placeholder where each chart goes. Charts already in the figure cache are
+drawn in place. The others are built on a worker pool shared by every
+session once the page's text is out, and each placeholder is filled as soon
+as its figure is ready, so the text no longer waits for the charts above it
+and a slow chart only holds up itself.
+
+The time from entering the block until its text is written is recorded in
+render_times as "first_content". A block opened inside another one (a
+fragment during a full run) hands its charts to the outer block; on a
+fragment rerun it fills them itself. Outside any block chart() draws the
+chart in order, as before.
+
+Builders run on the worker threads, so they must not call Streamlit: fetch
+cached resources (density grids, ...) before passing the builder in.
+"""
+
+import threading
+import time
+from concurrent.futures import as_completed
+from contextlib import contextmanager
+
+import streamlit as st
+
+from dashboard import services
+from wellness.timing import record
+
+FIRST_CONTENT = "first_content"
+PENDING_NOTE = "⏳ Building chart..."
+
+_active = threading.local()
+
+
+class ChartSlots:
+    """Chart placeholders of one page or fragment run"""
+
+    def __init__(self):
+        self.version = services.load_data().version
+        self.theme = st.context.theme.type
+        self.cache = services.load_figure_cache()
+        self._pending = []
+
+    def chart(self, chart_id, builder):
+        """Placeholder for a chart: drawn now if it's cached, built after the text otherwise"""
+        slot = st.empty()
+        figure = self.cache.get(chart_id, self.version, self.theme)
+        if figure is not None:
+            slot.plotly_chart(figure, use_container_width=True)
+        else:
+            slot.caption(PENDING_NOTE)
+            self._pending.append((slot, chart_id, builder))
+        return slot
+
+    def fill(self):
+        """Build the waiting charts on the worker pool, drawing each one as soon as it's done"""
+        pending, self._pending = self._pending, []
+        pool = services.chart_pool()
+        futures = {pool.submit(self.cache.figure, chart_id, self.version, self.theme, builder): slot
+                   for slot, chart_id, builder in pending}
+        for future in as_completed(futures):
+            futures[future].plotly_chart(future.result(), use_container_width=True)
+
+
+def chart(chart_id, builder):
+    """Draw a chart through the enclosing progressive_charts(), or right away outside one"""
+    slots = getattr(_active, "slots", None)
+    if slots is None:
+        return st.plotly_chart(services.chart_figure(chart_id, builder), use_container_width=True)
+    return slots.chart(chart_id, builder)
+
+
+@contextmanager
+def progressive_charts():
+    """ChartSlots for the block (or decorated function), filled in when its text is done"""
+    outer = getattr(_active, "slots", None)
+    if outer is not None:
+        yield outer
+        return
+
+    start = time.perf_counter()
+    slots = _active.slots = ChartSlots()
+    try:
+        yield slots
+        record(st.session_state, FIRST_CONTENT, time.perf_counter() - start)
+        slots.fill()
+    finally:
+        _active.slots = None
@@ -0,0 +1,142 @@
+"""
+Start the dashboard with warm caches and a readiness signal
+
+Runs dashboard/warmup.py in this process, then starts the Streamlit server
+here too, so the first visitor finds the data, models and figures already
+cached. The replica is marked ready only once warm-up has finished and the
+server answers its health check:
+
+    --ready-file PATH   written when ready (removed at start), with the warm-up timings
+    --ready-port PORT   GET /ready answers 503 while warming up and 200 once ready
+
+Anything after the options is passed on to `streamlit run app.py`.
+
+Usage:
+    python -m dashboard.serve [--ready-file /tmp/dashboard.ready] [--ready-port 8502]
+                              [-- --server.port 8501 --server.headless true]
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dashboard.warmup import warm_up
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+HEALTH_TIMEOUT = 60
+
+
+class Readiness:
+    """Warm-up progress of this replica, and the ready file once it's ready"""
+
+    def __init__(self, ready_file=None):
+        self.ready_file = ready_file
+        self.status = "starting"
+        self.step = None
+        self.steps = []
+        self.error = None
+        self.ready = threading.Event()
+        if ready_file and os.path.exists(ready_file):
+            # Left over from a previous run; this process isn't ready yet
+            os.remove(ready_file)
+
+    def report(self):
+        return {
+            'status': self.status,
+            'step': self.step,
+            'error': self.error,
+            'warm_up_ms': {name: round(seconds * 1000, 1) for name, seconds in self.steps}
+        }
+
+    def progress(self, step):
+        self.status, self.step = "warming up", step
+
+    def failed(self, error):
+        self.status, self.error = "failed", error
+
+    def mark_ready(self):
+        self.status, self.step = "ready", None
+        if self.ready_file:
+            temporary = f"{self.ready_file}.tmp"
+            with open(temporary, "w") as f:
+                json.dump(self.report(), f, indent=2)
+            os.replace(temporary, self.ready_file)
+        self.ready.set()
+
+
+class _ReadinessHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/ready":
+            self.send_error(404)
+            return
+        body = json.dumps(self.server.readiness.report()).encode("utf-8")
+        self.send_response(200 if self.server.readiness.ready.is_set() else 503)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_readiness(readiness, port, host="0.0.0.0"):
+    """Answer GET /ready on a daemon thread, returns the server"""
+    server = ThreadingHTTPServer((host, port), _ReadinessHandler)
+    server.daemon_threads = True
+    server.readiness = readiness
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def wait_for_server(readiness, timeout=HEALTH_TIMEOUT):
+    """Mark ready once Streamlit answers its health check"""
+    from streamlit import config
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        url = f"http://127.0.0.1:{config.get_option('server.port')}/_stcore/health"
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                if response.status == 200:
+                    readiness.mark_ready()
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    readiness.failed(f"Streamlit didn't answer its health check within {timeout}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm up the dashboard's caches, then serve it")
+    parser.add_argument("--ready-file", help="file written once the server is warm and up")
+    parser.add_argument("--ready-port", type=int, help="port answering GET /ready (503 until ready)")
+    parser.add_argument("streamlit_args", nargs=argparse.REMAINDER, help="passed on to streamlit run")
+    args = parser.parse_args(argv)
+    streamlit_args = args.streamlit_args[1:] if args.streamlit_args[:1] == ["--"] else args.streamlit_args
+
+    readiness = Readiness(args.ready_file)
+    if args.ready_port:
+        serve_readiness(readiness, args.ready_port)
+
+    try:
+        readiness.steps = warm_up(progress=readiness.progress)
+    except Exception as e:
+        # Serve anyway, cold; the replica stays unready so it gets no traffic
+        readiness.failed(f"Warm-up failed: {type(e).__name__}: {e}")
+        print(readiness.error, file=sys.stderr)
+    else:
+        print(f"Warm-up done in {sum(seconds for _, seconds in readiness.steps):.1f}s", file=sys.stderr)
+        readiness.progress("starting server")
+        threading.Thread(target=wait_for_server, args=(readiness,), daemon=True).start()
+
+    from streamlit.web import cli
+    return cli.main.main(["run", APP_PATH, *streamlit_args], prog_name="streamlit", standalone_mode=False)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
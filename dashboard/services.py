@@ -0,0 +1,157 @@
+"""
+Shared services for the dashboard pages
+
+Data, models, scoring, chart samples and figures are st.cache_resource
+singletons: created once per server process and shared by every session.
+This module is imported once, so the cached functions aren't redefined on
+every rerun either.
+"""
+
+import os
+import time
+
+import streamlit as st
+from streamlit.logger import get_logger
+
+from wellness import models as wellness_models
+from wellness.datastore import DatasetStore, report_lines
+from wellness.summary import load_summary
+
+logger = get_logger(__name__)
+
+
+# Load each trained model on first use, shared by every session in the process
+@st.cache_resource
+def load_model(dataset_type):
+    """Load one dataset's scoring kernel, returns (kernel, cold load seconds)"""
+    start = time.perf_counter()
+    try:
+        kernel = wellness_models.load_kernel(dataset_type)
+    except Exception as e:
+        # If the model can't be loaded, return None and we'll use fallback logic
+        st.warning(f"⚠️ Could not load trained models ({str(e)}). Using research-based fallback logic.")
+        kernel = None
+    return kernel, time.perf_counter() - start
+
+
+def models_available():
+    """Whether both trained models are present; they're loaded when an assessment is submitted"""
+    return all(wellness_models.kernel_available(dataset_type) for dataset_type in ["Teen", "Social Media"])
+
+
+@st.cache_resource
+def scoring_client():
+    """Scores assessments: over HTTP when SCORING_SERVICE_URL is set, otherwise in-process
+
+    The in-process service uses this process's cached models and lookup table.
+    SCORING_MAX_BATCH (and SCORING_MAX_WAIT_MS) micro-batch submissions from
+    concurrent sessions, see wellness/dispatcher.py.
+    """
+    from wellness.dispatcher import DEFAULT_MAX_WAIT
+    from wellness.service import ScoringClient, ScoringService
+    url = os.environ.get("SCORING_SERVICE_URL")
+    if url:
+        return ScoringClient(url)
+    return ScoringClient(service=ScoringService(
+        load_model=lambda dataset_type: load_model(dataset_type)[0],
+        load_lookup=load_lookup_table,
+        max_batch=int(os.environ.get("SCORING_MAX_BATCH", 0)),
+        max_wait=float(os.environ.get("SCORING_MAX_WAIT_MS", DEFAULT_MAX_WAIT * 1000)) / 1000
+    ))
+
+
+@st.cache_resource
+def load_lookup_table():
+    """Load the precomputed assessment outcomes (None if missing or out of date)"""
+    try:
+        from wellness.lookup import load_table
+        return load_table()
+    except Exception:
+        return None
+
+
+# Load data functions
+@st.cache_resource
+def load_data():
+    """Load all dashboard data once per process into a shared, read-only store
+
+    The files are loaded concurrently; their timings are logged and kept in
+    store.report for the startup diagnostics panel.
+    """
+    store = DatasetStore()
+    try:
+        store.load()
+        for line in report_lines(store.report, store.load_seconds):
+            logger.info(line)
+        return store
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        return None
+
+
+def session_data():
+    """Shallow views of the shared datasets for this rerun
+
+    Writes copy the column instead of changing the store.
+    """
+    return load_data().view()
+
+
+@st.cache_resource
+def load_dashboard_summary(version, _datasets):
+    """Every number the pages show, computed once per data version"""
+    return load_summary(_datasets, version)
+
+
+def dashboard_summary():
+    store = load_data()
+    return load_dashboard_summary(store.version, store.load())
+
+
+@st.cache_resource
+def load_density_grids(version, _datasets):
+    """Every scatter plot binned into 2-D grids, once per data version"""
+    from wellness.density import dashboard_grids
+    return dashboard_grids(_datasets)
+
+
+def density_grids():
+    store = load_data()
+    return load_density_grids(store.version, store.load())
+
+
+@st.cache_resource
+def load_chart_samples(version):
+    """Seeded chart samples for this data version, drawn once and shared by every session"""
+    from wellness.sampling import SampleStore
+    return SampleStore()
+
+
+def chart_samples():
+    return load_chart_samples(load_data().version)
+
+
+@st.cache_resource
+def load_figure_cache():
+    """Built figures shared by every session, see wellness/figures.py"""
+    from wellness.figures import FigureCache
+    return FigureCache()
+
+
+@st.cache_resource
+def chart_pool():
+    """Worker threads building chart figures for every session, see dashboard/progressive.py"""
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="chart")
+
+
+def chart_figure(chart_id, builder):
+    """Figure for a chart at the current data version and theme; builder() only runs on a cache miss"""
+    return load_figure_cache().figure(chart_id, load_data().version, st.context.theme.type, builder)
+
+
+@st.cache_resource
+def render_stats():
+    """Cold and warm render times of every page, see wellness/timing.py"""
+    from wellness.timing import RenderStats
+    return RenderStats()
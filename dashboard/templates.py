@@ -0,0 +1,82 @@
+"""
+HTML card templates for the dashboard pages
+
+Every card is styled by classes in static/dashboard.css, so a rerun only
+sends the card's values instead of a copy of its styles. Templates are
+compiled once when the module is imported and filled from a dict of values;
+values are HTML-escaped unless they're Markup (static HTML passed through
+fragment(), or rows built by join()).
+"""
+
+import html
+from string import Template
+
+import streamlit as st
+
+
+class Markup(str):
+    """Trusted HTML, inserted into a template as is"""
+
+
+# Accent colours, as .accent-<name> classes in static/dashboard.css
+ACCENTS = {
+    "blue": "#00d4ff",
+    "green": "#28a745",
+    "yellow": "#ffc107",
+    "red": "#dc3545",
+    "purple": "#6f42c1",
+    "teal": "#17a2b8",
+    "tomato": "#ff6347",
+    "royal": "#4169e1"
+}
+
+TEMPLATES = {name: Template(source) for name, source in {
+    # Headings
+    "page_title": '<div class="section-title"><h1>$title</h1><p class="lead">$subtitle</p></div>',
+    "section_title": '<div class="section-title"><h2>$title</h2></div>',
+    "lead": '<div class="section-title"><p class="lead">$text</p></div>',
+    "subheading": '<h3 class="subheading accent-$accent">$title</h3>',
+    # Cards
+    "metric": '<div class="metric-box"><h3>$title</h3><h2>$value</h2><p>$caption</p></div>',
+    "stat_card": (
+        '<div class="card stat-card $variant accent-$accent"><div class="card-icon">$icon</div>'
+        '<h3>$title</h3><h2>$value</h2><p class="note">$caption</p></div>'
+    ),
+    "summary_card": '<div class="card stat-card summary accent-$accent"><h3>$title</h3><h2>$value</h2></div>',
+    "info_card": '<div class="card accent-$accent"><h3>$title</h3><div class="card-body">$body</div></div>',
+    "banner": '<div class="banner banner-$tone"><h2>$title</h2><p>$text</p></div>',
+    "note": '<div class="banner banner-$tone"><h3>$title</h3><div class="card-body">$body</div></div>',
+    "call_to_action": '<div class="call-to-action"><h3>$title</h3><p>$text</p><p class="note">$hint</p></div>',
+    # Rows inside a card
+    "item": '<div class="card-item"><p>$text</p></div>',
+    "numbered_item": '<div class="card-item"><p><strong>$number.</strong> $text</p></div>',
+    "risk_factor": '<div class="risk-factor"><strong>$number.</strong> $text</div>'
+}.items()}
+
+
+def render(name, values):
+    """HTML of a template filled from a dict of values"""
+    return TEMPLATES[name].substitute({
+        key: value if isinstance(value, Markup) else html.escape(str(value))
+        for key, value in values.items()
+    })
+
+
+def fragment(source):
+    """Markup of static HTML written in a page module, without its indentation"""
+    return Markup("\n".join(line.strip() for line in source.strip().splitlines()))
+
+
+def join(name, rows):
+    """Markup of a template repeated for each dict of values in rows"""
+    return Markup("".join(render(name, values) for values in rows))
+
+
+def show(name, values):
+    """Render a template into the page"""
+    st.markdown(render(name, values), unsafe_allow_html=True)
+
+
+def show_rows(name, rows):
+    """Render a template for each dict of values in rows, as one block"""
+    st.markdown(join(name, rows), unsafe_allow_html=True)
@@ -0,0 +1,111 @@
+"""
+Cache warm-up for a freshly started server process
+
+Fills every process-wide cache the first visitor would otherwise pay for:
+the dataset store and what's derived from it (summary, density grids, chart
+samples), both scoring models, the lookup table and one prediction per
+dataset, and the figure cache for every page, scatter mode and theme. Pages
+are rendered through Streamlit's AppTest in this process, so the
+st.cache_resource singletons they fill are the ones the server uses.
+
+AppTest stands in for Streamlit's runtime while it runs, so warm_up() must
+finish before the server starts; dashboard/serve.py does that.
+
+Usage:
+    python -m dashboard.warmup    (warm up once and print the time of each step)
+"""
+
+import argparse
+import sys
+import time
+
+from dashboard.navigation import PAGES
+from wellness.risk import LATE_NIGHT_OPTIONS, PHONE_BED_OPTIONS, SLEEP_QUALITY_OPTIONS
+from wellness.scoring import AGE_GROUPS
+
+THEMES = ["light", "dark"]
+
+# One answer per dataset for the dummy predictions
+SAMPLE_ANSWERS = {
+    dataset_type: {'age_group': AGE_GROUPS[age], 'daily_usage': 6, 'social_media': 3, 'sleep_hours': 7,
+                   'bedtime_screen': 1, 'late_night_usage': LATE_NIGHT_OPTIONS[2],
+                   'sleep_quality': SLEEP_QUALITY_OPTIONS[3], 'phone_bed': PHONE_BED_OPTIONS[1]}
+    for dataset_type, age in [("Teen", 1), ("Social Media", 3)]
+}
+
+PAGE_SCRIPT = """
+import importlib
+from streamlit.proto.ClientState_pb2 import ContextInfo
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from dashboard import layout
+# Render as a browser with this theme would, so figures are cached under its key
+get_script_run_ctx().context_info = ContextInfo(color_scheme={theme!r})
+layout.apply_styles()
+importlib.import_module("dashboard.pages.{page}").render()
+"""
+
+
+def _render_page(page, theme):
+    """Render a page and every option of its radios (the scatter modes), returns the runs"""
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_string(PAGE_SCRIPT.format(page=page, theme=theme), default_timeout=300)
+    at.run()
+    runs = 1
+    for index in range(len(at.radio)):
+        for option in at.radio[index].options[1:]:
+            at.radio[index].set_value(option).run()
+            runs += 1
+    if at.exception:
+        raise RuntimeError(f"Rendering {page} failed: {at.exception[0].value}")
+    return runs
+
+
+def warm_up(pages=None, themes=THEMES, progress=None):
+    """Fill the data, model and figure caches, returns [(step, seconds)]
+
+    progress(step) is called before each step.
+    """
+    from dashboard import services
+
+    steps = []
+
+    def step(name, function, *args):
+        if progress is not None:
+            progress(name)
+        start = time.perf_counter()
+        function(*args)
+        steps.append((name, time.perf_counter() - start))
+
+    def load_data():
+        if services.load_data() is None:
+            raise RuntimeError("Could not load data")
+
+    step("data", load_data)
+    step("summary", services.dashboard_summary)
+    step("density grids", services.density_grids)
+    for dataset_type, answers in SAMPLE_ANSWERS.items():
+        step(f"model: {dataset_type}", services.load_model, dataset_type)
+        step(f"prediction: {dataset_type}", services.scoring_client().assess, answers)
+    for page in pages or PAGES:
+        for theme in themes:
+            step(f"page: {page} ({theme})", _render_page, page, theme)
+    return steps
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fill the dashboard caches and time each step")
+    parser.add_argument("--page", choices=list(PAGES), action="append", help="page to render (default: all)")
+    args = parser.parse_args(argv)
+
+    from dashboard import services
+    steps = warm_up(args.page)
+    for name, seconds in steps:
+        print(f"{name:<36}{seconds * 1000:>9.1f} ms")
+    figures = services.load_figure_cache().stats()
+    print(f"{'total':<36}{sum(seconds for _, seconds in steps) * 1000:>9.1f} ms, "
+          f"{figures['figures']} figures cached ({figures['bytes'] / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
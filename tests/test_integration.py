@@ -4,6 +4,7 @@ Integration Tests - Digital Wellness Dashboard App
 """
 
 import pandas as pd
+import numpy as np
 import json
 
 def test_data_works_together():
@@ -94,12 +95,370 @@ def test_everything_connects():
     print("  ✓ Everything connects properly")
     return True
 
+def test_batch_scoring():
+    """Check if batch scoring matches scoring users one at a time"""
+    print("Testing batch scoring...")
+    
+    from wellness.batch import score_batch
+    from wellness.models import load_kernels
+    from wellness.scoring import AGE_GROUPS, TEEN_AGE_GROUPS, predict_clusters
+    
+    models = load_kernels()
+    
+    # Small cohort of teen answers covering every slider range
+    rng = np.random.default_rng(7)
+    cohort = pd.DataFrame({
+        'age_group': rng.choice(TEEN_AGE_GROUPS, 200),
+        'daily_usage': rng.integers(1, 17, 200),
+        'social_media': rng.integers(0, 13, 200),
+        'sleep_hours': rng.integers(3, 13, 200),
+        'bedtime_screen': rng.integers(0, 6, 200)
+    })
+    
+    stats = score_batch(cohort, models=models, chunksize=64)
+    scored = stats['scored']
+    if len(scored) != len(cohort):
+        print(f"  ✗ Expected {len(cohort)} scored rows, got {len(scored)}")
+        return False
+    
+    for i, row in cohort.iterrows():
+        user_data = row.to_dict()
+        user_data['age_numeric'] = 14 if row['age_group'] == AGE_GROUPS[0] else 17
+        cluster, _ = predict_clusters(user_data, "Teen", *models)
+        if cluster[0] != scored.loc[i, 'cluster']:
+            print(f"  ✗ Row {i} scored differently in batch mode")
+            return False
+    
+    print(f"  ✓ Batch scoring matches single scoring ({stats['rows_per_second']:,.0f} rows/s)")
+    
+    # A model failing on its rows is counted and flagged, not hidden in cluster 0
+    class BrokenKernel:
+        calibration = None
+        def predict(self, features):
+            raise ValueError("features don't match the model")
+    
+    if stats['fallback_rows'] != 0 or scored['fallback'].any():
+        print("  ✗ Rows fell back with working models")
+        return False
+    broken = score_batch(cohort, models=(BrokenKernel(), models[1]), chunksize=64)
+    if broken['fallback_rows'] != len(cohort) or not broken['scored']['fallback'].all():
+        print(f"  ✗ Expected {len(cohort)} fallback rows, got {broken['fallback_rows']}")
+        return False
+    print("  ✓ Rows a failing model couldn't score are flagged as fallback")
+    return True
+
+def test_startup_imports():
+    """Check if the app starts without the heavy libraries it only needs later"""
+    print("Checking startup imports...")
+    
+    try:
+        from wellness.importtime import check_budget, measure, startup_imports
+        report, modules = measure(startup_imports("app.py"), runs=1)
+        
+        # Timings vary between machines, so only the deferred imports are checked here
+        deferred = [violation for violation in check_budget(report, modules, budget={}) if "deferred" in violation]
+        if deferred:
+            print(f"  ✗ {'; '.join(deferred)}")
+            return False
+        
+        print(f"  ✓ Startup imports take {report['total']:.0f} ms with no heavy libraries")
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check startup imports: {e}")
+        return False
+
+def test_page_modules():
+    """Check if every page is its own module, imported only when the page is visited"""
+    print("Checking page modules...")
+    
+    try:
+        import importlib
+        import subprocess
+        import sys
+        from dashboard.navigation import PAGES
+        from wellness.timing import RenderStats
+        
+        # A fresh interpreter, so pages imported by other tests don't count
+        loaded = subprocess.run(
+            [sys.executable, "-c", "import sys\nimport dashboard.navigation, dashboard.services\n"
+             "print(','.join(m for m in sys.modules if m.startswith('dashboard.pages.')))"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+        if loaded:
+            print(f"  ✗ Pages imported before they're visited: {loaded}")
+            return False
+        
+        for name in PAGES:
+            if not callable(getattr(importlib.import_module(f"dashboard.pages.{name}"), "render", None)):
+                print(f"  ✗ dashboard/pages/{name}.py has no render()")
+                return False
+        print(f"  ✓ {len(PAGES)} page modules, imported on first visit")
+        
+        stats = RenderStats()
+        for seconds in (0.5, 0.02, 0.01, 0.03):
+            stats.record("research", seconds)
+        report = stats.report()["research"]
+        if report["renders"] != 4 or round(report["cold_ms"]) != 500 or round(report["warm_ms"]) != 20:
+            print(f"  ✗ Unexpected cold/warm times: {report}")
+            return False
+        print("  ✓ Cold and warm render times are kept per page")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check page modules: {e}")
+        return False
+
+def test_scoring_service():
+    """Check if the HTTP scoring service gives the same answers as scoring in-process"""
+    print("Testing the scoring service...")
+    
+    try:
+        from wellness.loadgen import random_answers, run_load
+        from wellness.service import ScoringClient, ScoringService, serve_in_background
+        
+        service = ScoringService()
+        server, url = serve_in_background(service)
+        try:
+            local, remote = ScoringClient(service=service), ScoringClient(url)
+            answers = random_answers(300, seed=11)
+            
+            single = [remote.assess(row) for row in answers[:50]]
+            if single != [local.assess(row) for row in answers[:50]]:
+                print("  ✗ HTTP and in-process scoring disagree")
+                return False
+            
+            batch = remote.batch("assess", answers)
+            for row, result in zip(answers, batch):
+                expected = local.assess(row)
+                if abs(result.pop('confidence') - expected.pop('confidence')) > 1e-9 or result != expected:
+                    print(f"  ✗ Batch scored {row} differently: {result} vs {expected}")
+                    return False
+            
+            risk = remote.risk(answers[0])
+            if set(risk) != {'dataset_used', 'cluster', 'risk_score', 'risk_level', 'risk_factors'}:
+                print(f"  ✗ Unexpected risk fields: {sorted(risk)}")
+                return False
+            print(f"  ✓ Single and batch endpoints match in-process scoring ({len(answers)} users)")
+            
+            try:
+                remote.predict_cluster({'age_group': answers[0]['age_group']})
+                print("  ✗ Incomplete answers were accepted")
+                return False
+            except ValueError:
+                pass
+            print("  ✓ Incomplete answers are rejected")
+            
+            # Malformed choices are a bad request (400), not a server error
+            import urllib.error
+            import urllib.request
+            for bad in ({**answers[0], 'age_group': ["x"]}, {**answers[0], 'phone_bed': "maybe"}):
+                request = urllib.request.Request(f"{url}/assess", data=json.dumps(bad).encode(), method="POST")
+                try:
+                    urllib.request.urlopen(request, timeout=5)
+                    print(f"  ✗ Malformed answers were accepted: {bad}")
+                    return False
+                except urllib.error.HTTPError as e:
+                    if e.code != 400:
+                        print(f"  ✗ Malformed answers got {e.code} instead of 400")
+                        return False
+            print("  ✓ Malformed answers get a 400")
+            
+            # A model failing on the answers falls back visibly, with model: False
+            class BrokenKernel:
+                calibration = None
+                def predict(self, features):
+                    raise ValueError("features don't match the model")
+            
+            broken = ScoringService(load_model=lambda dataset_type: BrokenKernel(), load_lookup=lambda: None)
+            results = [broken.assess(answers[0])] + broken.assess_batch(answers[:20])
+            if any(result['model'] or result['cluster'] != 0 for result in results):
+                print("  ✗ Answers a failing model couldn't score were reported as model predictions")
+                return False
+            print("  ✓ Answers a failing model couldn't score are reported with model: False")
+            
+            stats = run_load(remote, "risk", requests=200, concurrency=4)
+            if stats['errors'] or stats['requests'] != 200 or not stats['p50_ms'] <= stats['p99_ms']:
+                print(f"  ✗ Unexpected load test results: {stats}")
+                return False
+            print(f"  ✓ Load test: p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms, "
+                  f"{stats['requests_per_second']:,.0f} requests/s")
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't test the scoring service: {e}")
+        return False
+
+def test_micro_batching():
+    """Check if concurrent single requests are scored in batches with the same results"""
+    print("Testing micro-batching...")
+    
+    try:
+        import threading
+        from wellness.dispatcher import MicroBatcher
+        from wellness.loadgen import random_answers
+        from wellness.service import ScoringService
+        
+        reference = ScoringService()
+        service = ScoringService(max_batch=16, max_wait=0.05)
+        answers = random_answers(64, seed=5)
+        results = [None] * len(answers)
+        
+        def submit(i):
+            results[i] = service.call("assess", answers[i])
+        
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(len(answers))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        for row, result in zip(answers, results):
+            expected = reference.assess(row)
+            if abs(result.pop('confidence') - expected.pop('confidence')) > 1e-9 or result != expected:
+                print(f"  ✗ Batched scoring of {row} differs: {result} vs {expected}")
+                return False
+        batcher = service.batcher
+        if batcher.rows != len(answers) or batcher.batches >= len(answers) or batcher.mean_batch_size() > 16:
+            print(f"  ✗ {batcher.rows} rows in {batcher.batches} batches, expected batches of up to 16")
+            return False
+        print(f"  ✓ {len(answers)} concurrent requests scored in {batcher.batches} batches, same results")
+        
+        # A bad request is rejected on its own instead of failing its batch
+        try:
+            service.call("risk", {'age_group': answers[0]['age_group']})
+            print("  ✗ Incomplete answers were accepted")
+            return False
+        except ValueError:
+            pass
+        
+        # Malformed answers sent with good ones only fail their own caller
+        malformed = [{**answers[0], 'age_group': ["x"]}, {**answers[1], 'sleep_quality': 3},
+                     {**answers[2], 'daily_usage': float('nan')}]
+        mixed = malformed + answers[3:11]
+        outcomes = [None] * len(mixed)
+        
+        def submit_mixed(i):
+            try:
+                outcomes[i] = service.call("assess", mixed[i])
+            except ValueError as e:
+                outcomes[i] = e
+        
+        threads = [threading.Thread(target=submit_mixed, args=(i,)) for i in range(len(mixed))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if not all(isinstance(outcome, ValueError) for outcome in outcomes[:len(malformed)]):
+            print(f"  ✗ Malformed answers were accepted: {outcomes[:len(malformed)]}")
+            return False
+        if not all(isinstance(outcome, dict) for outcome in outcomes[len(malformed):]):
+            print("  ✗ Good requests failed along with malformed ones")
+            return False
+        
+        # A row that fails its batch is scored on its own; the rest of the batch still succeeds
+        def score_rows(rows):
+            return [1 / row for row in rows]
+        
+        isolating = MicroBatcher(score_rows, max_batch=4, max_wait=0.05)
+        futures = [isolating.submit(row) for row in (1, 0, 2, 4)]
+        if not isinstance(futures[1].exception(timeout=5), ZeroDivisionError):
+            print("  ✗ A failing row wasn't reported to its caller")
+            return False
+        if [futures[i].result(timeout=5) for i in (0, 2, 3)] != [1.0, 0.5, 0.25]:
+            print("  ✗ Rows batched with a failing one didn't get their results")
+            return False
+        isolating.close()
+        
+        # A batch where every row fails is reported to every caller in it
+        failing = MicroBatcher(lambda rows: 1 / 0, max_batch=4, max_wait=0.01)
+        futures = [failing.submit(i) for i in range(4)]
+        if not all(isinstance(future.exception(timeout=5), ZeroDivisionError) for future in futures):
+            print("  ✗ A failed batch wasn't reported to its callers")
+            return False
+        failing.close()
+        service.batcher.close()
+        print("  ✓ Errors reach the callers they belong to")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't test micro-batching: {e}")
+        return False
+
+def test_warm_up():
+    """Check if warm-up fills the model and figure caches, and readiness only flips afterwards"""
+    print("Testing warm-up...")
+    
+    try:
+        import json
+        import os
+        import tempfile
+        import urllib.error
+        import urllib.request
+        from dashboard import services
+        from dashboard.serve import Readiness, serve_readiness
+        from dashboard.warmup import SAMPLE_ANSWERS, warm_up
+        
+        ready_file = os.path.join(tempfile.mkdtemp(), "dashboard.ready")
+        with open(ready_file, "w") as f:
+            f.write("left over")
+        readiness = Readiness(ready_file)
+        server = serve_readiness(readiness, 0, host="127.0.0.1")
+        url = f"http://127.0.0.1:{server.server_address[1]}/ready"
+        try:
+            if os.path.exists(ready_file):
+                print("  ✗ A ready file from an earlier run was kept")
+                return False
+            try:
+                urllib.request.urlopen(url, timeout=5)
+                print("  ✗ Ready before warming up")
+                return False
+            except urllib.error.HTTPError as e:
+                if e.code != 503:
+                    print(f"  ✗ Unexpected status while warming up: {e.code}")
+                    return False
+            
+            readiness.steps = warm_up(pages=["research"], themes=["dark"], progress=readiness.progress)
+            names = [name for name, _ in readiness.steps]
+            expected = [f"prediction: {dataset_type}" for dataset_type in SAMPLE_ANSWERS] + ["page: research (dark)"]
+            if not all(name in names for name in expected):
+                print(f"  ✗ Missing warm-up steps: {names}")
+                return False
+            if any(services.load_model(dataset_type)[0] is None for dataset_type in SAMPLE_ANSWERS):
+                print("  ✗ Models weren't loaded")
+                return False
+            cache, version = services.load_figure_cache(), services.load_data().version
+            if cache.get('research_performance', version, "dark") is None:
+                print("  ✗ Research figures weren't cached for the dark theme")
+                return False
+            print(f"  ✓ {len(names)} warm-up steps fill the data, model and figure caches")
+            
+            readiness.mark_ready()
+            with urllib.request.urlopen(url, timeout=5) as response:
+                status = response.status
+            with open(ready_file) as f:
+                written = json.load(f)
+            if status != 200 or written['status'] != "ready" or "page: research (dark)" not in written['warm_up_ms']:
+                print(f"  ✗ Not marked ready: {status}, {written}")
+                return False
+            print("  ✓ Ready file and /ready flip once warm-up is done")
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't test warm-up: {e}")
+        return False
+
 def run_all_integration_tests():
     """Run all my integration tests"""
     print("Running integration tests...")
     
     tests_passed = 0
-    total_tests = 3
+    total_tests = 9
     
     # Test 1: Data works together
     if test_data_works_together():
@@ -113,6 +472,30 @@ def run_all_integration_tests():
     if test_everything_connects():
         tests_passed += 1
     
+    # Test 4: Batch scoring
+    if test_batch_scoring():
+        tests_passed += 1
+    
+    # Test 5: Startup imports
+    if test_startup_imports():
+        tests_passed += 1
+    
+    # Test 6: Page modules
+    if test_page_modules():
+        tests_passed += 1
+    
+    # Test 7: Scoring service
+    if test_scoring_service():
+        tests_passed += 1
+    
+    # Test 8: Micro-batching
+    if test_micro_batching():
+        tests_passed += 1
+    
+    # Test 9: Warm-up and readiness
+    if test_warm_up():
+        tests_passed += 1
+    
     if tests_passed == total_tests:
         print("✅ All integration tests work!")
         return True
@@ -27,10 +27,16 @@ def test_no_passwords_in_code():
     # Check password patterns
     dangerous_patterns = ['password=', 'secret=', 'key=', 'token=']
     
-    # Check app.py file
+    # Check app.py and the page modules it loads
     try:
-        with open(os.path.join(parent_dir, 'app.py'), 'r', encoding='utf-8') as f:
-            app_content = f.read().lower()
+        app_files = [os.path.join(parent_dir, 'app.py')]
+        for folder, _, names in os.walk(os.path.join(parent_dir, 'dashboard')):
+            app_files.extend(os.path.join(folder, name) for name in names if name.endswith('.py'))
+        
+        app_content = ""
+        for path in app_files:
+            with open(path, 'r', encoding='utf-8') as f:
+                app_content += f.read().lower()
             
         found_passwords = False
         for pattern in dangerous_patterns:
@@ -4,6 +4,7 @@ Simple Tests - Digital Wellness Dashboard App
 """
 
 import os
+import numpy as np
 import pandas as pd
 import json
 
@@ -92,12 +93,820 @@ def test_recommendations():
         print("  ✗ Can't read recommendations file!")
         return False
 
+def test_social_predictor():
+    """Check if the hierarchical model can place new users"""
+    print("Checking social media predictions...")
+    
+    try:
+        from wellness.models import load_models
+        teen_model, teen_scaler, social_model, social_scaler = load_models()
+        
+        # Training users should land back in their own clusters
+        social_data = pd.read_csv("data/social_processed.csv")
+        features = social_data[list(social_scaler.feature_names_in_)]
+        predicted = social_model.predict(social_scaler.transform(features))
+        agreement = (predicted == social_data['cluster'].to_numpy()).mean()
+        
+        if agreement == 1.0:
+            print("  ✓ Every training user keeps their cluster")
+            return True
+        else:
+            print(f"  ✗ Only {agreement:.1%} of training users keep their cluster!")
+            return False
+    except Exception as e:
+        print(f"  ✗ Can't predict social media clusters: {e}")
+        return False
+
+def test_kernel_parity():
+    """Check if the fused kernels give the same groups as the trained models"""
+    print("Checking fused scoring kernels...")
+    
+    try:
+        from wellness.kernel import ScoringKernel
+        from wellness.models import load_models
+        teen_model, teen_scaler, social_model, social_scaler = load_models()
+        
+        # Every teen user, scored both ways
+        teen_data = pd.read_csv("data/teen_processed.csv")
+        features = teen_data[list(teen_scaler.feature_names_in_)].to_numpy()
+        expected = teen_model.predict(teen_scaler.transform(teen_data[list(teen_scaler.feature_names_in_)]))
+        fused = ScoringKernel.from_kmeans(teen_model, teen_scaler).predict(features)
+        if not (fused == expected).all():
+            print(f"  ✗ Teen kernel disagrees on {(fused != expected).sum()} users!")
+            return False
+        print(f"  ✓ Teen kernel matches K-Means on all {len(teen_data)} users")
+        
+        # Every social media user, scored both ways
+        social_data = pd.read_csv("data/social_processed.csv")
+        features = social_data[list(social_scaler.feature_names_in_)].to_numpy()
+        expected = social_model.predict(social_scaler.transform(social_data[list(social_scaler.feature_names_in_)]))
+        fused = ScoringKernel.from_ward(social_model, social_scaler).predict(features)
+        if not (fused == expected).all():
+            print(f"  ✗ Social kernel disagrees on {(fused != expected).sum()} users!")
+            return False
+        print(f"  ✓ Social kernel matches the hierarchical model on all {len(social_data)} users")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check scoring kernels: {e}")
+        return False
+
+def test_lookup_table():
+    """Check if precomputed outcomes match scoring the answers live"""
+    print("Checking assessment lookup table...")
+    
+    try:
+        import random
+        from wellness.lookup import AXES, build_table, load_table, AssessmentLookup
+        from wellness.models import load_kernels
+        from wellness.risk import assess_risk, risk_level_for
+        from wellness.scoring import AGE_MAPPING, DEFAULT_AGE, dataset_for_age, predict_clusters
+        
+        kernels = load_kernels()
+        table = load_table()
+        if table is None:
+            print("  ✓ No current table on disk, building one")
+            built = build_table(kernels)
+            table = AssessmentLookup(built['cluster'], built['risk_score'], built['risk_level'],
+                                     built['factor_mask'], built['version'])
+        
+        # Random answers from the form's options
+        rng = random.Random(3)
+        for _ in range(500):
+            answers = {name: rng.choice(values) for name, values in AXES}
+            answers['age_numeric'] = AGE_MAPPING.get(answers['age_group'], DEFAULT_AGE)
+            dataset_used = dataset_for_age(answers['age_group'])
+            
+            clusters, _ = predict_clusters(answers, dataset_used, *kernels)
+            risk_score, risk_factors = assess_risk(answers, dataset_used)
+            expected = (int(clusters[0]), risk_score, risk_level_for(dataset_used, clusters[0], risk_score), risk_factors)
+            
+            if table.lookup(answers) != expected:
+                print(f"  ✗ Table disagrees for {answers}")
+                return False
+        
+        print("  ✓ Lookup table matches live scoring")
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check lookup table: {e}")
+        return False
+
+def test_risk_rules():
+    """Check if the risk rules score users the same one at a time or all together"""
+    print("Checking risk scoring rules...")
+    
+    try:
+        from wellness.risk import assess_risk, evaluate_risk, factors_from_mask
+        
+        answers = pd.DataFrame({
+            'daily_usage': [7, 9, 2, 12],
+            'social_media': [4, 5, 0, 8],
+            'sleep_hours': [5, 6, 8, 4],
+            'bedtime_screen': [3, 2, 0, 5],
+            'late_night_usage': ["Every night", "Sometimes (3-4 times/week)", "Never", "Often (5-6 times/week)"],
+            'sleep_quality': ["Poor", "Average", "Excellent", "Very Poor"],
+            'phone_bed': ["Yes, next to my bed", "Yes, but across the room", "No, I charge it outside", "Yes, next to my bed"],
+            'dataset_used': ["Teen", "Social Media", "Teen", "Social Media"]
+        })
+        
+        # Worked out by hand from the rules
+        expected_scores = [2 + 2 + 3 + 3 + 4 + 2 + 2, 2 + 2 + 1 + 1 + 2 + 1, 0, 2 + 2 + 3 + 3 + 3 + 3 + 2]
+        
+        result = evaluate_risk(answers)
+        if list(result['risk_score']) != expected_scores:
+            print(f"  ✗ Expected scores {expected_scores}, got {list(result['risk_score'])}")
+            return False
+        
+        for i, row in answers.iterrows():
+            risk_score, risk_factors = assess_risk(row.to_dict(), row['dataset_used'])
+            if risk_score != expected_scores[i] or risk_factors != factors_from_mask(result['factor_mask'][i]):
+                print(f"  ✗ User {i} scores differently on their own")
+                return False
+        
+        print("  ✓ Risk rules score users correctly")
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check risk rules: {e}")
+        return False
+
+def test_confidence_calibration():
+    """Check if per-user confidence lines up with the research silhouette scores"""
+    print("Checking per-user confidence...")
+    
+    try:
+        from wellness.models import load_kernels
+        from wellness.scoring import SOCIAL_CONFIDENCE, SOCIAL_FEATURES, TEEN_CONFIDENCE, TEEN_FEATURES
+        teen_kernel, social_kernel = load_kernels()
+        
+        checks = [
+            (teen_kernel, "data/teen_processed.csv", TEEN_FEATURES, TEEN_CONFIDENCE),
+            (social_kernel, "data/social_processed.csv", SOCIAL_FEATURES, SOCIAL_CONFIDENCE)
+        ]
+        for kernel, path, features, silhouette in checks:
+            data = pd.read_csv(path)
+            confidence = kernel.confidence(data[features].to_numpy())
+            
+            if confidence.min() < 0 or confidence.max() > 1:
+                print(f"  ✗ Confidence outside 0-1 for {path}")
+                return False
+            
+            # Averaged over the research users it should come within 0.02 of the silhouette score
+            if abs(confidence.mean() - silhouette) > 0.02:
+                print(f"  ✗ Average confidence {confidence.mean():.3f} is far from {silhouette}")
+                return False
+            print(f"  ✓ Confidence for {path} ranges {confidence.min():.3f}-{confidence.max():.3f} (avg {confidence.mean():.3f})")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check confidence: {e}")
+        return False
+
+def test_model_artifacts():
+    """Check if the compact model artifacts score exactly like the pickles"""
+    print("Checking model artifacts...")
+    
+    try:
+        import subprocess
+        import sys
+        import tempfile
+        from wellness.artifacts import export_kernel, load_kernel
+        from wellness.models import build_kernels
+        from wellness.scoring import SOCIAL_FEATURES, TEEN_FEATURES
+        
+        checks = [
+            ("data/teen_processed.csv", TEEN_FEATURES),
+            ("data/social_processed.csv", SOCIAL_FEATURES)
+        ]
+        with tempfile.TemporaryDirectory() as folder:
+            for kernel, (path, features) in zip(build_kernels(), checks):
+                artifact = os.path.join(folder, "model.npz")
+                export_kernel(kernel, artifact, "test")
+                loaded = load_kernel(artifact)
+                
+                data = pd.read_csv(path)[features].to_numpy()
+                if not (loaded.predict(data) == kernel.predict(data)).all():
+                    print(f"  ✗ Artifact predicts differently for {path}")
+                    return False
+                if not np.allclose(loaded.confidence(data), kernel.confidence(data)):
+                    print(f"  ✗ Artifact confidence differs for {path}")
+                    return False
+                
+                # A damaged artifact must not load
+                with np.load(artifact) as saved:
+                    arrays = dict(saved)
+                arrays['centroids'] = arrays['centroids'] + 1
+                np.savez(artifact, **arrays)
+                try:
+                    load_kernel(artifact)
+                    print("  ✗ Corrupted artifact was loaded")
+                    return False
+                except ValueError:
+                    pass
+        print("  ✓ Artifacts match the pickled models")
+        
+        # Changing a file an artifact was converted from converts it again
+        import hashlib
+        import shutil
+        from wellness import artifacts
+        from wellness.models import load_kernel as load_dataset_kernel
+        with tempfile.TemporaryDirectory() as folder:
+            model_dir, data_dir = os.path.join(folder, "models"), os.path.join(folder, "data")
+            shutil.copytree("models", model_dir)
+            os.makedirs(data_dir)
+            for name in artifacts.SOURCE_DATA["Teen"] + artifacts.SOURCE_DATA["Social Media"]:
+                shutil.copy(os.path.join("data", name), data_dir)
+            if not artifacts.is_current("Teen", model_dir, data_dir):
+                print("  ✗ Shipped artifact isn't current with the shipped pickles and data")
+                return False
+            
+            changed = os.path.join(data_dir, "teen_processed.csv")
+            with open(changed, "a") as f:
+                f.write("\n")
+            if artifacts.is_current("Teen", model_dir, data_dir):
+                print("  ✗ Changed research data went unnoticed")
+                return False
+            load_dataset_kernel("Teen", model_dir, data_dir)
+            recorded = artifacts.read_header(artifacts.artifact_path("Teen", model_dir))['sources']
+            with open(changed, "rb") as f:
+                changed_sha256 = hashlib.sha256(f.read()).hexdigest()
+            if recorded.get("teen_processed.csv") != changed_sha256:
+                print("  ✗ Artifact wasn't converted again after its data changed")
+                return False
+        print("  ✓ Artifacts are converted again when their pickles or data change")
+        
+        # Loading the shipped artifacts shouldn't need sklearn
+        code = "import sys; from wellness.models import load_kernels; load_kernels(); print('sklearn' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True).stdout.strip()
+        if output != "False":
+            print(f"  ✗ Loading artifacts imported sklearn ({output})")
+            return False
+        print("  ✓ Artifacts load without sklearn")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check model artifacts: {e}")
+        return False
+
+def test_lazy_model_loading():
+    """Check if one dataset's model can be loaded and used without the other"""
+    print("Checking per-dataset model loading...")
+    
+    try:
+        from wellness.models import kernel_available, load_kernel, load_kernels
+        from wellness.scoring import predict_clusters
+        both = load_kernels()
+        
+        answers = {
+            'daily_usage': np.arange(1, 17),
+            'social_media': np.arange(16) % 13,
+            'sleep_hours': np.arange(16) % 10 + 3,
+            'bedtime_screen': np.arange(16) % 6
+        }
+        for dataset_type in ["Teen", "Social Media"]:
+            if not kernel_available(dataset_type):
+                print(f"  ✗ {dataset_type} model reported as missing")
+                return False
+            
+            # Score with only this dataset's model loaded
+            kernel = load_kernel(dataset_type)
+            single = (kernel, None) if dataset_type == "Teen" else (None, kernel)
+            clusters, confidence = predict_clusters(answers, dataset_type, *single)
+            expected_clusters, expected_confidence = predict_clusters(answers, dataset_type, *both)
+            if not (clusters == expected_clusters).all() or not np.allclose(confidence, expected_confidence):
+                print(f"  ✗ {dataset_type} model scores differently when loaded on its own")
+                return False
+        
+        print("  ✓ Each dataset's model loads and scores on its own")
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check model loading: {e}")
+        return False
+
+def test_columnar_cache():
+    """Check if the columnar cache loads the same data as the CSV and notices changes"""
+    print("Checking columnar dataset cache...")
+    
+    try:
+        import shutil
+        import tempfile
+        from wellness.columnar import cache_path, is_current, load_frame
+        
+        with tempfile.TemporaryDirectory() as folder:
+            csv_path = os.path.join(folder, "social_processed.csv")
+            shutil.copy("data/social_processed.csv", csv_path)
+            cache_dir = os.path.join(folder, "cache")
+            
+            loaded = load_frame(csv_path, cache_dir)
+            pd.testing.assert_frame_equal(loaded, pd.read_csv(csv_path))
+            if not is_current(csv_path, cache_path(csv_path, cache_dir)):
+                print("  ✗ Fresh cache reported as out of date")
+                return False
+            print(f"  ✓ Cached columns match the CSV ({len(loaded)} rows)")
+            
+            # Editing the CSV must trigger a new conversion
+            before = loaded.copy()
+            edited = pd.read_csv(csv_path).head(100)
+            edited[edited.select_dtypes('number').columns] = 9
+            edited.to_csv(csv_path, index=False)
+            if is_current(csv_path, cache_path(csv_path, cache_dir)) or len(load_frame(csv_path, cache_dir)) != 100:
+                print("  ✗ Cache didn't pick up the changed CSV")
+                return False
+            print("  ✓ Changed CSV is converted again")
+            
+            # Frames mapped before the conversion keep their data
+            pd.testing.assert_frame_equal(loaded, before)
+            print("  ✓ Frames loaded earlier are untouched by the new conversion")
+            
+            # Text columns (with missing values) survive without pickling
+            text_path = os.path.join(folder, "text.csv")
+            pd.DataFrame({'group': ["Teen", None, "Social Media"], 'hours': [1.5, 2.0, None]}).to_csv(text_path, index=False)
+            pd.testing.assert_frame_equal(load_frame(text_path, cache_dir), pd.read_csv(text_path))
+            print("  ✓ Text columns round-trip")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check columnar cache: {e}")
+        return False
+
+def test_shared_dataset_store():
+    """Check if sessions share the stored datasets without being able to change them"""
+    print("Checking shared dataset store...")
+    
+    try:
+        from wellness.datastore import DatasetStore, enable_copy_on_write
+        # As app.py does at startup (a no-op from pandas 3)
+        enable_copy_on_write()
+        store = DatasetStore()
+        shared = store.load()
+        first, second = store.view(), store.view()
+        
+        # Same memory for every session, nothing copied
+        if not np.shares_memory(first.teen_df['Sleep_Hours'].to_numpy(), second.teen_df['Sleep_Hours'].to_numpy()):
+            print("  ✗ Sessions got separate copies of the data")
+            return False
+        if first.recommendations is not shared.recommendations:
+            print("  ✗ Recommendations were copied")
+            return False
+        print("  ✓ Sessions share one copy of the datasets")
+        
+        # The shared arrays can't be written to directly
+        try:
+            shared.teen_df['Sleep_Hours'].to_numpy()[0] = -1
+            print("  ✗ Shared data was writable")
+            return False
+        except ValueError:
+            pass
+        
+        # A session's writes stay in that session
+        original = shared.teen_df.loc[0, 'Sleep_Hours']
+        first.teen_df.loc[0, 'Sleep_Hours'] = original + 5
+        first.teen_df['extra'] = 1
+        if shared.teen_df.loc[0, 'Sleep_Hours'] != original or second.teen_df.loc[0, 'Sleep_Hours'] != original:
+            print("  ✗ One session's change leaked into the shared data")
+            return False
+        if 'extra' in shared.teen_df.columns:
+            print("  ✗ New column showed up in the shared data")
+            return False
+        print("  ✓ Session changes are copied on write")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check dataset store: {e}")
+        return False
+
+def test_dashboard_summary():
+    """Check if the precomputed summary gives the same numbers as the raw data"""
+    print("Checking dashboard summary...")
+    
+    try:
+        import tempfile
+        from wellness.datastore import DatasetStore
+        from wellness.risk import research_risk
+        from wellness.summary import load_summary
+        store = DatasetStore()
+        datasets = store.load()
+        
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "summary.json")
+            summary = load_summary(datasets, store.version, path)
+            
+            for dataset_type, frame in [("Teen", datasets.teen_df), ("Social Media", datasets.social_df)]:
+                if summary.rows(dataset_type) != len(frame):
+                    print(f"  ✗ Wrong row count for {dataset_type}")
+                    return False
+                if summary.cluster_counts(dataset_type) != frame['cluster'].value_counts().sort_index().tolist():
+                    print(f"  ✗ Wrong cluster counts for {dataset_type}")
+                    return False
+                
+                for column in frame.columns.drop('cluster'):
+                    for cluster in [None, 0, 1]:
+                        values = frame[column] if cluster is None else frame[frame['cluster'] == cluster][column]
+                        stats = summary.stats(dataset_type, column, cluster)
+                        expected = [values.mean(), values.std(), values.quantile(0.25), values.median(), values.max()]
+                        if not np.allclose([stats['mean'], stats['std'], stats['q1'], stats['median'], stats['max']], expected):
+                            print(f"  ✗ Wrong statistics for {dataset_type} {column} (cluster {cluster})")
+                            return False
+                        if sum(stats['histogram']) != len(values):
+                            print(f"  ✗ Histogram of {dataset_type} {column} doesn't cover every user")
+                            return False
+                
+                levels = np.bincount(research_risk(frame, dataset_type)['risk_level_code'], minlength=4)
+                if list(summary.risk_level_counts(dataset_type)) != list(levels):
+                    print(f"  ✗ Wrong risk level counts for {dataset_type}")
+                    return False
+            print("  ✓ Summary matches the raw data")
+            
+            # A new data version must rebuild the saved summary
+            if load_summary(datasets, "other-version", path).version != "other-version":
+                print("  ✗ Stale summary was reused")
+                return False
+            print("  ✓ Summary is rebuilt for new data")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check dashboard summary: {e}")
+        return False
+
+def test_aggregate_charts():
+    """Check if histogram and box charts stay the same size when the data grows"""
+    print("Checking aggregate charts...")
+    
+    try:
+        from wellness.charts import box_figure, histogram_figure
+        from wellness.datastore import DatasetStore
+        from wellness.summary import HISTOGRAM_BINS, DashboardSummary, build_summary
+        datasets = DatasetStore().load()
+        colors = {0: '#2E8B57', 1: '#FF6347'}
+        
+        sizes = []
+        for copies in [1, 20]:
+            teen_df = datasets.teen_df.iloc[np.arange(len(datasets.teen_df) * copies) % len(datasets.teen_df)]
+            summary = DashboardSummary(build_summary(datasets._replace(teen_df=teen_df.reset_index(drop=True)), "test"))
+            histogram = histogram_figure(summary, "Teen", 'Screen_Time_Before_Bed', colors)
+            box = box_figure(summary, "Teen", 'Screen_Time_Before_Bed')
+            
+            if any(len(trace.x) > HISTOGRAM_BINS for trace in histogram.data) or len(box.data[0].x) != 2:
+                print("  ✗ Charts carry more points than bins")
+                return False
+            if sum(sum(trace.y) for trace in histogram.data) != len(teen_df):
+                print("  ✗ Histogram bars don't add up to every user")
+                return False
+            sizes.append(len(histogram.to_json()) + len(box.to_json()))
+        
+        # 20x the rows should only change the digits of the counts
+        if sizes[1] > sizes[0] * 1.1:
+            print(f"  ✗ Chart payload grew from {sizes[0]} to {sizes[1]} bytes")
+            return False
+        print(f"  ✓ Chart payload stays at ~{sizes[1] // 1024} KB with 20x the rows")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check aggregate charts: {e}")
+        return False
+
+def test_density_grids():
+    """Check if the density view counts every user once, at a fixed payload size"""
+    print("Checking density grids...")
+    
+    try:
+        from wellness.datastore import DatasetStore
+        from wellness.density import dashboard_grids, density_figure
+        datasets = DatasetStore().load()
+        grids = dashboard_grids(datasets)
+        
+        teen_grid = grids['teen_social_sleep']
+        expected = datasets.teen_df['cluster'].value_counts().sort_index().tolist()
+        if teen_grid.counts.sum(axis=(1, 2)).tolist() != expected:
+            print("  ✗ Teen density layers don't match the cluster sizes")
+            return False
+        total = len(datasets.teen_df) + len(datasets.social_df)
+        if grids['research_groups'].counts.sum() != total or grids['screen_sleep_risk'].counts.sum() != total:
+            print("  ✗ Research density grids lose users")
+            return False
+        print("  ✓ Every user is counted in the density grids")
+        
+        # 20x the rows only changes the numbers in the cells
+        colors = {"0": '#2E8B57', "1": '#FF6347'}
+        grown = datasets.teen_df.iloc[np.arange(len(datasets.teen_df) * 20) % len(datasets.teen_df)]
+        small = len(density_figure(teen_grid, colors).to_json())
+        large = len(density_figure(dashboard_grids(datasets._replace(teen_df=grown))['teen_social_sleep'], colors).to_json())
+        if large > small * 1.5:
+            print(f"  ✗ Density payload grew from {small} to {large} bytes")
+            return False
+        print(f"  ✓ Density payload stays at ~{large // 1024} KB with 20x the rows")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check density grids: {e}")
+        return False
+
+def test_stratified_sampler():
+    """Check if chart samples are repeatable, stratified and shared without copies"""
+    print("Checking chart samples...")
+    
+    try:
+        from wellness.datastore import DatasetStore
+        from wellness.sampling import SampleStore
+        teen_df = DatasetStore().load().teen_df
+        samples = SampleStore()
+        
+        first = samples.indices('teen_scatter', teen_df, 500)
+        if not np.array_equal(first, SampleStore().indices('teen_scatter', teen_df, 500)):
+            print("  ✗ The same chart got different samples")
+            return False
+        if len(np.unique(first)) != 500:
+            print("  ✗ Sample has repeated rows")
+            return False
+        print("  ✓ Samples are the same in every store")
+        
+        sample = samples.sample('teen_scatter', teen_df, 500)
+        expected = teen_df['cluster'].value_counts(normalize=True).sort_index() * 500
+        counts = sample['cluster'].value_counts().sort_index()
+        if (abs(counts - expected) > 1).any():
+            print(f"  ✗ Sample clusters {counts.tolist()} aren't proportional to the data")
+            return False
+        print(f"  ✓ Sample keeps the cluster proportions ({counts.tolist()})")
+        
+        again = samples.sample('teen_scatter', teen_df, 500)
+        values = again['Sleep_Hours'].to_numpy()
+        if not np.shares_memory(values, sample['Sleep_Hours'].to_numpy()) or values.flags.writeable:
+            print("  ✗ Reruns don't get a read-only view of the same sample")
+            return False
+        print("  ✓ Reruns share one read-only sample")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check chart samples: {e}")
+        return False
+
+def test_exact_correlation():
+    """Check if the Research correlation comes from every row, not the plotted sample"""
+    print("Checking screen time vs sleep correlation...")
+    
+    try:
+        from wellness.datastore import DatasetStore
+        from wellness.summary import build_summary, DashboardSummary
+        store = DatasetStore()
+        datasets = store.load()
+        summary = DashboardSummary(build_summary(datasets, store.version))
+        
+        screen = np.concatenate([datasets.teen_df['Daily_Usage_Hours'], datasets.social_df['Screen.Time(hrs)']])
+        sleep = np.concatenate([datasets.teen_df['Sleep_Hours'], datasets.social_df[' Sleep Duration ']])
+        slope, intercept, r = summary.correlation('screen_sleep')
+        if not np.allclose([slope, intercept], np.polyfit(screen, sleep, 1)):
+            print("  ✗ Trend line doesn't match a fit over every row")
+            return False
+        if not np.isclose(r, np.corrcoef(screen, sleep)[0, 1]):
+            print("  ✗ Correlation doesn't match every row")
+            return False
+        print(f"  ✓ Exact correlation over {len(screen):,} users (r={r:.3f})")
+        
+        teen_r = summary.correlation('screen_sleep', "Teen")[2]
+        if not np.isclose(teen_r, datasets.teen_df['Daily_Usage_Hours'].corr(datasets.teen_df['Sleep_Hours'])):
+            print("  ✗ Per-dataset correlation is wrong")
+            return False
+        print("  ✓ Per-dataset correlation matches pandas")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check correlation: {e}")
+        return False
+
+def test_figure_cache():
+    """Check if cached figures are built once, evicted least recently used first, and render unchanged"""
+    print("Checking figure cache...")
+    
+    try:
+        import plotly.express as px
+        import plotly.io
+        import plotly.tools
+        from wellness.figures import FigureCache
+        cache = FigureCache(max_figures=2)
+        builds = []
+        
+        def build():
+            builds.append(1)
+            return px.bar(x=['Low', 'High'], y=[3, 1], title="Risk")
+        
+        first = cache.figure('risk', 'v1', 'dark', build)
+        again = cache.figure('risk', 'v1', 'dark', build)
+        if len(builds) != 1 or (cache.hits, cache.misses) != (1, 1):
+            print("  ✗ Cached figure was built again")
+            return False
+        cache.figure('risk', 'v2', 'dark', build)
+        cache.figure('risk', 'v1', 'light', build)
+        if len(builds) != 3:
+            print("  ✗ Data version or theme doesn't change the cache key")
+            return False
+        print("  ✓ Figures are built once per chart, data version and theme")
+        
+        # ('risk', 'v1', 'dark') is the least recently used of the three
+        cache.figure('risk', 'v1', 'dark', build)
+        if len(builds) != 4 or cache.evictions != 2 or cache.stats()['figures'] != 2:
+            print("  ✗ Cache isn't bounded LRU")
+            return False
+        print("  ✓ Cache keeps the most recently used figures")
+        
+        # What st.plotly_chart does with a figure
+        sent = plotly.tools.return_figure_from_figure_or_data(again, validate_figure=True)
+        if plotly.io.to_json(sent, validate=False) != plotly.io.to_json(build(), validate=False):
+            print("  ✗ Cached figure renders differently")
+            return False
+        print("  ✓ Cached figures render like freshly built ones")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check figure cache: {e}")
+        return False
+
+def test_render_timing():
+    """Check if rerun times are recorded for blocks, decorated fragments and stopped runs"""
+    print("Checking rerun timing...")
+    
+    try:
+        from wellness.timing import render_times, timed
+        state = {}
+        
+        with timed(state, "page"):
+            sum(range(1000))
+        
+        @timed(state, "fragment:charts")
+        def charts():
+            return "drawn"
+        
+        if charts() != "drawn":
+            print("  ✗ Timed function lost its return value")
+            return False
+        try:
+            with timed(state, "stopped"):
+                raise RuntimeError("st.stop()")
+        except RuntimeError:
+            pass
+        
+        times = render_times(state)
+        if set(times) != {"page", "fragment:charts", "stopped"} or min(times.values()) < 0:
+            print(f"  ✗ Unexpected times recorded: {times}")
+            return False
+        print("  ✓ Page, fragment and stopped runs are timed")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check rerun timing: {e}")
+        return False
+
+def test_card_templates():
+    """Check if cards render from values with escaping, and every class they use is in the stylesheet"""
+    print("Checking card templates...")
+    
+    try:
+        import re
+        from dashboard import layout, templates
+        
+        card = templates.render("stat_card", {
+            "variant": "fixed", "accent": "red", "icon": "🔴",
+            "title": "Risk Assessment", "value": "<High Risk>", "caption": "Score: 9/15"
+        })
+        if "&lt;High Risk&gt;" not in card or "style=" in card:
+            print(f"  ✗ Card not escaped or still has inline styles: {card}")
+            return False
+        body = templates.join("item", [{"text": "• Sleep & rest"}, {"text": "• Move"}])
+        card = templates.render("info_card", {"accent": "blue", "title": "Tips", "body": body})
+        if card.count('class="card-item"') != 2 or "Sleep &amp; rest" not in card:
+            print(f"  ✗ Rows not nested in the card: {card}")
+            return False
+        print("  ✓ Cards render from a dict of values, escaped")
+        
+        used = set()
+        for template in templates.TEMPLATES.values():
+            for classes in re.findall(r'class="([^"]+)"', template.template):
+                used.update(c for c in classes.split() if "$" not in c)
+        used.update(f"accent-{accent}" for accent in templates.ACCENTS)
+        used.update(f"banner-{tone}" for tone in ["danger", "warning", "success", "purple"])
+        missing = [name for name in sorted(used) if f".{name}" not in layout.CSS]
+        if missing:
+            print(f"  ✗ Classes missing from static/dashboard.css: {missing}")
+            return False
+        if layout.CSS_VERSION not in layout.STYLESHEET:
+            print("  ✗ Stylesheet link isn't versioned")
+            return False
+        print(f"  ✓ {len(used)} card classes defined in static/dashboard.css")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check card templates: {e}")
+        return False
+
+def test_progressive_charts():
+    """Check if a page's text comes before its charts, which are built concurrently and all drawn"""
+    print("Checking progressive charts...")
+    
+    try:
+        from streamlit.testing.v1 import AppTest
+        
+        # Four slow charts, two of them in a fragment; each builder takes 0.3 s
+        script = """
+import time
+import plotly.express as px
+import streamlit as st
+from dashboard import progressive
+
+def slow_bar(label):
+    def build():
+        time.sleep(0.3)
+        return px.bar(x=[label], y=[1])
+    return build
+
+@st.fragment
+@progressive.progressive_charts()
+def section():
+    st.radio("Mode", ["a", "b"])
+    for name in ("c", "d"):
+        progressive.chart(f"test_progressive_{name}", slow_bar(name))
+
+@progressive.progressive_charts()
+def page():
+    st.markdown("Intro")
+    for name in ("a", "b"):
+        progressive.chart(f"test_progressive_{name}", slow_bar(name))
+    section()
+    st.markdown("Outro")
+
+start = time.perf_counter()
+page()
+st.session_state["page_seconds"] = time.perf_counter() - start
+"""
+        at = AppTest.from_string(script, default_timeout=30).run()
+        if at.exception:
+            print(f"  ✗ Page failed: {at.exception[0].value}")
+            return False
+        first_content = at.session_state["render_times"]["first_content"]
+        if len(at.get("plotly_chart")) != 4 or at.markdown[-1].value != "Outro":
+            print("  ✗ Not every chart was drawn in its place")
+            return False
+        if first_content > 0.6:
+            print(f"  ✗ The text waited for the charts ({first_content * 1000:.0f} ms)")
+            return False
+        if at.session_state["page_seconds"] > 0.9:
+            print(f"  ✗ Charts were built one after another ({at.session_state['page_seconds']:.2f} s)")
+            return False
+        print(f"  ✓ Text out in {first_content * 1000:.0f} ms, four 0.3 s charts drawn in "
+              f"{at.session_state['page_seconds']:.2f} s")
+        
+        # The fragment reruns on its own and fills its charts itself
+        at.radio[0].set_value("b").run()
+        if at.exception or len(at.get("plotly_chart")) != 4:
+            print("  ✗ Fragment rerun lost its charts")
+            return False
+        print("  ✓ Fragment reruns draw their own charts")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check progressive charts: {e}")
+        return False
+
+def test_startup_assets():
+    """Check if the declared assets load concurrently, with a timing report, and unused files are skipped"""
+    print("Checking startup assets...")
+    
+    try:
+        from wellness.datastore import ASSETS, UNUSED_FILES, data_version, load_assets
+        
+        datasets, report = load_assets()
+        sequential, sequential_report = load_assets(workers=1)
+        if [entry['asset'] for entry in report] != list(ASSETS) or set(datasets._fields) != set(ASSETS):
+            print(f"  ✗ Report doesn't cover the declared assets: {[entry['asset'] for entry in report]}")
+            return False
+        if any(entry['file'] in UNUSED_FILES for entry in report):
+            print("  ✗ A file no page reads was loaded")
+            return False
+        if not datasets.teen_df.equals(sequential.teen_df) or datasets.recommendations != sequential.recommendations:
+            print("  ✗ Concurrent and sequential loads differ")
+            return False
+        if data_version(report) != data_version(sequential_report):
+            print("  ✗ Data version depends on how the assets were loaded")
+            return False
+        print(f"  ✓ {len(report)} assets load the same concurrently and one by one, "
+              f"{len(UNUSED_FILES)} unused files skipped")
+        
+        if len({entry['thread'] for entry in sequential_report}) != 1:
+            print("  ✗ workers=1 didn't load the assets one after another")
+            return False
+        if any(entry['ms'] < 0 or entry['file_bytes'] <= 0 or entry['loaded_bytes'] <= 0 for entry in report):
+            print(f"  ✗ Missing timings or sizes: {report}")
+            return False
+        print("  ✓ Each asset's load time and size is reported")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Can't check startup assets: {e}")
+        return False
+
 def run_all_unit_tests():
     """Run my basic tests"""
     print("Running simple tests...")
     
     tests_passed = 0
-    total_tests = 3
+    total_tests = 22
     
     # Test 1: Check files
     if test_data_files():
@@ -111,6 +920,82 @@ def run_all_unit_tests():
     if test_recommendations():
         tests_passed += 1
     
+    # Test 4: Social media predictions
+    if test_social_predictor():
+        tests_passed += 1
+    
+    # Test 5: Fused kernels match the models
+    if test_kernel_parity():
+        tests_passed += 1
+    
+    # Test 6: Precomputed outcomes
+    if test_lookup_table():
+        tests_passed += 1
+    
+    # Test 7: Risk scoring rules
+    if test_risk_rules():
+        tests_passed += 1
+    
+    # Test 8: Per-user confidence
+    if test_confidence_calibration():
+        tests_passed += 1
+    
+    # Test 9: Compact model artifacts
+    if test_model_artifacts():
+        tests_passed += 1
+    
+    # Test 10: Per-dataset model loading
+    if test_lazy_model_loading():
+        tests_passed += 1
+    
+    # Test 11: Columnar dataset cache
+    if test_columnar_cache():
+        tests_passed += 1
+    
+    # Test 12: Shared dataset store
+    if test_shared_dataset_store():
+        tests_passed += 1
+    
+    # Test 13: Precomputed dashboard summary
+    if test_dashboard_summary():
+        tests_passed += 1
+    
+    # Test 14: Charts built from aggregates
+    if test_aggregate_charts():
+        tests_passed += 1
+    
+    # Test 15: Density views of the scatter plots
+    if test_density_grids():
+        tests_passed += 1
+    
+    # Test 16: Seeded, stratified chart samples
+    if test_stratified_sampler():
+        tests_passed += 1
+    
+    # Test 17: Exact Research correlation
+    if test_exact_correlation():
+        tests_passed += 1
+    
+    # Test 18: Figure cache
+    if test_figure_cache():
+        tests_passed += 1
+    
+    # Test 19: Rerun timing
+    if test_render_timing():
+        tests_passed += 1
+    
+    # Test 20: Card templates
+    if test_card_templates():
+        tests_passed += 1
+    
+    # Test 21: Progressive charts
+    if test_progressive_charts():
+        tests_passed += 1
+    
+    # Test 22: Startup assets
+    if test_startup_assets():
+        tests_passed += 1
+    
     if tests_passed == total_tests:
         print("✅ All basic tests work!")
         return True
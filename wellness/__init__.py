@@ -0,0 +1,4 @@
+"""
+Digital Wellness Dashboard services
+Scoring, model loading and batch tools shared by the Streamlit app and the command line
+"""
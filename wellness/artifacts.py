@@ -0,0 +1,177 @@
+"""
+Compact model artifacts for the scoring kernels
+
+An artifact is a single .npz holding only what inference needs: scaler
+mean/scale, centroids, Ward weights, the confidence calibration curve and a
+JSON header (feature order, format version, content hash, source files).
+Loading one needs NumPy only; nothing is unpickled.
+
+The header keeps the SHA-256 of every file the artifact was built from: the
+pickles and the research data the centroids and confidence curve come from.
+is_current() compares them with the files on disk, so a retrained model or
+changed data is converted again instead of being shadowed by the old artifact.
+
+Usage:
+    python -m wellness.artifacts    (converts models/*.pkl into models/*.npz)
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from wellness.confidence import ConfidenceCalibration
+from wellness.kernel import ScoringKernel
+
+ARTIFACT_FORMAT = 1
+MODEL_DIR = "models"
+DATA_DIR = "data"
+
+# Artifact file per dataset, and the pickles it is converted from
+ARTIFACTS = {
+    "Teen": "teen_kmeans.npz",
+    "Social Media": "social_hierarchical.npz"
+}
+SOURCE_PICKLES = {
+    "Teen": ["teen_kmeans_model.pkl", "teen_scaler.pkl"],
+    "Social Media": ["social_hierarchical_model.pkl", "social_scaler.pkl"]
+}
+# Research data in data_dir the centroids and confidence calibration are built from
+SOURCE_DATA = {
+    "Teen": ["teen_processed.csv"],
+    "Social Media": ["social_processed.csv"]
+}
+
+
+def artifact_path(dataset_type, model_dir=MODEL_DIR):
+    return os.path.join(model_dir, ARTIFACTS[dataset_type])
+
+
+def source_paths(dataset_type, model_dir=MODEL_DIR, data_dir=DATA_DIR):
+    """Every file an artifact is converted from: its pickles, then its research data"""
+    return ([os.path.join(model_dir, name) for name in SOURCE_PICKLES[dataset_type]]
+            + [os.path.join(data_dir, name) for name in SOURCE_DATA[dataset_type]])
+
+
+def _kernel_arrays(kernel):
+    arrays = {
+        'mean': kernel.mean,
+        'scale': kernel.scale,
+        'centroids': kernel.centroids
+    }
+    if kernel.cluster_weights is not None:
+        arrays['cluster_weights'] = kernel.cluster_weights
+    if kernel.calibration is not None:
+        arrays['calibration_margins'] = kernel.calibration.margins
+        arrays['calibration_silhouettes'] = kernel.calibration.silhouettes
+    return arrays
+
+
+def content_hash(arrays, features):
+    """SHA-256 over the arrays and feature order (independent of zip timestamps)"""
+    digest = hashlib.sha256(json.dumps(list(features)).encode())
+    for name in sorted(arrays):
+        array = np.ascontiguousarray(arrays[name])
+        digest.update(f"{name}:{array.dtype.str}:{array.shape}".encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def _file_sha256(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def export_kernel(kernel, path, model_type, sources=()):
+    """Write a kernel's inference state to a .npz artifact, returns its header"""
+    arrays = _kernel_arrays(kernel)
+    header = {
+        'format': ARTIFACT_FORMAT,
+        'model_type': model_type,
+        'features': list(kernel.features),
+        'sha256': content_hash(arrays, kernel.features),
+        'sources': {os.path.basename(source): _file_sha256(source) for source in sources}
+    }
+    header['version'] = header['sha256'][:12]
+
+    # Written next to the artifact and moved into place, so a loader never sees half a file
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        np.savez(f, header=np.array(json.dumps(header)), **arrays)
+    os.replace(temporary, path)
+    return header
+
+
+def read_header(path):
+    """Artifact header without loading the arrays"""
+    with np.load(path, allow_pickle=False) as data:
+        return json.loads(str(data['header']))
+
+
+def is_current(dataset_type, model_dir=MODEL_DIR, data_dir=DATA_DIR):
+    """Whether the artifact exists and was converted from the source files now on disk
+
+    Without the pickles (a deployment shipping only the artifacts) it can't be
+    converted again, so an existing artifact counts as current.
+    """
+    path = artifact_path(dataset_type, model_dir)
+    if not os.path.exists(path):
+        return False
+    sources = source_paths(dataset_type, model_dir, data_dir)
+    if not all(os.path.exists(source) for source in sources):
+        return True
+    recorded = read_header(path).get('sources', {})
+    return all(recorded.get(os.path.basename(source)) == _file_sha256(source) for source in sources)
+
+
+def load_kernel(path):
+    """Load a ScoringKernel from an artifact, checking its format and content hash"""
+    with np.load(path, allow_pickle=False) as data:
+        header = json.loads(str(data['header']))
+        arrays = {name: data[name] for name in data.files if name != 'header'}
+
+    if header.get('format') != ARTIFACT_FORMAT:
+        raise ValueError(f"{path}: unsupported artifact format {header.get('format')}")
+    if content_hash(arrays, header['features']) != header['sha256']:
+        raise ValueError(f"{path}: content hash mismatch, artifact is corrupted")
+
+    calibration = None
+    if 'calibration_margins' in arrays:
+        calibration = ConfidenceCalibration(arrays['calibration_margins'], arrays['calibration_silhouettes'])
+
+    kernel = ScoringKernel(arrays['mean'], arrays['scale'], arrays['centroids'],
+                           cluster_weights=arrays.get('cluster_weights'),
+                           features=header['features'], calibration=calibration)
+    kernel.version = header['version']
+    return kernel
+
+
+def convert_pickles(model_dir=MODEL_DIR, data_dir=DATA_DIR):
+    """Convert the joblib pickles in model_dir into artifacts, returns their headers"""
+    from wellness.models import build_kernels
+
+    kernels = dict(zip(["Teen", "Social Media"], build_kernels(model_dir, data_dir)))
+    model_types = {"Teen": "kmeans", "Social Media": "ward"}
+
+    headers = {}
+    for dataset_type, kernel in kernels.items():
+        headers[dataset_type] = export_kernel(kernel, artifact_path(dataset_type, model_dir),
+                                              model_types[dataset_type], source_paths(dataset_type, model_dir, data_dir))
+    return headers
+
+
+def main():
+    start = time.perf_counter()
+    headers = convert_pickles()
+    for dataset_type, header in headers.items():
+        path = artifact_path(dataset_type)
+        print(f"{dataset_type}: {path} ({os.path.getsize(path) / 1024:.1f} KB, version {header['version']})")
+    print(f"Converted in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Batch scoring for whole assessment cohorts
+
+Usage:
+    python -m wellness.batch roster.csv -o scored.csv --chunksize 10000
+
+Input columns match the assessment form: age_group, daily_usage, social_media,
+sleep_hours, bedtime_screen (optional: exercise_time, age_numeric).
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from wellness.models import MODEL_DIR, load_kernels
+from wellness.scoring import SCORING_ERRORS, ages_for_groups, datasets_for_ages, predict_clusters
+
+DEFAULT_CHUNKSIZE = 10000
+INPUT_COLUMNS = ['age_group', 'daily_usage', 'social_media', 'sleep_hours', 'bedtime_screen']
+
+logger = logging.getLogger(__name__)
+
+
+def score_frame(frame, models):
+    """Score a DataFrame of assessment answers, one vectorized pass per dataset
+
+    When a dataset's model fails on its rows they get the default cluster 0
+    with confidence 0.5, the failure is logged and the 'fallback' column is
+    True for them.
+    """
+    missing = [column for column in INPUT_COLUMNS if column not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing input columns: {', '.join(missing)}")
+
+    inputs = frame.reset_index(drop=True)
+    if 'age_numeric' not in inputs.columns:
+        inputs = inputs.assign(age_numeric=ages_for_groups(inputs['age_group']))
+
+    datasets = datasets_for_ages(inputs['age_group'])
+    clusters = np.zeros(len(inputs), dtype=int)
+    confidence = np.full(len(inputs), 0.5)
+    fallback = np.zeros(len(inputs), dtype=bool)
+
+    # Route rows to the Teen or Social Media model the same way the form does
+    for dataset_type in ("Teen", "Social Media"):
+        rows = np.flatnonzero(datasets == dataset_type)
+        if len(rows) == 0:
+            continue
+        try:
+            clusters[rows], confidence[rows] = predict_clusters(inputs.iloc[rows], dataset_type, *models)
+        except SCORING_ERRORS as e:
+            logger.warning("%s model failed on %d rows, giving them the default cluster: %s: %s",
+                           dataset_type, len(rows), type(e).__name__, e)
+            fallback[rows] = True
+
+    scored = frame.copy()
+    scored['dataset_used'] = datasets
+    scored['cluster'] = clusters
+    scored['confidence'] = confidence
+    scored['fallback'] = fallback
+    return scored
+
+
+def iter_scored_chunks(source, models, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield scored chunks from a CSV path or DataFrame, keeping memory bounded"""
+    if isinstance(source, pd.DataFrame):
+        chunks = (source.iloc[start:start + chunksize] for start in range(0, len(source), chunksize))
+    else:
+        chunks = pd.read_csv(source, chunksize=chunksize)
+
+    for chunk in chunks:
+        yield score_frame(chunk, models)
+
+
+def score_batch(source, output_path=None, models=None, chunksize=DEFAULT_CHUNKSIZE, model_dir=MODEL_DIR):
+    """Score a cohort and return throughput stats (plus the scored frame when not writing to disk)
+
+    stats['fallback_rows'] counts the rows a failing model left on the default cluster.
+    """
+    if models is None:
+        models = load_kernels(model_dir)
+
+    rows = 0
+    fallback_rows = 0
+    scored_chunks = []
+    start = time.perf_counter()
+
+    for index, chunk in enumerate(iter_scored_chunks(source, models, chunksize)):
+        rows += len(chunk)
+        fallback_rows += int(chunk['fallback'].sum())
+        if output_path is None:
+            scored_chunks.append(chunk)
+        else:
+            chunk.to_csv(output_path, mode='w' if index == 0 else 'a', header=index == 0, index=False)
+
+    seconds = time.perf_counter() - start
+    stats = {
+        'rows': rows,
+        'fallback_rows': fallback_rows,
+        'seconds': seconds,
+        'rows_per_second': rows / seconds if seconds > 0 else float('inf')
+    }
+    if output_path is None:
+        stats['scored'] = pd.concat(scored_chunks, ignore_index=True) if scored_chunks else pd.DataFrame()
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV of assessment answers in batch")
+    parser.add_argument("input", help="CSV with one row of assessment answers per user")
+    parser.add_argument("-o", "--output", help="where to write the scored CSV (default: stdout)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="rows scored per pass")
+    parser.add_argument("--model-dir", default=MODEL_DIR, help="folder with the trained models")
+    args = parser.parse_args(argv)
+
+    output = args.output if args.output else sys.stdout
+    stats = score_batch(args.input, output, chunksize=args.chunksize, model_dir=args.model_dir)
+
+    print(f"Scored {stats['rows']:,} rows in {stats['seconds']:.2f}s "
+          f"({stats['rows_per_second']:,.0f} rows/s)", file=sys.stderr)
+    if stats['fallback_rows']:
+        print(f"Warning: {stats['fallback_rows']:,} rows couldn't be scored by their model and got the default "
+              f"cluster (fallback column is True)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
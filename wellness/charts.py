@@ -0,0 +1,72 @@
+"""
+Chart builders that send aggregates instead of rows
+
+Histograms and box plots are drawn from the dashboard summary: bin counts
+become go.Bar traces and five-number summaries become precomputed go.Box
+traces, so the figure sent to the browser is the same size whether a dataset
+has a thousand rows or millions.
+"""
+
+import plotly.graph_objects as go
+
+
+def histogram_figure(summary, dataset_type, column, colors, title=None, labels=None, opacity=0.7):
+    """Per-cluster histogram of a column as stacked bars (like px.histogram with color='cluster')
+
+    colors maps cluster id -> color; only those clusters are drawn.
+    """
+    labels = labels or {}
+    edges = summary.histogram(dataset_type, column)[0]
+    centers = [(left + right) / 2 for left, right in zip(edges[:-1], edges[1:])]
+    widths = [right - left for left, right in zip(edges[:-1], edges[1:])]
+
+    fig = go.Figure()
+    for cluster, color in colors.items():
+        _, counts = summary.histogram(dataset_type, column, cluster)
+        fig.add_trace(go.Bar(
+            x=centers,
+            y=counts,
+            width=widths,
+            name=str(cluster),
+            marker=dict(color=color, line=dict(width=0)),
+            opacity=opacity,
+            hovertemplate=f"{labels.get(column, column)}=%{{x}}<br>count=%{{y}}<extra>{cluster}</extra>"
+        ))
+
+    fig.update_layout(
+        title=title,
+        barmode='relative',
+        bargap=0,
+        legend_title_text='cluster',
+        xaxis_title=labels.get(column, column),
+        yaxis_title=labels.get('count', 'count')
+    )
+    return fig
+
+
+def box_figure(summary, dataset_type, column, clusters=(0, 1), title=None, labels=None, color=None):
+    """Box plot of a column per cluster from precomputed quartiles and fences (like px.box(x='cluster'))
+
+    Outlier points aren't drawn, since they'd scale with the data.
+    """
+    labels = labels or {}
+    stats = [summary.stats(dataset_type, column, cluster) for cluster in clusters]
+
+    fig = go.Figure(go.Box(
+        x=list(clusters),
+        q1=[s['q1'] for s in stats],
+        median=[s['median'] for s in stats],
+        q3=[s['q3'] for s in stats],
+        lowerfence=[s['lower_fence'] for s in stats],
+        upperfence=[s['upper_fence'] for s in stats],
+        mean=[s['mean'] for s in stats],
+        boxpoints=False,
+        marker_color=color,
+        showlegend=False
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title=labels.get('cluster', 'cluster'),
+        yaxis_title=labels.get(column, column)
+    )
+    return fig
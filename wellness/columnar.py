@@ -0,0 +1,251 @@
+"""
+Columnar binary cache for the processed datasets
+
+Each CSV is converted once into one raw .npy file per column plus a
+manifest.json recording the source file's size, mtime and SHA-256. Loading
+memory-maps the columns instead of parsing text, and the cache is rebuilt
+automatically whenever the CSV's contents change.
+
+Usage:
+    python -m wellness.columnar                         (convert the processed datasets)
+    python -m wellness.columnar --benchmark --rows 1000000
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+CACHE_FORMAT = 1
+CACHE_DIR = os.path.join("data", "cache")
+DATASET_FILES = [os.path.join("data", "teen_processed.csv"), os.path.join("data", "social_processed.csv")]
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_path(csv_path, cache_dir=CACHE_DIR):
+    """Folder holding the columns of a CSV"""
+    return os.path.join(cache_dir, os.path.splitext(os.path.basename(csv_path))[0])
+
+
+def read_manifest(folder):
+    try:
+        with open(os.path.join(folder, "manifest.json"), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _source_stamp(csv_path):
+    stat = os.stat(csv_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def is_current(csv_path, folder):
+    """Whether the cached columns were converted from the CSV as it is now
+
+    Size and mtime are checked first; the file is only hashed when they differ
+    (e.g. after a checkout), so an unchanged cache costs two stat calls.
+    """
+    manifest = read_manifest(folder)
+    if manifest is None or manifest.get('format') != CACHE_FORMAT:
+        return False
+
+    stamp = _source_stamp(csv_path)
+    source = manifest['source']
+    if stamp['size'] == source['size'] and stamp['mtime_ns'] == source['mtime_ns']:
+        return True
+    if stamp['size'] != source['size'] or file_sha256(csv_path) != source['sha256']:
+        return False
+
+    # Same contents with a new mtime: remember it so the next check skips the hash
+    manifest['source'].update(stamp)
+    _write_manifest(folder, manifest)
+    return True
+
+
+def _save_column(folder, file, values):
+    """Write a column file as a new file, never over the one in place
+
+    Loaded frames memory-map the old file: overwriting it would change data a
+    running process treats as frozen (or SIGBUS it when the new file is smaller).
+    Replacing it leaves their mapping on the old, now unlinked, file.
+    """
+    temporary = os.path.join(folder, f"{file}.tmp")
+    with open(temporary, 'wb') as f:
+        np.save(f, values)
+    os.replace(temporary, os.path.join(folder, file))
+
+
+def _write_manifest(folder, manifest):
+    temporary = os.path.join(folder, "manifest.json.tmp")
+    with open(temporary, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temporary, os.path.join(folder, "manifest.json"))
+
+
+def ingest(csv_path, cache_dir=CACHE_DIR):
+    """Convert a CSV into typed .npy columns, returns the manifest"""
+    stamp = _source_stamp(csv_path)
+    sha256 = file_sha256(csv_path)
+    frame = pd.read_csv(csv_path)
+
+    folder = cache_path(csv_path, cache_dir)
+    os.makedirs(folder, exist_ok=True)
+
+    columns = []
+    for i, name in enumerate(frame.columns):
+        series = frame[name]
+        column = {'name': name, 'file': f"{i}.npy", 'dtype': str(series.dtype)}
+
+        if series.dtype.kind in 'biufcmM':
+            values = series.to_numpy()
+        else:
+            # Text as fixed-width unicode so nothing needs pickling, with a mask for missing values
+            missing = series.isna().to_numpy()
+            values = series.fillna('').astype(str).to_numpy(dtype=str)
+            if missing.any():
+                column['missing'] = f"{i}.missing.npy"
+                _save_column(folder, column['missing'], missing)
+        _save_column(folder, column['file'], values)
+        columns.append(column)
+
+    # Manifest goes last, so a half-written cache is never seen as current
+    manifest = {
+        'format': CACHE_FORMAT,
+        'source': dict(stamp, path=os.path.basename(csv_path), sha256=sha256),
+        'rows': len(frame),
+        'columns': columns
+    }
+    _write_manifest(folder, manifest)
+    return manifest
+
+
+def read_columns(folder, mmap=True):
+    """DataFrame backed by the cached columns (memory-mapped and read-only by default)"""
+    manifest = read_manifest(folder)
+    data = {}
+    for column in manifest['columns']:
+        # Plain ndarray views of the mapping, so pandas doesn't carry the memmap subclass around
+        values = np.asarray(np.load(os.path.join(folder, column['file']), mmap_mode='r' if mmap else None,
+                                    allow_pickle=False))
+        if values.dtype.kind == 'U':
+            series = pd.Series(values.astype(object))
+            if 'missing' in column:
+                series[np.load(os.path.join(folder, column['missing']), allow_pickle=False)] = None
+            values = series.astype(column['dtype']).to_numpy()
+        data[column['name']] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def load_frame(csv_path, cache_dir=CACHE_DIR):
+    """Load a dataset from its columnar cache, (re)converting the CSV when needed"""
+    folder = cache_path(csv_path, cache_dir)
+    if not is_current(csv_path, folder):
+        ingest(csv_path, cache_dir)
+    return read_columns(folder)
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KB
+
+    ru_maxrss survives fork/exec on Linux (a child starts at its parent's
+    peak), so the kernel's per-process high-water mark is preferred.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure(csv_path, cache_dir, columnar):
+    """Load time and peak RSS growth of one loading path, in a fresh interpreter"""
+    loader = f"load_frame({csv_path!r}, {cache_dir!r})" if columnar else f"pd.read_csv({csv_path!r})"
+    code = (
+        "import time\n"
+        "import pandas as pd\n"
+        "from wellness.columnar import load_frame, peak_rss_kb\n"
+        "before = peak_rss_kb()\n"
+        "start = time.perf_counter()\n"
+        f"frame = {loader}\n"
+        "total = float(frame.select_dtypes('number').sum().sum())\n"
+        "seconds = time.perf_counter() - start\n"
+        "print(seconds, peak_rss_kb() - before)\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=root).stdout
+    seconds, rss_kb = output.split()
+    return float(seconds), int(rss_kb) / 1024
+
+
+def benchmark(csv_paths, rows=None, runs=3):
+    """Compare the CSV and columnar loading paths, optionally on a dataset grown to `rows` rows"""
+    with tempfile.TemporaryDirectory() as folder:
+        results = []
+        for csv_path in csv_paths:
+            csv_path = os.path.abspath(csv_path)
+            if rows:
+                # Tile the real data up to the requested size
+                frame = pd.read_csv(csv_path)
+                grown = frame.iloc[np.arange(rows) % len(frame)]
+                csv_path = os.path.join(folder, os.path.basename(csv_path))
+                grown.to_csv(csv_path, index=False)
+
+            cache_dir = os.path.join(folder, "cache")
+            manifest = ingest(csv_path, cache_dir)
+            csv_runs = [_measure(csv_path, cache_dir, False) for _ in range(runs)]
+            columnar_runs = [_measure(csv_path, cache_dir, True) for _ in range(runs)]
+            results.append({
+                'dataset': os.path.basename(csv_path),
+                'rows': manifest['rows'],
+                'csv_seconds': min(r[0] for r in csv_runs),
+                'csv_rss_mb': min(r[1] for r in csv_runs),
+                'columnar_seconds': min(r[0] for r in columnar_runs),
+                'columnar_rss_mb': min(r[1] for r in columnar_runs)
+            })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert the processed datasets to the columnar cache")
+    parser.add_argument("csv", nargs="*", default=DATASET_FILES, help="CSV files to convert")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="where the columns are written")
+    parser.add_argument("--benchmark", action="store_true", help="compare load time and peak RSS with read_csv")
+    parser.add_argument("--rows", type=int, help="grow each dataset to this many rows for the benchmark")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        for result in benchmark(args.csv, args.rows):
+            print(f"{result['dataset']} ({result['rows']:,} rows): "
+                  f"read_csv {result['csv_seconds'] * 1000:.1f} ms / {result['csv_rss_mb']:.1f} MB peak RSS, "
+                  f"columnar {result['columnar_seconds'] * 1000:.1f} ms / {result['columnar_rss_mb']:.1f} MB peak RSS")
+        return 0
+
+    for csv_path in args.csv:
+        start = time.perf_counter()
+        manifest = ingest(csv_path, args.cache_dir)
+        print(f"{csv_path}: {manifest['rows']:,} rows, {len(manifest['columns'])} columns "
+              f"-> {cache_path(csv_path, args.cache_dir)} in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
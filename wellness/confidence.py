@@ -0,0 +1,60 @@
+"""
+Per-user confidence for cluster assignments
+
+A user's margin between the nearest and second-nearest cluster is mapped to
+the silhouette value training users with a similar margin actually had, so
+the average confidence over the research data approximates the model's
+silhouette score. Binning, keeping the curve non-decreasing and clipping to
+[0, 1] move it a little (within 0.02, checked in tests/test_unit.py).
+"""
+
+import numpy as np
+
+DEFAULT_BINS = 20
+
+
+def centroid_margin(costs):
+    """Relative gap between the nearest and second-nearest cluster, in [0, 1]
+
+    costs are squared distances (or Ward merge costs) per cluster, shape (n, k).
+    """
+    distances = np.sqrt(np.maximum(np.atleast_2d(costs), 0.0))
+    nearest = np.partition(distances, 1, axis=1)[:, :2]
+    total = nearest[:, 0] + nearest[:, 1]
+    gap = nearest[:, 1] - nearest[:, 0]
+    return np.divide(gap, total, out=np.zeros_like(gap), where=total > 0)
+
+
+class ConfidenceCalibration:
+    """Piecewise-linear curve from centroid margin to expected silhouette"""
+
+    def __init__(self, margins, silhouettes):
+        self.margins = np.asarray(margins, dtype=float)
+        self.silhouettes = np.asarray(silhouettes, dtype=float)
+
+    @classmethod
+    def fit(cls, margins, silhouettes, bins=DEFAULT_BINS):
+        """Average silhouette per equal-count margin bin, kept non-decreasing"""
+        order = np.argsort(margins)
+        margin_bins = np.array_split(np.asarray(margins, dtype=float)[order], bins)
+        silhouette_bins = np.array_split(np.asarray(silhouettes, dtype=float)[order], bins)
+
+        knots = np.array([b.mean() for b in margin_bins if len(b)])
+        values = np.array([b.mean() for b in silhouette_bins if len(b)])
+
+        # A wider margin should never mean less confidence
+        values = np.maximum.accumulate(values)
+        return cls(knots, np.clip(values, 0.0, 1.0))
+
+    def __call__(self, margins):
+        return np.interp(margins, self.margins, self.silhouettes)
+
+
+def fit_calibration(kernel, features, labels, bins=DEFAULT_BINS):
+    """Calibrate a ScoringKernel against per-sample silhouettes of its training data"""
+    from sklearn.metrics import silhouette_samples
+
+    features = np.asarray(features, dtype=float)
+    scaled = (features - kernel.mean) / kernel.scale
+    silhouettes = silhouette_samples(scaled, labels)
+    return ConfidenceCalibration.fit(kernel.margins(features), silhouettes, bins)
@@ -0,0 +1,270 @@
+"""
+Process-wide, read-only dataset store
+
+The dashboard datasets are loaded once per process and shared by reference
+between every session and rerun instead of being unpickled into a fresh copy
+each time (what st.cache_data does). Every column is a NumPy array with
+writeable=False and the recommendations are read-only mappings, so shared
+data can't be changed by accident. Sessions get shallow views of the frames:
+pandas copy-on-write gives a session its own copy of a column the moment it
+writes to it, and the shared frames never see the change. Copy-on-write is
+the default from pandas 3; on pandas 2 the app turns it on at startup with
+enable_copy_on_write().
+
+The files the pages read are declared once in ASSETS and loaded concurrently
+on a thread pool; files in data/ that no page reads aren't loaded at all.
+Each load is timed, see DatasetStore.report.
+
+Usage:
+    python -m wellness.datastore [--workers 1]    (load once and print the asset report)
+    python -m wellness.datastore --benchmark --sessions 100
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from wellness.columnar import CACHE_DIR, cache_path, load_frame, peak_rss_kb, read_manifest
+
+DATA_DIR = "data"
+
+Asset = namedtuple('Asset', ['file', 'load', 'used_by'])
+
+
+def _load_research(path, cache_dir):
+    """A research dataset from its columnar cache, and the CSV's SHA-256 kept in the cache manifest"""
+    frame = load_frame(path, cache_dir)
+    return frame, read_manifest(cache_path(path, cache_dir))['source']['sha256']
+
+
+def _load_json(path, cache_dir):
+    with open(path, 'rb') as f:
+        data = f.read()
+    return json.loads(data), hashlib.sha256(data).hexdigest()
+
+
+# Every file the pages read: Datasets field -> Asset(file in data/, loader, pages using it)
+ASSETS = {
+    'teen_df': Asset("teen_processed.csv", _load_research, "Overview, Research"),
+    'social_df': Asset("social_processed.csv", _load_research, "Overview, Research"),
+    'recommendations': Asset("recommendations.json", _load_json, "Get Recommendations")
+}
+# Files in data/ no page reads, never loaded by the dashboard
+UNUSED_FILES = ["teen_clusters.csv", "social_clusters.csv", "algorithm_performance.csv"]
+
+Datasets = namedtuple('Datasets', list(ASSETS))
+
+
+def freeze_frame(frame):
+    """DataFrame whose column arrays are all read-only (no copy when they already are)"""
+    columns = {}
+    for name in frame.columns:
+        values = frame[name].to_numpy()
+        if values.flags.writeable:
+            values = values.copy()
+            values.flags.writeable = False
+        columns[name] = values
+    return pd.DataFrame(columns, index=frame.index, copy=False)
+
+
+def freeze(value):
+    """Read-only version of parsed JSON: dicts become mappingproxies, lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def enable_copy_on_write():
+    """Turn on pandas copy-on-write for the whole process (already the default from pandas 3)
+
+    Session views need it: without it a write to a view hits the shared
+    read-only arrays and raises instead of copying the column.
+    """
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+
+def session_view(datasets):
+    """Per-session handle on shared datasets: shallow frame copies, nothing duplicated
+
+    Writing to a view copies only the touched column (pandas copy-on-write).
+    """
+    return datasets._replace(teen_df=datasets.teen_df.copy(deep=False),
+                             social_df=datasets.social_df.copy(deep=False))
+
+
+def data_version(report):
+    """Short hash identifying the loaded files' contents, from a load_assets report"""
+    digest = hashlib.sha256()
+    for entry in report:
+        digest.update(entry['sha256'].encode())
+    return digest.hexdigest()[:16]
+
+
+def _loaded_size(value):
+    """Approximate bytes an asset takes in memory"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    return len(json.dumps(value))
+
+
+def load_assets(data_dir=DATA_DIR, cache_dir=CACHE_DIR, workers=None):
+    """Load every asset in ASSETS, concurrently, returns (Datasets, report)
+
+    The report has one dict per asset, in ASSETS order: asset, file, used_by,
+    file_bytes, loaded_bytes, ms (its own load time), thread and sha256.
+    workers=1 loads them one after another.
+    """
+    def load(name):
+        asset = ASSETS[name]
+        path = os.path.join(data_dir, asset.file)
+        start = time.perf_counter()
+        value, sha256 = asset.load(path, cache_dir)
+        return value, {
+            'asset': name,
+            'file': asset.file,
+            'used_by': asset.used_by,
+            'file_bytes': os.path.getsize(path),
+            'loaded_bytes': _loaded_size(value),
+            'ms': (time.perf_counter() - start) * 1000,
+            'thread': threading.current_thread().name,
+            'sha256': sha256
+        }
+
+    with ThreadPoolExecutor(max_workers=workers or len(ASSETS), thread_name_prefix="asset") as pool:
+        results = list(pool.map(load, ASSETS))
+    return Datasets(*(value for value, _ in results)), [entry for _, entry in results]
+
+
+def report_lines(report, load_seconds=None):
+    """One line per asset of a load_assets report, plus the total when load_seconds is given"""
+    lines = [f"{entry['asset']:<16} {entry['file']:<22} {entry['ms']:>7.1f} ms "
+             f"{entry['file_bytes'] / 1024:>8.1f} KB on disk {entry['loaded_bytes'] / 1024:>8.1f} KB loaded "
+             f"({entry['thread']})" for entry in report]
+    if load_seconds is not None:
+        slowest = max(entry['ms'] for entry in report)
+        lines.append(f"{len(report)} assets in {load_seconds * 1000:.1f} ms (slowest {slowest:.1f} ms, "
+                     f"sum {sum(entry['ms'] for entry in report):.1f} ms); not loaded: {', '.join(UNUSED_FILES)}")
+    return lines
+
+
+def read_datasets(data_dir=DATA_DIR, cache_dir=CACHE_DIR):
+    """Load the dashboard datasets from disk as plain (writable) objects"""
+    return load_assets(data_dir, cache_dir)[0]
+
+
+class DatasetStore:
+    """Loads the datasets once and shares the same read-only objects with every caller"""
+
+    def __init__(self, data_dir=DATA_DIR, cache_dir=CACHE_DIR, workers=None):
+        self.data_dir = data_dir
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.load_seconds = None
+        self.version = None
+        # Per-asset timings and sizes of the load, see load_assets
+        self.report = None
+        self._datasets = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """The shared Datasets, loaded on first use"""
+        if self._datasets is None:
+            with self._lock:
+                if self._datasets is None:
+                    start = time.perf_counter()
+                    datasets, report = load_assets(self.data_dir, self.cache_dir, self.workers)
+                    frozen = Datasets(freeze_frame(datasets.teen_df),
+                                      freeze_frame(datasets.social_df),
+                                      freeze(datasets.recommendations))
+                    self.version = data_version(report)
+                    self.report = report
+                    self.load_seconds = time.perf_counter() - start
+                    # Published last, so other threads never see a half-loaded store
+                    self._datasets = frozen
+        return self._datasets
+
+    def view(self):
+        """Datasets for one session or rerun, see session_view"""
+        return session_view(self.load())
+
+
+def _grow(store, rows=None):
+    """Tile the store's research datasets to `rows` rows each (benchmark only)"""
+    datasets = store.load()
+    if rows:
+        teen_df, social_df = (frame.iloc[np.arange(rows) % len(frame)].reset_index(drop=True)
+                              for frame in (datasets.teen_df, datasets.social_df))
+        store._datasets = datasets._replace(teen_df=freeze_frame(teen_df), social_df=freeze_frame(social_df))
+    return store
+
+
+def _simulate(mode, sessions, rows):
+    """Per-rerun cost and memory of serving `sessions` concurrent sessions, in a fresh interpreter"""
+    code = (
+        "import pickle, time\n"
+        "import numpy as np\n"
+        "from wellness.columnar import peak_rss_kb\n"
+        "from wellness.datastore import DatasetStore, _grow, read_datasets\n"
+        f"store = _grow(DatasetStore(), {rows!r})\n"
+        "shared = store.load()\n"
+        "cached = pickle.dumps(shared._replace(recommendations=read_datasets().recommendations))\n"
+        "before = peak_rss_kb()\n"
+        "held = []\n"
+        "start = time.perf_counter()\n"
+        f"for _ in range({sessions}):\n"
+        # st.cache_data keeps the pickled return value and unpickles it on every hit
+        f"    held.append(pickle.loads(cached) if {mode == 'copy'!r} else store.view())\n"
+        "seconds = time.perf_counter() - start\n"
+        f"print(seconds / {sessions}, peak_rss_kb() - before)\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=root).stdout
+    seconds, rss_kb = output.split()
+    return float(seconds), int(rss_kb) / 1024
+
+
+def benchmark(sessions=100, rows=None):
+    """Compare per-session copies (st.cache_data) with the shared store"""
+    return {mode: _simulate(mode, sessions, rows) for mode in ("copy", "shared")}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the shared dataset store against per-rerun copies")
+    parser.add_argument("--benchmark", action="store_true", help="simulate concurrent sessions")
+    parser.add_argument("--sessions", type=int, default=100, help="concurrent sessions to simulate")
+    parser.add_argument("--rows", type=int, help="grow each research dataset to this many rows")
+    parser.add_argument("--workers", type=int, help="threads loading the assets (1: one after another)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="columnar cache (an empty folder: cold load)")
+    args = parser.parse_args(argv)
+
+    if not args.benchmark:
+        store = DatasetStore(cache_dir=args.cache_dir, workers=args.workers)
+        datasets = store.load()
+        print(f"Loaded {len(datasets.teen_df):,} teen and {len(datasets.social_df):,} social media rows "
+              f"in {store.load_seconds * 1000:.1f} ms")
+        print("\n".join(report_lines(store.report, store.load_seconds)))
+        return 0
+
+    labels = {"copy": "per-rerun copies (st.cache_data)", "shared": "shared read-only store"}
+    for mode, (seconds, rss_mb) in benchmark(args.sessions, args.rows).items():
+        print(f"{labels[mode]:<34} {seconds * 1e6:>10.1f} µs per rerun, "
+              f"+{rss_mb:.1f} MB RSS for {args.sessions} sessions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Density views of the dashboard scatter plots
+
+Instead of plotting a few hundred sampled points, every row is binned into a
+2-D grid server-side (one vectorized histogramdd call, with a layer per
+group) and drawn as translucent heatmap layers. The payload depends only on
+the grid size; a small sample of points can be overlaid on top.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import plotly.graph_objects as go
+
+GRID_BINS = 40
+
+# How the dashboard can draw its scatter plots
+SCATTER_MODES = ["Sample points", "Density", "Density + sample"]
+
+DensityGrid = namedtuple('DensityGrid', ['x_edges', 'y_edges', 'groups', 'counts'])
+
+
+def density_grid(x, y, groups, group_names, bins=GRID_BINS):
+    """Counts per (group, y bin, x bin) for points x, y labelled with groups
+
+    groups holds indexes into group_names; all layers share the same edges.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    groups = np.asarray(groups)
+    valid = ~(np.isnan(x) | np.isnan(y))
+
+    x_edges = np.histogram_bin_edges(x[valid], bins=bins)
+    y_edges = np.histogram_bin_edges(y[valid], bins=bins)
+    group_edges = np.arange(len(group_names) + 1) - 0.5
+    counts, _ = np.histogramdd((groups[valid], y[valid], x[valid]), bins=(group_edges, y_edges, x_edges))
+    return DensityGrid(x_edges, y_edges, list(group_names), counts.astype(np.int64))
+
+
+def screen_sleep_risk(screen, sleep):
+    """Research page risk label (0 Low, 1 Moderate, 2 High) from screen time and sleep"""
+    screen = np.asarray(screen, dtype=float)
+    sleep = np.asarray(sleep, dtype=float)
+    return np.select([(sleep >= 7) & (screen <= 6), (sleep < 5) | (screen > 10)], [0, 2], default=1)
+
+
+def dashboard_grids(datasets, bins=GRID_BINS):
+    """Grids for every scatter plot on the dashboard, built once per data version"""
+    teen_df = datasets.teen_df
+    social_df = datasets.social_df
+
+    # Overview: teen social media vs sleep, by cluster
+    teen_grid = density_grid(teen_df['Time_on_Social_Media'], teen_df['Sleep_Hours'], teen_df['cluster'],
+                             ["0", "1"], bins)
+
+    # Research: user groups of both datasets
+    group_grid = density_grid(
+        np.concatenate([teen_df['Time_on_Social_Media'].to_numpy(), social_df['Social Media Usage (hrs)'].to_numpy()]),
+        np.concatenate([teen_df['Sleep_Hours'].to_numpy(), social_df[' Sleep Duration '].to_numpy()]),
+        np.concatenate([teen_df['cluster'].to_numpy(), social_df['cluster'].to_numpy() + 2]),
+        ['Teen Balanced', 'Teen Higher Usage', 'Social Regular', 'Social High-Risk'],
+        bins
+    )
+
+    # Research: screen time vs sleep, by risk label
+    screen = np.concatenate([teen_df['Daily_Usage_Hours'].to_numpy(), social_df['Screen.Time(hrs)'].to_numpy()])
+    sleep = np.concatenate([teen_df['Sleep_Hours'].to_numpy(), social_df[' Sleep Duration '].to_numpy()])
+    risk_grid = density_grid(screen, sleep, screen_sleep_risk(screen, sleep), ['Low', 'Moderate', 'High'], bins)
+
+    return {
+        'teen_social_sleep': teen_grid,
+        'research_groups': group_grid,
+        'screen_sleep_risk': risk_grid
+    }
+
+
+def _transparent(color):
+    """Fully transparent version of a '#rrggbb' color"""
+    r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return f"rgba({r},{g},{b},0)"
+
+
+def density_figure(grid, colors, title=None, labels=None, sample=None, opacity=0.75):
+    """Heatmap layer per group, fading from transparent (empty cells) to the group's color
+
+    colors maps group name -> '#rrggbb'. sample is an optional
+    (x, y, group names) tuple of points drawn on top of the density.
+    """
+    labels = labels or {}
+    x_centers = (grid.x_edges[:-1] + grid.x_edges[1:]) / 2
+    y_centers = (grid.y_edges[:-1] + grid.y_edges[1:]) / 2
+
+    fig = go.Figure()
+    for group, counts in zip(grid.groups, grid.counts):
+        if group not in colors or not counts.any():
+            continue
+        color = colors[group]
+        fig.add_trace(go.Heatmap(
+            x=x_centers,
+            y=y_centers,
+            z=counts,
+            name=group,
+            colorscale=[[0, _transparent(color)], [1, color]],
+            zmin=0,
+            opacity=opacity,
+            showscale=False,
+            showlegend=True,
+            hovertemplate=f"{group}<br>x=%{{x:.1f}}<br>y=%{{y:.1f}}<br>users=%{{z}}<extra></extra>"
+        ))
+
+    if sample is not None:
+        sample_x, sample_y, sample_groups = (np.asarray(values) for values in sample)
+        for group, color in colors.items():
+            selected = sample_groups == group
+            if selected.any():
+                fig.add_trace(go.Scatter(
+                    x=sample_x[selected], y=sample_y[selected], mode='markers', name=f"{group} (sample)",
+                    marker=dict(color=color, size=5, line=dict(color='white', width=0.5)),
+                    showlegend=False
+                ))
+
+    fig.update_layout(
+        title=title,
+        xaxis_title=labels.get('x'),
+        yaxis_title=labels.get('y')
+    )
+    return fig
@@ -0,0 +1,118 @@
+"""
+Micro-batching for concurrent single-answer scoring
+
+When many sessions submit at once, each single assessment pays the model's
+per-call overhead and the request threads fight over the GIL. MicroBatcher
+queues single requests from any thread; a worker thread collects them for
+at most max_wait seconds (or until max_batch are queued) and scores them in
+one vectorized call. Each caller waits on a Future for its own result. When a
+batch fails, its rows are scored again one at a time, so one bad row only
+fails its own caller.
+
+A request that arrives alone waits up to max_wait before it's scored, so
+keep it to a few milliseconds.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_WAIT = 0.002
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """Runs score_batch(rows) -> results on batches of rows submitted one at a time"""
+
+    def __init__(self, score_batch, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if max_wait < 0:
+            raise ValueError("max_wait can't be negative")
+        self.score_batch = score_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        # Batches scored and rows in them, for the mean batch size
+        self.batches = 0
+        self.rows = 0
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._worker = None
+        self._closed = False
+
+    def submit(self, row):
+        """Queue one row, returns a Future of its result"""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+                self._worker.start()
+            self._queue.put((row, future))
+        return future
+
+    def __call__(self, row, timeout=None):
+        """Result for one row, scored in a batch with whatever else is queued"""
+        return self.submit(row).result(timeout)
+
+    def _collect(self, first):
+        """The first request plus whatever arrives before max_wait or max_batch"""
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                # Score what's collected, then stop
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch = self._collect(first)
+            try:
+                results = self.score_batch([row for row, _ in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    batch[0][1].set_exception(e)
+                else:
+                    # Score the rows one at a time, so an error only reaches its own caller
+                    self._score_each(batch)
+            else:
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+            self.batches += 1
+            self.rows += len(batch)
+
+    def _score_each(self, batch):
+        for row, future in batch:
+            try:
+                result = self.score_batch([row])[0]
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def mean_batch_size(self):
+        return self.rows / self.batches if self.batches else 0.0
+
+    def close(self):
+        """Score the requests already queued, then stop the worker thread"""
+        with self._lock:
+            self._closed = True
+            worker = self._worker
+        if worker is not None:
+            self._queue.put(_STOP)
+            worker.join()
@@ -0,0 +1,104 @@
+"""
+Process-wide cache of built Plotly figures
+
+Each chart is built by a function registered under a chart id. The built
+figure is serialized once and kept as JSON keyed by (chart id, data version,
+theme), in a bounded LRU shared by every session. On a hit the stored spec is
+handed to st.plotly_chart as is: no Plotly objects are constructed or
+validated again.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+
+from plotly.basedatatypes import BaseFigure
+
+MAX_FIGURES = 64
+
+
+class CachedFigure(BaseFigure):
+    """Serialized figure that plotly/streamlit treat as an already validated figure
+
+    Only to_dict is supported; build a real figure to change it.
+    """
+
+    def __init__(self, spec):
+        # BaseFigure.__init__ would validate the spec all over again
+        self._spec = spec
+
+    def to_dict(self):
+        return json.loads(self._spec)
+
+    def to_plotly_json(self):
+        return self.to_dict()
+
+    def __repr__(self):
+        return f"CachedFigure({len(self._spec)} bytes)"
+
+
+class FigureCache:
+    """Bounded LRU of figure JSON with hit/miss counters"""
+
+    def __init__(self, max_figures=MAX_FIGURES):
+        self.max_figures = max_figures
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._builders = {}
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, chart_id, builder):
+        """Use builder() to build chart_id; returns builder so it can be used as a decorator"""
+        self._builders[chart_id] = builder
+        return builder
+
+    def get(self, chart_id, version, theme=None):
+        """CachedFigure for a chart if it's already built (counted as a hit), else None"""
+        key = (chart_id, version, theme)
+        with self._lock:
+            spec = self._figures.get(key)
+            if spec is None:
+                return None
+            self._figures.move_to_end(key)
+            self.hits += 1
+        return CachedFigure(spec)
+
+    def figure(self, chart_id, version, theme=None, builder=None):
+        """CachedFigure for a chart, built with its registered builder (or `builder`) on a miss"""
+        key = (chart_id, version, theme)
+        with self._lock:
+            spec = self._figures.get(key)
+            if spec is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+                return CachedFigure(spec)
+            self.misses += 1
+
+        if builder is not None:
+            self._builders[chart_id] = builder
+        spec = self._builders[chart_id]().to_json()
+
+        with self._lock:
+            self._figures[key] = spec
+            self._figures.move_to_end(key)
+            while len(self._figures) > self.max_figures:
+                self._figures.popitem(last=False)
+                self.evictions += 1
+        return CachedFigure(spec)
+
+    def stats(self):
+        """Counters and size of the cache"""
+        with self._lock:
+            return {
+                'figures': len(self._figures),
+                'bytes': sum(len(spec) for spec in self._figures.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
@@ -0,0 +1,43 @@
+"""
+Out-of-sample predictions for the hierarchical (Ward) social media model
+AgglomerativeClustering has no predict(), so new users are assigned to the
+cluster whose Ward merge cost would be smallest
+"""
+
+import numpy as np
+
+
+class WardCentroidPredictor:
+    """Assign new points to Ward clusters using the training centroids"""
+
+    def __init__(self, centroids, counts):
+        self.centroids = np.asarray(centroids, dtype=float)
+        self.counts = np.asarray(counts, dtype=float)
+        self.n_clusters = len(self.centroids)
+        self.n_features_in_ = self.centroids.shape[1]
+
+        # Ward cost of merging a single point into cluster k: n_k / (n_k + 1) * ||x - c_k||^2
+        self.merge_weights = self.counts / (self.counts + 1.0)
+
+    @classmethod
+    def from_training_data(cls, scaled_features, labels):
+        """Build the predictor from the scaled training rows and their cluster labels"""
+        scaled_features = np.asarray(scaled_features, dtype=float)
+        labels = np.asarray(labels, dtype=int)
+        clusters = np.unique(labels)
+        if not np.array_equal(clusters, np.arange(len(clusters))):
+            raise ValueError(f"Expected cluster labels 0..k-1, got {clusters.tolist()}")
+
+        centroids = np.array([scaled_features[labels == k].mean(axis=0) for k in clusters])
+        counts = np.bincount(labels)
+        return cls(centroids, counts)
+
+    def merge_costs(self, scaled_features):
+        """Ward merge cost of every point against every cluster, shape (n, k)"""
+        X = np.atleast_2d(np.asarray(scaled_features, dtype=float))
+        diff = X[:, None, :] - self.centroids[None, :, :]
+        return np.einsum('nkd,nkd->nk', diff, diff) * self.merge_weights
+
+    def predict(self, scaled_features):
+        """Cluster label for each (already scaled) row"""
+        return self.merge_costs(scaled_features).argmin(axis=1)
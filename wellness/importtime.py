@@ -0,0 +1,129 @@
+"""
+Startup import-time report for the dashboard
+
+Runs app.py's module-level imports in a fresh interpreter with
+`python -X importtime`, adds up the cumulative cost per top-level package and
+checks it against a budget. Heavy modules that should only load on the code
+paths that need them (sklearn, joblib, plotly.express) must not show up at all.
+
+Usage:
+    python -m wellness.importtime            (report, exits 1 when over budget)
+    python -m wellness.importtime --runs 5
+"""
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+STARTUP_SCRIPT = "app.py"
+
+# Cumulative import budget in milliseconds, per top-level package and overall
+IMPORT_BUDGET_MS = {
+    'total': 1500,
+    'streamlit': 900,
+    # Shared services, with the pandas and numpy they load
+    'dashboard': 850,
+    'wellness': 100
+}
+
+# Modules (and their submodules) that must never be imported at startup.
+# Streamlit itself loads plotly's base package, so only plotly.express is listed.
+# Page modules are imported when their page is first visited.
+DEFERRED_MODULES = ['sklearn', 'scipy', 'joblib', 'plotly.express', 'dashboard.pages']
+
+
+def startup_imports(script=STARTUP_SCRIPT):
+    """Source of the import statements a script runs at module level"""
+    with open(script, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def import_roots(statements):
+    """Top-level packages the import statements name"""
+    roots = []
+    for node in ast.parse("\n".join(statements)).body:
+        names = [alias.name for alias in node.names] if isinstance(node, ast.Import) else [node.module]
+        roots.extend(name.split(".")[0] for name in names if name.split(".")[0] not in roots)
+    return roots
+
+
+def parse_importtime(output):
+    """(cumulative microseconds per top-level package, every module imported) from -X importtime output"""
+    costs = {}
+    modules = set()
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        module = name.strip()
+        modules.add(module)
+
+        # Only entries imported directly by the script carry the full cost of their subtree
+        if name.startswith(" ") and not name.startswith("  "):
+            root = module.split(".")[0]
+            costs[root] = costs.get(root, 0) + int(cumulative)
+    return costs, modules
+
+
+def measure(statements, runs=3, cwd=None):
+    """Fastest cumulative cost per package over several fresh interpreters, in ms"""
+    best = {}
+    modules = set()
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", "\n".join(statements)],
+                                capture_output=True, text=True, cwd=cwd)
+        if result.returncode != 0:
+            raise RuntimeError(f"Startup imports failed:\n{result.stderr[-2000:]}")
+
+        costs, run_modules = parse_importtime(result.stderr)
+        modules |= run_modules
+        for package, microseconds in costs.items():
+            best[package] = min(best.get(package, microseconds), microseconds)
+
+    # Interpreter startup (site, encodings, ...) isn't the script's cost
+    report = {package: best.get(package, 0) / 1000 for package in import_roots(statements)}
+    report['total'] = sum(report.values())
+    return report, modules
+
+
+def check_budget(report, modules, budget=IMPORT_BUDGET_MS):
+    """List of budget violations (empty when startup is within budget)"""
+    violations = []
+    for package, limit in budget.items():
+        if report.get(package, 0) > limit:
+            violations.append(f"{package}: {report[package]:.0f} ms > {limit} ms budget")
+
+    for deferred in DEFERRED_MODULES:
+        if any(module == deferred or module.startswith(deferred + ".") for module in modules):
+            violations.append(f"{deferred}: imported at startup, should be deferred")
+    return violations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report app.py's startup import time against the budget")
+    parser.add_argument("--script", default=STARTUP_SCRIPT, help="Streamlit script to check")
+    parser.add_argument("--runs", type=int, default=3, help="fresh interpreters to take the fastest run from")
+    args = parser.parse_args(argv)
+
+    statements = startup_imports(args.script)
+    report, modules = measure(statements, args.runs, cwd=os.path.dirname(os.path.abspath(args.script)))
+
+    print(f"{'package':<16}{'cumulative':>12}{'budget':>10}")
+    for package, ms in sorted(report.items(), key=lambda item: -item[1]):
+        if package == 'total':
+            continue
+        limit = IMPORT_BUDGET_MS.get(package)
+        print(f"{package:<16}{ms:>9.1f} ms{(str(limit) + ' ms') if limit else '-':>10}")
+    print(f"{'total':<16}{report['total']:>9.1f} ms{str(IMPORT_BUDGET_MS['total']) + ' ms':>10}")
+
+    violations = check_budget(report, modules)
+    for violation in violations:
+        print(f"over budget - {violation}", file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Fused scoring kernel: StandardScaler folded into the cluster centroids
+Scores raw assessment features with plain NumPy, no sklearn calls per request
+"""
+
+import numpy as np
+
+from wellness.confidence import centroid_margin
+
+
+class ScoringKernel:
+    """Nearest-centroid scorer that takes raw (unscaled) features
+
+    With z = (x - mean) / scale and centroids c_k in scaled space, the squared
+    distance ||z - c_k||^2 expands to q(x) + x @ coef[:, k] + intercept[k], where
+    q(x) = sum(x^2 / scale^2) is the same for every cluster. Plain K-Means only
+    needs the affine part; Ward clusters scale each distance by a per-cluster weight.
+    """
+
+    def __init__(self, mean, scale, centroids, cluster_weights=None, features=None, calibration=None):
+        self.mean = np.asarray(mean, dtype=float)
+        self.scale = np.asarray(scale, dtype=float)
+        self.centroids = np.asarray(centroids, dtype=float)
+        self.cluster_weights = None if cluster_weights is None else np.asarray(cluster_weights, dtype=float)
+        self.features = list(features) if features is not None else None
+        self.calibration = calibration
+        self.n_clusters = len(self.centroids)
+        self.n_features_in_ = self.centroids.shape[1]
+
+        # Centroids moved back into raw feature space, distances weighted by 1 / scale^2
+        raw_centroids = self.mean + self.scale * self.centroids
+        self.inv_var = 1.0 / self.scale ** 2
+        self.coef = -2.0 * (raw_centroids * self.inv_var).T
+        self.intercept = (raw_centroids ** 2 * self.inv_var).sum(axis=1)
+
+    @classmethod
+    def from_kmeans(cls, kmeans, scaler):
+        """Fold a fitted StandardScaler into a fitted KMeans"""
+        return cls(scaler.mean_, scaler.scale_, kmeans.cluster_centers_,
+                   features=getattr(scaler, 'feature_names_in_', None))
+
+    @classmethod
+    def from_ward(cls, predictor, scaler):
+        """Fold a fitted StandardScaler into a WardCentroidPredictor"""
+        return cls(scaler.mean_, scaler.scale_, predictor.centroids, predictor.merge_weights,
+                   features=getattr(scaler, 'feature_names_in_', None))
+
+    def sq_distances(self, features):
+        """Squared distance to every centroid in scaled space, shape (n, k)"""
+        X = np.atleast_2d(np.asarray(features, dtype=float))
+        distances = (X * X) @ self.inv_var
+        return np.maximum(distances[:, None] + X @ self.coef + self.intercept, 0.0)
+
+    def costs(self, features):
+        """Assignment cost per cluster (squared distance, Ward-weighted if needed)"""
+        distances = self.sq_distances(features)
+        if self.cluster_weights is None:
+            return distances
+        return distances * self.cluster_weights
+
+    def predict(self, features):
+        """Cluster label for each raw feature row"""
+        X = np.atleast_2d(np.asarray(features, dtype=float))
+        if self.cluster_weights is None:
+            # The per-row term doesn't change the argmin, so one affine transform is enough
+            return (X @ self.coef + self.intercept).argmin(axis=1)
+        return self.costs(X).argmin(axis=1)
+
+    def margins(self, features):
+        """Relative gap between the nearest and second-nearest cluster for each row"""
+        return centroid_margin(self.costs(features))
+
+    def confidence(self, features):
+        """Calibrated per-row confidence, or None if the kernel wasn't calibrated"""
+        if self.calibration is None:
+            return None
+        return self.calibration(self.margins(features))
@@ -0,0 +1,171 @@
+"""
+Load generator for the scoring service
+
+Sends random assessment answers to one endpoint from several client threads
+and reports latency percentiles and throughput. Without --url the service is
+started in this process on a free port (the client threads then share the
+interpreter with it, so a separate `python -m wellness.service` gives the
+cleaner numbers).
+
+--compare-batching runs the same load against a service scoring every request
+on its own and one that micro-batches concurrent requests (--max-batch,
+--max-wait-ms), at each --concurrency given. --live scores every request with
+the models instead of the precomputed lookup table.
+
+Usage:
+    python -m wellness.loadgen [--url http://127.0.0.1:8600] [--endpoint risk]
+                               [--batch 0] [--requests 2000] [--concurrency 8]
+    python -m wellness.loadgen --in-process --compare-batching --concurrency 1 8 64
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+import numpy as np
+
+from wellness.risk import LATE_NIGHT_OPTIONS, PHONE_BED_OPTIONS, SLEEP_QUALITY_OPTIONS
+from wellness.scoring import AGE_GROUPS
+from wellness.dispatcher import DEFAULT_MAX_BATCH, DEFAULT_MAX_WAIT
+from wellness.service import ENDPOINTS, ScoringClient, ScoringService, serve_in_background
+
+WARMUP_REQUESTS = 20
+
+
+def random_answers(n, seed=0):
+    """n answers dicts covering every option of the assessment form"""
+    rng = np.random.default_rng(seed)
+    columns = {
+        'age_group': rng.choice(AGE_GROUPS, n),
+        'daily_usage': rng.integers(1, 17, n),
+        'social_media': rng.integers(0, 13, n),
+        'sleep_hours': rng.integers(3, 13, n),
+        'bedtime_screen': rng.integers(0, 6, n),
+        'late_night_usage': rng.choice(LATE_NIGHT_OPTIONS, n),
+        'sleep_quality': rng.choice(SLEEP_QUALITY_OPTIONS, n),
+        'phone_bed': rng.choice(PHONE_BED_OPTIONS, n)
+    }
+    return [{name: values[i].item() for name, values in columns.items()} for i in range(n)]
+
+
+def percentile(latencies, q):
+    return float(np.percentile(latencies, q)) * 1000 if latencies else float('nan')
+
+
+def run_load(client, endpoint="risk", requests=2000, concurrency=8, batch=0, seed=0):
+    """Send requests from concurrency threads, returns latency and throughput stats
+
+    batch > 0 sends lists of that many answers to the endpoint's /batch variant.
+    """
+    answers = random_answers(max(batch, 1) * 64, seed)
+    payloads = [answers[i:i + batch] for i in range(0, len(answers), batch)] if batch else answers
+    target = f"{endpoint}/batch" if batch else endpoint
+
+    for i in range(WARMUP_REQUESTS):
+        client.call(target, payloads[i % len(payloads)])
+
+    latencies = [[] for _ in range(concurrency)]
+    errors = [0] * concurrency
+
+    def worker(index):
+        for i in range(index, requests, concurrency):
+            start = time.perf_counter()
+            try:
+                client.call(target, payloads[i % len(payloads)])
+            except Exception:
+                errors[index] += 1
+                continue
+            latencies[index].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    done = [latency for thread_latencies in latencies for latency in thread_latencies]
+    return {
+        'requests': len(done),
+        'errors': sum(errors),
+        'seconds': seconds,
+        'p50_ms': percentile(done, 50),
+        'p99_ms': percentile(done, 99),
+        'requests_per_second': len(done) / seconds if seconds > 0 else float('inf'),
+        'rows_per_second': len(done) * max(batch, 1) / seconds if seconds > 0 else float('inf')
+    }
+
+
+def _client(args, max_batch):
+    """Client for the service under test, where it runs, and the service when it's started here"""
+    if args.url is not None:
+        return ScoringClient(args.url), args.url, None
+    service = ScoringService(load_lookup=(lambda: None) if args.live else None,
+                             max_batch=max_batch, max_wait=args.max_wait_ms / 1000)
+    service.warm()
+    if args.in_process:
+        return ScoringClient(service=service), "in-process", service
+    _, url = serve_in_background(service)
+    return ScoringClient(url), url, service
+
+
+def _print_stats(stats):
+    print(f"  {stats['requests']:,} requests in {stats['seconds']:.2f}s, {stats['errors']} errors")
+    print(f"  p50 {stats['p50_ms']:.2f} ms   p99 {stats['p99_ms']:.2f} ms")
+    print(f"  {stats['requests_per_second']:,.0f} requests/s ({stats['rows_per_second']:,.0f} answers/s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure latency and throughput of the scoring service")
+    parser.add_argument("--url", help="running service (default: start one in this process)")
+    parser.add_argument("--in-process", action="store_true", help="call the service directly, without HTTP")
+    parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="risk", help="endpoint to call")
+    parser.add_argument("--batch", type=int, default=0, help="answers per request on the /batch variant (0: single)")
+    parser.add_argument("--requests", type=int, default=2000, help="requests to send")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8], help="client threads (one run each)")
+    parser.add_argument("--max-batch", type=int, default=0,
+                        help="micro-batch up to this many concurrent requests in the started service (0: off)")
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT * 1000,
+                        help="longest a request waits for others to batch with")
+    parser.add_argument("--live", action="store_true",
+                        help="score with the models in the started service, without the precomputed lookup table")
+    parser.add_argument("--compare-batching", action="store_true",
+                        help="compare per-request scoring with micro-batching (default --max-batch 64)")
+    args = parser.parse_args(argv)
+
+    if args.compare_batching:
+        if args.url is not None or args.batch:
+            parser.error("--compare-batching starts its own services and sends single requests")
+        max_batch = args.max_batch or DEFAULT_MAX_BATCH
+        clients = {"per request": _client(args, 0), f"batched (<= {max_batch}, {args.max_wait_ms:g} ms)":
+                   _client(args, max_batch)}
+        print(f"{args.endpoint} via {'in-process' if args.in_process else 'HTTP'}, {args.requests:,} requests"
+              f"{', live scoring' if args.live else ''}")
+        print(f"{'threads':>8}  {'scoring':<26}{'p50':>10}{'p99':>10}{'requests/s':>12}{'batch':>7}")
+        failed = False
+        for concurrency in args.concurrency:
+            for name, (client, _, service) in clients.items():
+                batcher = service.batcher
+                before = (batcher.batches, batcher.rows) if batcher else (0, 0)
+                stats = run_load(client, args.endpoint, args.requests, concurrency)
+                failed = failed or stats['errors'] > 0
+                size = ((batcher.rows - before[1]) / max(batcher.batches - before[0], 1)) if batcher else 1
+                print(f"{concurrency:>8}  {name:<26}{stats['p50_ms']:>7.2f} ms{stats['p99_ms']:>7.2f} ms"
+                      f"{stats['requests_per_second']:>12,.0f}{size:>7.1f}")
+        return 1 if failed else 0
+
+    client, where, _ = _client(args, args.max_batch)
+    failed = False
+    for concurrency in args.concurrency:
+        stats = run_load(client, args.endpoint, args.requests, concurrency, args.batch)
+        kind = f"batches of {args.batch}" if args.batch else "single requests"
+        print(f"{args.endpoint} ({kind}) via {where}, {concurrency} threads")
+        _print_stats(stats)
+        failed = failed or stats['errors'] > 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Precomputed outcomes for every possible assessment answer
+
+The form only offers discrete answers (integer sliders and fixed options), so
+the whole input space is enumerated once and each submission becomes a single
+array lookup. The table is stamped with the content hashes of the model
+artifacts and isn't used when they change, or when an artifact is out of date
+with the pickles and data it was converted from.
+
+Usage:
+    python -m wellness.lookup
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+import numpy as np
+
+from wellness.artifacts import artifact_path, is_current, read_header
+from wellness.models import MODEL_DIR, load_kernels
+from wellness.risk import (LATE_NIGHT_OPTIONS, PHONE_BED_OPTIONS, RISK_LEVELS, RISK_VERSION,
+                           SLEEP_QUALITY_OPTIONS, evaluate_risk, factors_from_mask, risk_level_codes)
+from wellness.scoring import AGE_GROUPS, AGE_MAPPING, DEFAULT_AGE, dataset_for_age, predict_clusters
+
+TABLE_PATH = os.path.join(MODEL_DIR, "assessment_lookup.npz")
+TABLE_FORMAT = 1
+
+# Model artifacts whose contents decide every table entry
+SOURCE_FILES = [artifact_path("Teen"), artifact_path("Social Media")]
+
+# Table axes, in order: (answer, possible values)
+SLIDER_AXES = [
+    ('daily_usage', list(range(1, 17))),
+    ('social_media', list(range(0, 13))),
+    ('sleep_hours', list(range(3, 13))),
+    ('bedtime_screen', list(range(0, 6)))
+]
+CHOICE_AXES = [
+    ('late_night_usage', LATE_NIGHT_OPTIONS),
+    ('sleep_quality', SLEEP_QUALITY_OPTIONS),
+    ('phone_bed', PHONE_BED_OPTIONS)
+]
+AXES = [('age_group', AGE_GROUPS)] + SLIDER_AXES + CHOICE_AXES
+SHAPE = tuple(len(values) for _, values in AXES)
+
+# The form always sends the default exercise time
+EXERCISE_TIME = 1.0
+
+_AXIS_INDEX = [{value: i for i, value in enumerate(values)} for _, values in AXES]
+DATASETS = ["Teen", "Social Media"]
+
+
+def models_version(source_files=SOURCE_FILES):
+    """Version stamp for the current model files and scoring rules"""
+    digest = hashlib.sha256(f"format={TABLE_FORMAT};risk={RISK_VERSION}".encode())
+    for path in source_files:
+        digest.update(read_header(path)['sha256'].encode())
+    return digest.hexdigest()[:16]
+
+
+def _cluster_grid(kernels):
+    """Cluster for every (age group, slider) combination"""
+    grids = np.meshgrid(*[np.asarray(values, dtype=float) for _, values in SLIDER_AXES], indexing='ij')
+    sliders = {name: grid.ravel() for (name, _), grid in zip(SLIDER_AXES, grids)}
+
+    clusters = np.empty((len(AGE_GROUPS),) + grids[0].shape, dtype=np.int8)
+    for a, age_group in enumerate(AGE_GROUPS):
+        answers = dict(sliders, age_numeric=AGE_MAPPING.get(age_group, DEFAULT_AGE), exercise_time=EXERCISE_TIME)
+        labels, _ = predict_clusters(answers, dataset_for_age(age_group), *kernels)
+        clusters[a] = labels.reshape(grids[0].shape)
+    return clusters
+
+
+def _risk_grid():
+    """Risk score and factor mask for every (dataset, answer) combination"""
+    # One broadcastable axis per answer, with datasets as the leading axis
+    ndim = len(SHAPE)
+    answers = {}
+    for axis, (name, values) in enumerate(AXES[1:], start=1):
+        answers[name] = np.asarray(values).reshape((1,) * axis + (-1,) + (1,) * (ndim - axis - 1))
+    datasets = np.asarray(DATASETS).reshape((-1,) + (1,) * (ndim - 1))
+
+    result = evaluate_risk(answers, datasets)
+    shape = (len(DATASETS),) + SHAPE[1:]
+    return (np.broadcast_to(result['risk_score'], shape).astype(np.int8),
+            np.broadcast_to(result['factor_mask'], shape).astype(np.uint16))
+
+
+def build_table(kernels=None):
+    """Enumerate the whole answer space, returns a dict of arrays ready to save"""
+    if kernels is None:
+        kernels = load_kernels()
+
+    clusters = _cluster_grid(kernels)
+    scores, masks = _risk_grid()
+
+    # Broadcast per-dataset risk over age groups and per-slider clusters over the choice answers
+    dataset_index = np.array([DATASETS.index(dataset_for_age(age_group)) for age_group in AGE_GROUPS])
+    scores = scores[dataset_index]
+    masks = masks[dataset_index]
+    clusters = np.broadcast_to(clusters.reshape(clusters.shape + (1,) * len(CHOICE_AXES)), SHAPE)
+
+    dataset_grid = np.asarray(DATASETS)[dataset_index].reshape((-1,) + (1,) * (len(SHAPE) - 1))
+    risk_levels = risk_level_codes(dataset_grid, clusters, scores)
+
+    return {
+        'cluster': np.ascontiguousarray(clusters, dtype=np.int8),
+        'risk_score': scores,
+        'risk_level': risk_levels,
+        'factor_mask': masks,
+        'version': np.array(models_version())
+    }
+
+
+class AssessmentLookup:
+    """Array-indexed outcomes of every possible assessment"""
+
+    def __init__(self, cluster, risk_score, risk_level, factor_mask, version):
+        self.cluster = cluster.ravel()
+        self.risk_score = risk_score.ravel()
+        self.risk_level = risk_level.ravel()
+        self.factor_mask = factor_mask.ravel()
+        self.version = str(version)
+
+    def index(self, answers):
+        """Flat table index for an answers dict, or None when it's outside the form's options"""
+        if answers.get('exercise_time', EXERCISE_TIME) != EXERCISE_TIME:
+            return None
+        flat = 0
+        for (name, _), positions, size in zip(AXES, _AXIS_INDEX, SHAPE):
+            position = positions.get(answers.get(name))
+            if position is None:
+                return None
+            flat = flat * size + position
+        return flat
+
+    def lookup(self, answers):
+        """(cluster, risk_score, risk_level, risk_factors) for an answers dict, or None"""
+        i = self.index(answers)
+        if i is None:
+            return None
+        return (int(self.cluster[i]), int(self.risk_score[i]),
+                RISK_LEVELS[self.risk_level[i]], factors_from_mask(int(self.factor_mask[i])))
+
+
+def save_table(table, path=TABLE_PATH):
+    np.savez_compressed(path, **table)
+
+
+def load_table(path=TABLE_PATH):
+    """Load the lookup table, or None if it's missing or was built for other models"""
+    if not all(os.path.exists(p) for p in [path] + SOURCE_FILES):
+        return None
+    # An artifact older than its pickles or data is about to be converted again
+    if not all(is_current(dataset_type) for dataset_type in DATASETS):
+        return None
+    with np.load(path, allow_pickle=False) as data:
+        if str(data['version']) != models_version():
+            return None
+        return AssessmentLookup(data['cluster'], data['risk_score'], data['risk_level'],
+                                data['factor_mask'], data['version'])
+
+
+def main():
+    start = time.perf_counter()
+    table = build_table()
+    save_table(table)
+    print(f"Built {table['cluster'].size:,} assessment outcomes in {time.perf_counter() - start:.1f}s "
+          f"-> {TABLE_PATH} (version {table['version']}, {os.path.getsize(TABLE_PATH) / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
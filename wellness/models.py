@@ -0,0 +1,90 @@
+"""
+Model loading for the Digital Wellness Dashboard
+"""
+
+import os
+import warnings
+
+import pandas as pd
+
+from wellness import artifacts
+from wellness.confidence import fit_calibration
+from wellness.hierarchical import WardCentroidPredictor
+from wellness.kernel import ScoringKernel
+from wellness.scoring import SOCIAL_FEATURES, TEEN_FEATURES
+
+MODEL_DIR = "models"
+DATA_DIR = "data"
+
+
+def build_social_predictor(social_model, social_scaler, data_dir=DATA_DIR):
+    """Turn the fitted hierarchical model into a predictor for new users"""
+    social_df = pd.read_csv(os.path.join(data_dir, "social_processed.csv"))
+    scaled = social_scaler.transform(social_df[SOCIAL_FEATURES])
+
+    # Training labels from the model itself; fall back to the exported cluster column
+    labels = getattr(social_model, 'labels_', None)
+    if labels is None or len(labels) != len(social_df):
+        labels = social_df['cluster'].to_numpy()
+
+    return WardCentroidPredictor.from_training_data(scaled, labels)
+
+
+def load_models(model_dir=MODEL_DIR, data_dir=DATA_DIR):
+    """Load the trained clustering models and scalers from disk"""
+    import joblib
+
+    with warnings.catch_warnings():
+        # Pickles were written by an older sklearn release
+        warnings.simplefilter('ignore')
+
+        # Load teen models
+        teen_model = joblib.load(os.path.join(model_dir, "teen_kmeans_model.pkl"))
+        teen_scaler = joblib.load(os.path.join(model_dir, "teen_scaler.pkl"))
+
+        # Load social media models
+        social_model = joblib.load(os.path.join(model_dir, "social_hierarchical_model.pkl"))
+        social_scaler = joblib.load(os.path.join(model_dir, "social_scaler.pkl"))
+
+        # Hierarchical clustering can't predict new users by itself
+        if not hasattr(social_model, 'predict'):
+            social_model = build_social_predictor(social_model, social_scaler, data_dir)
+
+    return teen_model, teen_scaler, social_model, social_scaler
+
+
+def build_kernels(model_dir=MODEL_DIR, data_dir=DATA_DIR):
+    """Build fused scoring kernels from the joblib pickles
+
+    Each kernel is calibrated once here against the per-sample silhouettes of
+    its research data, so per-user confidence costs O(k*d) at request time.
+    """
+    teen_model, teen_scaler, social_model, social_scaler = load_models(model_dir, data_dir)
+    teen_kernel = ScoringKernel.from_kmeans(teen_model, teen_scaler)
+    social_kernel = ScoringKernel.from_ward(social_model, social_scaler)
+
+    teen_df = pd.read_csv(os.path.join(data_dir, "teen_processed.csv"))
+    social_df = pd.read_csv(os.path.join(data_dir, "social_processed.csv"))
+    teen_kernel.calibration = fit_calibration(teen_kernel, teen_df[TEEN_FEATURES], teen_df['cluster'])
+    social_kernel.calibration = fit_calibration(social_kernel, social_df[SOCIAL_FEATURES], social_df['cluster'])
+
+    return teen_kernel, social_kernel
+
+
+def kernel_available(dataset_type, model_dir=MODEL_DIR):
+    """Whether a dataset's kernel can be loaded, without loading it"""
+    if os.path.exists(artifacts.artifact_path(dataset_type, model_dir)):
+        return True
+    return all(os.path.exists(os.path.join(model_dir, name)) for name in artifacts.SOURCE_PICKLES[dataset_type])
+
+
+def load_kernel(dataset_type, model_dir=MODEL_DIR, data_dir=DATA_DIR):
+    """Load one dataset's scoring kernel, converting the pickles if its artifact is missing or out of date"""
+    if not artifacts.is_current(dataset_type, model_dir, data_dir):
+        artifacts.convert_pickles(model_dir, data_dir)
+    return artifacts.load_kernel(artifacts.artifact_path(dataset_type, model_dir))
+
+
+def load_kernels(model_dir=MODEL_DIR, data_dir=DATA_DIR):
+    """Load the (teen, social) scoring kernels from their compact artifacts"""
+    return tuple(load_kernel(dataset_type, model_dir, data_dir) for dataset_type in artifacts.ARTIFACTS)
@@ -0,0 +1,225 @@
+"""
+Risk scoring for the digital wellness assessment
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Bump when the scoring rules change so precomputed outcomes get rebuilt
+RISK_VERSION = 1
+
+# Every factor the assessment can report, in the order it reports them (bit i of a factor mask)
+RISK_FACTORS = [
+    "High daily screen time for teens",
+    "Excessive social media use for teen age group",
+    "High daily screen time for adults",
+    "Excessive social media use for adult age group",
+    "Insufficient sleep duration",
+    "Below optimal sleep duration",
+    "Excessive bedtime screen exposure",
+    "Some bedtime screen use",
+    "Frequent late-night social media use",
+    "Poor sleep quality",
+    "Phone too close to bed"
+]
+
+RISK_LEVELS = ["Low Risk", "Moderate Risk", "High Risk", "Very High Risk"]
+
+# Answer options of the assessment form
+LATE_NIGHT_OPTIONS = ["Never", "Rarely (1-2 times/week)", "Sometimes (3-4 times/week)", "Often (5-6 times/week)", "Every night"]
+SLEEP_QUALITY_OPTIONS = ["Very Poor", "Poor", "Average", "Good", "Excellent"]
+PHONE_BED_OPTIONS = ["Yes, next to my bed", "Yes, but across the room", "No, I charge it outside"]
+
+ALL_DATASETS = ("Teen", "Social Media")
+
+RiskRule = namedtuple('RiskRule', ['group', 'column', 'op', 'threshold', 'weight', 'factor', 'datasets'])
+
+# Declarative scoring rules. Within a group only the first matching rule counts
+# (an if/elif chain); factor=None adds points without reporting a factor.
+RISK_RULES = [
+    # Age-based analysis
+    RiskRule('teen_usage', 'daily_usage', '>', 6, 2, "High daily screen time for teens", ("Teen",)),
+    RiskRule('teen_social', 'social_media', '>', 3, 2, "Excessive social media use for teen age group", ("Teen",)),
+    RiskRule('adult_usage', 'daily_usage', '>', 8, 2, "High daily screen time for adults", ("Social Media",)),
+    RiskRule('adult_social', 'social_media', '>', 4, 2, "Excessive social media use for adult age group", ("Social Media",)),
+
+    # Sleep impact factors
+    RiskRule('sleep', 'sleep_hours', '<', 6, 3, "Insufficient sleep duration", ALL_DATASETS),
+    RiskRule('sleep', 'sleep_hours', '<', 7, 1, "Below optimal sleep duration", ALL_DATASETS),
+    RiskRule('bedtime', 'bedtime_screen', '>', 2, 3, "Excessive bedtime screen exposure", ALL_DATASETS),
+    RiskRule('bedtime', 'bedtime_screen', '>', 1, 1, "Some bedtime screen use", ALL_DATASETS),
+
+    # Late night usage penalty
+    RiskRule('late_night', 'late_night_usage', '==', "Every night", 4, "Frequent late-night social media use", ALL_DATASETS),
+    RiskRule('late_night', 'late_night_usage', '==', "Often (5-6 times/week)", 3, "Frequent late-night social media use", ALL_DATASETS),
+    RiskRule('late_night', 'late_night_usage', '==', "Sometimes (3-4 times/week)", 2, None, ALL_DATASETS),
+    RiskRule('late_night', 'late_night_usage', '==', "Rarely (1-2 times/week)", 1, None, ALL_DATASETS),
+
+    # Sleep quality factors
+    RiskRule('sleep_quality', 'sleep_quality', '==', "Very Poor", 3, "Poor sleep quality", ALL_DATASETS),
+    RiskRule('sleep_quality', 'sleep_quality', '==', "Poor", 2, "Poor sleep quality", ALL_DATASETS),
+    RiskRule('sleep_quality', 'sleep_quality', '==', "Average", 1, None, ALL_DATASETS),
+
+    # Phone in bedroom penalty
+    RiskRule('phone_bed', 'phone_bed', '==', "Yes, next to my bed", 2, "Phone too close to bed", ALL_DATASETS)
+]
+
+# Research data columns -> assessment answers (questions the surveys didn't ask are left out)
+RESEARCH_COLUMNS = {
+    "Teen": {
+        'Daily_Usage_Hours': 'daily_usage',
+        'Time_on_Social_Media': 'social_media',
+        'Sleep_Hours': 'sleep_hours',
+        'Screen_Time_Before_Bed': 'bedtime_screen'
+    },
+    "Social Media": {
+        'Screen.Time(hrs)': 'daily_usage',
+        'Social Media Usage (hrs)': 'social_media',
+        ' Sleep Duration ': 'sleep_hours'
+    }
+}
+
+_OPS = {
+    '>': np.greater,
+    '<': np.less,
+    '==': np.equal
+}
+
+
+def _rule_groups():
+    """Rules grouped in table order"""
+    groups = {}
+    for rule in RISK_RULES:
+        groups.setdefault(rule.group, []).append(rule)
+    return list(groups.values())
+
+
+def _answer(answers, column):
+    """Answer column as an array, or None when the data doesn't have it"""
+    if column not in answers:
+        return None
+    values = answers[column]
+    return values.to_numpy() if hasattr(values, 'to_numpy') else np.asarray(values)
+
+
+def _prepare_column(values):
+    """Factorize large text columns once so each '==' rule compares integer codes"""
+    if values is None or values.dtype != object or values.size < 1000:
+        return values
+    codes, uniques = pd.factorize(values.ravel())
+    return (codes.reshape(values.shape), {value: i for i, value in enumerate(uniques)})
+
+
+def _compare(column, op, threshold):
+    """Rule condition for a prepared column"""
+    if isinstance(column, tuple):
+        codes, positions = column
+        return codes == positions.get(threshold, -2)
+    return _OPS[op](column, threshold)
+
+
+def risk_level_codes(datasets, clusters, risk_scores):
+    """Vectorized risk level (index into RISK_LEVELS) from dataset, cluster and score"""
+    datasets = np.asarray(datasets)
+    clusters = np.asarray(clusters)
+    risk_scores = np.asarray(risk_scores)
+    teen = datasets == "Teen"
+    higher = clusters == 1
+
+    codes = np.select(
+        [teen & higher & (risk_scores >= 8),  # Higher usage cluster from K-Means
+         teen & higher,
+         teen,
+         higher,  # High-risk cluster from Hierarchical clustering
+         risk_scores >= 4],
+        [2, 1, 0, 3, 1],
+        default=0
+    )
+    return codes.astype(np.int8)
+
+
+def evaluate_risk(answers, dataset_used=None, clusters=None):
+    """Score answers with the rule table, for one user or millions at once
+
+    answers is a dict (scalars or arrays) or a DataFrame with the form's answer
+    columns; missing columns simply score nothing. dataset_used is a dataset
+    name or an array of them, defaulting to the answers' 'dataset_used' column.
+    Returns a dict of arrays: risk_score, factor_mask and, when clusters are
+    given, risk_level_code and risk_level. Inputs broadcast like NumPy arrays.
+    """
+    if dataset_used is None:
+        dataset_used = _answer(answers, 'dataset_used')
+        if dataset_used is None:
+            raise ValueError("Pass dataset_used or include a 'dataset_used' column")
+    datasets = np.asarray(dataset_used)
+
+    risk_score = np.zeros((), dtype=np.int16)
+    mask = np.zeros((), dtype=np.uint16)
+    dataset_masks = {}
+    columns = {}
+
+    for rules in _rule_groups():
+        matched = []
+        for rule in rules:
+            if rule.column not in columns:
+                columns[rule.column] = _prepare_column(_answer(answers, rule.column))
+            column = columns[rule.column]
+            if column is None:
+                continue
+            if rule.datasets not in dataset_masks:
+                dataset_masks[rule.datasets] = np.logical_or.reduce([datasets == name for name in rule.datasets])
+            matched.append((_compare(column, rule.op, rule.threshold) & dataset_masks[rule.datasets], rule))
+
+        # First matching rule of the group wins, like an if/elif chain
+        group_score = 0
+        group_bits = 0
+        for condition, rule in reversed(matched):
+            bit = 0 if rule.factor is None else 1 << RISK_FACTORS.index(rule.factor)
+            group_score = np.where(condition, rule.weight, group_score)
+            group_bits = np.where(condition, bit, group_bits)
+        risk_score = risk_score + np.asarray(group_score, dtype=np.int16)
+        mask = mask | np.asarray(group_bits, dtype=np.uint16)
+
+    shape = np.broadcast_shapes(np.shape(risk_score), np.shape(mask), datasets.shape)
+    result = {
+        'risk_score': np.atleast_1d(np.broadcast_to(risk_score, shape)),
+        'factor_mask': np.atleast_1d(np.broadcast_to(mask, shape))
+    }
+
+    if clusters is not None:
+        codes = np.atleast_1d(risk_level_codes(datasets, clusters, result['risk_score']))
+        result['risk_level_code'] = codes
+        result['risk_level'] = np.asarray(RISK_LEVELS)[codes]
+    return result
+
+
+def research_risk(frame, dataset_used):
+    """Risk scores and levels for a processed research dataset"""
+    answers = frame.rename(columns=RESEARCH_COLUMNS[dataset_used])
+    return evaluate_risk(answers, dataset_used, answers['cluster'].to_numpy())
+
+
+def assess_risk(user_data, dataset_used):
+    """Score one user's answers, returns (risk_score, risk_factors)"""
+    result = evaluate_risk(user_data, dataset_used)
+    return int(result['risk_score'][0]), factors_from_mask(int(result['factor_mask'][0]))
+
+
+def risk_level_for(dataset_used, cluster, risk_score):
+    """Risk level from the clustering result and the answers' risk score"""
+    return RISK_LEVELS[int(risk_level_codes(dataset_used, cluster, risk_score))]
+
+
+def factor_mask(risk_factors):
+    """Pack a list of risk factors into a bitmask"""
+    mask = 0
+    for factor in risk_factors:
+        mask |= 1 << RISK_FACTORS.index(factor)
+    return mask
+
+
+def factors_from_mask(mask):
+    """Unpack a bitmask into the list of risk factors, in report order"""
+    return [factor for bit, factor in enumerate(RISK_FACTORS) if mask >> bit & 1]
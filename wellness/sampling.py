@@ -0,0 +1,82 @@
+"""
+Deterministic, stratified samples for the dashboard charts
+
+Samples are drawn once (seeded per chart, proportional to each stratum's
+size) and kept as read-only index arrays and frames. Every rerun gets a
+shallow view of the same sample, so charts don't reshuffle and nothing is
+copied after the first draw.
+"""
+
+import threading
+import zlib
+
+import numpy as np
+
+from wellness.datastore import freeze_frame
+
+SAMPLE_SEED = 42
+
+
+def stratified_indices(strata, size, seed=SAMPLE_SEED):
+    """Row indexes of a sample whose strata proportions match the data's
+
+    Each stratum gets its share of `size` (largest remainder rounding, so the
+    shares add up exactly); rows are drawn without replacement and returned
+    grouped by stratum, in row order within a stratum.
+    """
+    strata = np.asarray(strata)
+    if size >= len(strata):
+        return np.arange(len(strata))
+
+    values, inverse, counts = np.unique(strata, return_inverse=True, return_counts=True)
+    quotas = counts * size / len(strata)
+    shares = np.floor(quotas).astype(int)
+    remainder = size - shares.sum()
+    shares[np.argsort(shares - quotas, kind='stable')[:remainder]] += 1
+
+    rng = np.random.default_rng(seed)
+    order = np.argsort(inverse, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    chosen = [np.sort(rng.choice(order[start:start + count], share, replace=False))
+              for start, count, share in zip(starts, counts, shares)]
+    return np.concatenate(chosen)
+
+
+class SampleStore:
+    """Seeded samples drawn once per chart and shared as zero-copy views
+
+    Keep one store per data version; a sample is identified by its name and size.
+    """
+
+    def __init__(self, seed=SAMPLE_SEED):
+        self.seed = seed
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def _draw(self, name, source, size, by):
+        frame = source() if callable(source) else source
+        # Seeded by chart name, so adding a chart doesn't change the others
+        seed = self.seed ^ zlib.crc32(name.encode())
+        indices = stratified_indices(frame[by].to_numpy(), size, seed)
+        indices.flags.writeable = False
+        return indices, freeze_frame(frame.iloc[indices].reset_index(drop=True))
+
+    def _get(self, name, source, size, by):
+        key = (name, size)
+        if key not in self._samples:
+            with self._lock:
+                if key not in self._samples:
+                    self._samples[key] = self._draw(name, source, size, by)
+        return self._samples[key]
+
+    def sample(self, name, source, size, by='cluster'):
+        """Read-only sample of a DataFrame, stratified by column `by`
+
+        source is the DataFrame or a function building it, only called on the
+        first draw. Later calls return a shallow view of the same rows.
+        """
+        return self._get(name, source, size, by)[1].copy(deep=False)
+
+    def indices(self, name, source, size, by='cluster'):
+        """Read-only row indexes of the same sample"""
+        return self._get(name, source, size, by)[0]
@@ -0,0 +1,129 @@
+"""
+Cluster scoring shared by the assessment form and batch tools
+Works on a single answers dict or on a whole DataFrame of answers
+"""
+
+import numpy as np
+import pandas as pd
+
+# Age options offered by the assessment form
+AGE_GROUPS = ["13-15 (Early Teen)", "16-18 (Late Teen)", "19-22 (Young Adult)", "23-27 (Adult)", "27+ (Adult)"]
+TEEN_AGE_GROUPS = ["13-15 (Early Teen)", "16-18 (Late Teen)"]
+
+# Age group -> numeric age fed to the models (unknown groups fall back to DEFAULT_AGE)
+AGE_MAPPING = {
+    "13-15 (Early Teen)": 14,
+    "16-18 (Late Teen)": 17,
+    "19-25 (Young Adult)": 22,
+    "26-35 (Adult)": 30,
+    "36-45 (Mature Adult)": 40,
+    "46+ (Senior Adult)": 50
+}
+DEFAULT_AGE = 22
+
+# Feature order the scalers and models were trained with
+TEEN_FEATURES = ['Sleep_Hours', 'Screen_Time_Before_Bed', 'Time_on_Social_Media', 'Daily_Usage_Hours', 'Age']
+SOCIAL_FEATURES = [' Sleep Duration ', 'Social Media Usage (hrs)', 'Screen.Time(hrs)', 'Exercise Time (hrs)', 'Age']
+
+# Silhouette scores from research, the confidence used when a model isn't calibrated
+TEEN_CONFIDENCE = 0.152
+SOCIAL_CONFIDENCE = 0.775
+
+# What a model raises on answers it can't score (missing, non-numeric or misshapen features)
+SCORING_ERRORS = (KeyError, TypeError, ValueError)
+
+
+def dataset_for_age(age_group):
+    """Pick the dataset/model used for an age group, like the assessment form does"""
+    return "Teen" if age_group in TEEN_AGE_GROUPS else "Social Media"
+
+
+def datasets_for_ages(age_groups):
+    """Vectorized dataset_for_age for a column of age groups"""
+    is_teen = pd.Series(age_groups).isin(TEEN_AGE_GROUPS).to_numpy()
+    return np.where(is_teen, "Teen", "Social Media")
+
+
+def ages_for_groups(age_groups):
+    """Map a column of age groups to numeric ages"""
+    return pd.Series(age_groups).map(AGE_MAPPING).fillna(DEFAULT_AGE).to_numpy(dtype=float)
+
+
+def feature_matrix(user_data, dataset_type):
+    """Build the (n, 5) model input from an answers dict or DataFrame"""
+    if dataset_type == "Teen":
+        # Sleep_Hours, Screen_Time_Before_Bed, Time_on_Social_Media, Daily_Usage_Hours, Age
+        columns = [
+            user_data['sleep_hours'],
+            user_data['bedtime_screen'],
+            user_data['social_media'],
+            user_data['daily_usage'],
+            user_data.get('age_numeric', 16)  # Default teen age
+        ]
+    else:
+        # Sleep Duration, Social Media Usage (hrs), Screen.Time(hrs), Exercise Time (hrs), Age
+        columns = [
+            user_data['sleep_hours'],
+            user_data['social_media'],
+            user_data['daily_usage'],  # Screen time mapping
+            user_data.get('exercise_time', 1.0),  # Default exercise time
+            user_data.get('age_numeric', 22)  # Default adult age
+        ]
+
+    columns = np.broadcast_arrays(*[np.atleast_1d(np.asarray(c, dtype=float)) for c in columns])
+    return np.column_stack(columns)
+
+
+def fallback_clusters(user_data, dataset_type):
+    """Research-based cluster logic used when the trained models aren't available"""
+    daily_usage = np.atleast_1d(np.asarray(user_data['daily_usage']))
+    social_media = np.atleast_1d(np.asarray(user_data['social_media']))
+    sleep_hours = np.atleast_1d(np.asarray(user_data['sleep_hours']))
+
+    if dataset_type == "Teen":
+        # Research shows 49.3% in higher usage group, 50.7% in balanced group
+        bedtime_screen = np.atleast_1d(np.asarray(user_data['bedtime_screen']))
+        usage_risk = (daily_usage > 6).astype(int) + (social_media > 3) + (bedtime_screen > 1)
+        sleep_risk = sleep_hours < 7
+
+        # If multiple risk factors, likely higher usage group (cluster 1)
+        clusters = ((usage_risk >= 2) | sleep_risk).astype(int)
+    else:
+        # Research shows 99.2% regular users, 0.8% high-risk
+        clusters = ((daily_usage > 10) & (social_media > 6) & (sleep_hours < 5)).astype(int)
+
+    return clusters
+
+
+def research_confidence(dataset_type, n):
+    """Global silhouette score, for models without a calibrated confidence"""
+    return np.full(n, TEEN_CONFIDENCE if dataset_type == "Teen" else SOCIAL_CONFIDENCE)
+
+
+def predict_confidence(user_data, dataset_type, teen_model, social_model):
+    """Per-user confidence without predicting the cluster again"""
+    model = teen_model if dataset_type == "Teen" else social_model
+    if model is not None and model.calibration is not None:
+        return model.confidence(feature_matrix(user_data, dataset_type))
+    return research_confidence(dataset_type, len(np.atleast_1d(np.asarray(user_data['daily_usage']))))
+
+
+def predict_clusters(user_data, dataset_type, teen_model, social_model):
+    """Predict clusters and confidence for one or many users with a single kernel call
+
+    teen_model and social_model are ScoringKernels, so features go in unscaled.
+    Only the dataset's own model is used; the other one may be None.
+    """
+    model = teen_model if dataset_type == "Teen" else social_model
+    if model is not None:
+        features = feature_matrix(user_data, dataset_type)
+        clusters = model.predict(features)
+        confidence = model.confidence(features)
+    else:
+        clusters = fallback_clusters(user_data, dataset_type)
+        confidence = None
+
+    clusters = np.asarray(clusters, dtype=int)
+    if confidence is None:
+        confidence = research_confidence(dataset_type, len(clusters))
+    return clusters, confidence
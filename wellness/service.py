@@ -0,0 +1,419 @@
+"""
+Scoring service: clusters, risk and recommendations as JSON over HTTP
+
+Usage:
+    python -m wellness.service [--host 127.0.0.1] [--port 8600] [--warm]
+                               [--max-batch 64] [--max-wait-ms 2]
+
+Every endpoint takes assessment answers as JSON, one object or, on the
+/batch variant, a list of them:
+
+    POST /predict_cluster    POST /predict_cluster/batch
+    POST /risk               POST /risk/batch
+    POST /recommendations    POST /recommendations/batch
+    POST /assess             POST /assess/batch    (all of the above)
+    GET  /health
+
+Answers use the assessment form's names: age_group, daily_usage,
+social_media, sleep_hours, bedtime_screen, late_night_usage, sleep_quality
+and phone_bed (optional: exercise_time, age_numeric). Models are loaded once
+per process and shared by every request thread. With --max-batch, single
+answers arriving at the same time are scored together in one vectorized call
+(see wellness/dispatcher.py). ScoringService answers the same calls
+in-process, and ScoringClient calls either.
+"""
+
+import argparse
+import http.client
+import json
+import logging
+import math
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from wellness.dispatcher import DEFAULT_MAX_WAIT, MicroBatcher
+from wellness.models import DATA_DIR
+from wellness.risk import (LATE_NIGHT_OPTIONS, PHONE_BED_OPTIONS, RISK_LEVELS, SLEEP_QUALITY_OPTIONS, assess_risk,
+                           evaluate_risk, factors_from_mask, risk_level_for)
+from wellness.scoring import (AGE_GROUPS, AGE_MAPPING, DEFAULT_AGE, SCORING_ERRORS, dataset_for_age,
+                              predict_clusters, predict_confidence)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8600
+RECOMMENDATIONS_PATH = os.path.join(DATA_DIR, "recommendations.json")
+
+REQUIRED_ANSWERS = ['age_group', 'daily_usage', 'social_media', 'sleep_hours', 'bedtime_screen']
+ANSWERS = REQUIRED_ANSWERS + ['late_night_usage', 'sleep_quality', 'phone_bed']
+NUMERIC_ANSWERS = ['daily_usage', 'social_media', 'sleep_hours', 'bedtime_screen', 'exercise_time', 'age_numeric']
+# Answers picked from a list: the form's options (and the age groups AGE_MAPPING knows)
+CHOICE_ANSWERS = {
+    'age_group': AGE_GROUPS + [age_group for age_group in AGE_MAPPING if age_group not in AGE_GROUPS],
+    'late_night_usage': LATE_NIGHT_OPTIONS,
+    'sleep_quality': SLEEP_QUALITY_OPTIONS,
+    'phone_bed': PHONE_BED_OPTIONS
+}
+DATASETS = ["Teen", "Social Media"]
+RECOMMENDATION_KEYS = {"Teen": "teen_dataset", "Social Media": "social_dataset"}
+
+logger = logging.getLogger(__name__)
+
+# Endpoint -> fields of the full assessment it returns
+ENDPOINTS = {
+    "predict_cluster": ['dataset_used', 'cluster', 'confidence', 'model'],
+    "risk": ['dataset_used', 'cluster', 'risk_score', 'risk_level', 'risk_factors'],
+    "recommendations": ['dataset_used', 'cluster', 'recommendations'],
+    "assess": ['dataset_used', 'cluster', 'confidence', 'model', 'risk_score', 'risk_level', 'risk_factors',
+               'recommendations']
+}
+
+
+def _validated(answers):
+    """Answers dict with the required answers present and well-formed, or ValueError
+
+    Checked before an answer is queued for a micro-batch, so a malformed one is
+    rejected on its own instead of failing the batch it would have joined.
+    """
+    if not isinstance(answers, dict):
+        raise ValueError("Answers must be a JSON object")
+    missing = [name for name in REQUIRED_ANSWERS if answers.get(name) is None]
+    if missing:
+        raise ValueError(f"Missing answers: {', '.join(missing)}")
+    not_numbers = [name for name in NUMERIC_ANSWERS if name in answers
+                   and (isinstance(answers[name], bool) or not isinstance(answers[name], (int, float))
+                        or not math.isfinite(answers[name]))]
+    if not_numbers:
+        raise ValueError(f"Answers must be finite numbers: {', '.join(not_numbers)}")
+    not_choices = [name for name, choices in CHOICE_ANSWERS.items() if name in answers
+                   and (not isinstance(answers[name], str) or answers[name] not in choices)]
+    if not_choices:
+        raise ValueError(f"Answers must be one of the form's options: {', '.join(not_choices)}")
+    return answers
+
+
+def _load_recommendations(path=RECOMMENDATIONS_PATH):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _load_lookup():
+    from wellness.lookup import load_table
+    return load_table()
+
+
+def _load_kernel(dataset_type):
+    from wellness.models import load_kernel
+    return load_kernel(dataset_type)
+
+
+class ScoringService:
+    """Scores assessment answers with models loaded once and shared by every caller
+
+    load_model(dataset_type) and load_lookup() default to reading the model
+    artifacts and the precomputed outcome table from disk; the dashboard
+    passes its own cached loaders so both share one copy of each model.
+    With max_batch > 1, single calls are micro-batched: concurrent answers
+    are scored together by assess_batch, waiting at most max_wait seconds.
+    """
+
+    def __init__(self, load_model=None, load_lookup=None, recommendations_path=RECOMMENDATIONS_PATH,
+                 max_batch=0, max_wait=DEFAULT_MAX_WAIT):
+        self._loaders = {
+            "lookup": load_lookup or _load_lookup,
+            "recommendations": lambda: _load_recommendations(recommendations_path)
+        }
+        for dataset_type in DATASETS:
+            self._loaders[dataset_type] = lambda dataset_type=dataset_type: (load_model or _load_kernel)(dataset_type)
+        self._loaded = {}
+        self._lock = threading.Lock()
+        self.batcher = MicroBatcher(self.assess_batch, max_batch, max_wait) if max_batch > 1 else None
+
+    def _once(self, name):
+        """Load a model, the lookup table or the recommendations the first time they're needed"""
+        if name not in self._loaded:
+            with self._lock:
+                if name not in self._loaded:
+                    try:
+                        self._loaded[name] = self._loaders[name]()
+                    except Exception:
+                        if name == "recommendations":
+                            raise
+                        # Without a model the research-based fallback logic scores the answers
+                        self._loaded[name] = None
+        return self._loaded[name]
+
+    def model(self, dataset_type):
+        """The dataset's scoring kernel, or None when it can't be loaded"""
+        return self._once(dataset_type)
+
+    def warm(self):
+        """Load everything now instead of on the first request"""
+        for name in self._loaders:
+            self._once(name)
+
+    def _batched(self, answers):
+        """Full assessment of one user's answers, scored together with concurrent calls"""
+        answers = _validated(answers)
+        # Load in the caller's thread, so a missing model is reported there and not in the batcher
+        self._once("recommendations")
+        self.model(dataset_for_age(answers['age_group']))
+        return self.batcher(answers)
+
+    def _recommendations(self, dataset_used, cluster):
+        return self._once("recommendations")[RECOMMENDATION_KEYS[dataset_used]][f"cluster_{cluster}"]
+
+    def assess(self, answers):
+        """Full assessment of one user's answers, same outcome as the assessment form"""
+        answers = _validated(answers)
+        dataset_used = dataset_for_age(answers['age_group'])
+        default_age = AGE_MAPPING.get(answers['age_group'], DEFAULT_AGE)
+        user_data = dict(answers)
+        user_data.setdefault('age_numeric', default_age)
+
+        model = self.model(dataset_used)
+        models = (model, None) if dataset_used == "Teen" else (None, model)
+        scored_by_model = model is not None
+
+        # Precomputed outcome for answers on the form's options; score live otherwise
+        outcome = None
+        table = self._once("lookup")
+        if table is not None and model is not None and user_data['age_numeric'] == default_age:
+            outcome = table.lookup(user_data)
+
+        if outcome is not None:
+            cluster, risk_score, risk_level, risk_factors = outcome
+            confidence = predict_confidence(user_data, dataset_used, *models)[0]
+        else:
+            try:
+                clusters, confidence = predict_clusters(user_data, dataset_used, *models)
+                cluster, confidence = int(clusters[0]), confidence[0]
+            except SCORING_ERRORS as e:
+                # Same default classification the form falls back to, reported as model: False
+                logger.warning("%s model failed on 1 row, giving it the default cluster: %s: %s",
+                               dataset_used, type(e).__name__, e)
+                cluster, confidence, scored_by_model = 0, 0.5, False
+            risk_score, risk_factors = assess_risk(user_data, dataset_used)
+            risk_level = risk_level_for(dataset_used, cluster, risk_score)
+
+        return {
+            'dataset_used': dataset_used,
+            'cluster': int(cluster),
+            'confidence': float(confidence),
+            'model': scored_by_model,
+            'risk_score': int(risk_score),
+            'risk_level': risk_level,
+            'risk_factors': risk_factors,
+            'recommendations': self._recommendations(dataset_used, int(cluster))
+        }
+
+    def assess_batch(self, rows):
+        """Full assessments of many users, one vectorized pass per dataset"""
+        if not isinstance(rows, list):
+            raise ValueError("Batch requests take a JSON list of answers")
+        if not rows:
+            return []
+        rows = [_validated(row) for row in rows]
+
+        # Answer columns as arrays; plain lists are much cheaper to build than a DataFrame
+        answers = {name: np.array([row.get(name) for row in rows]) for name in ANSWERS
+                   if any(name in row for row in rows)}
+        answers['age_numeric'] = np.array([row.get('age_numeric', AGE_MAPPING.get(row['age_group'], DEFAULT_AGE))
+                                           for row in rows], dtype=float)
+        answers['exercise_time'] = np.array([row.get('exercise_time', 1.0) for row in rows], dtype=float)
+
+        datasets = np.array([dataset_for_age(row['age_group']) for row in rows])
+        clusters = np.zeros(len(rows), dtype=int)
+        confidence = np.full(len(rows), 0.5)
+        has_model = np.zeros(len(rows), dtype=bool)
+        for dataset_type in DATASETS:
+            indices = np.flatnonzero(datasets == dataset_type)
+            if len(indices) == 0:
+                continue
+            model = self.model(dataset_type)
+            models = (model, None) if dataset_type == "Teen" else (None, model)
+            has_model[indices] = model is not None
+            try:
+                subset = {name: values[indices] for name, values in answers.items()}
+                clusters[indices], confidence[indices] = predict_clusters(subset, dataset_type, *models)
+            except SCORING_ERRORS as e:
+                logger.warning("%s model failed on %d rows, giving them the default cluster: %s: %s",
+                               dataset_type, len(indices), type(e).__name__, e)
+                has_model[indices] = False
+
+        risk = evaluate_risk(answers, datasets, clusters)
+        return [{
+            'dataset_used': str(datasets[i]),
+            'cluster': int(clusters[i]),
+            'confidence': float(confidence[i]),
+            'model': bool(has_model[i]),
+            'risk_score': int(risk['risk_score'][i]),
+            'risk_level': RISK_LEVELS[int(risk['risk_level_code'][i])],
+            'risk_factors': factors_from_mask(int(risk['factor_mask'][i])),
+            'recommendations': self._recommendations(str(datasets[i]), int(clusters[i]))
+        } for i in range(len(rows))]
+
+    def call(self, endpoint, payload):
+        """Answer an endpoint ('risk', 'risk/batch', ...) for a decoded JSON payload"""
+        name, _, variant = endpoint.strip("/").partition("/")
+        if name not in ENDPOINTS or variant not in ("", "batch"):
+            raise LookupError(f"Unknown endpoint: {endpoint}")
+        fields = ENDPOINTS[name]
+        if variant == "batch":
+            return [{field: result[field] for field in fields} for result in self.assess_batch(payload)]
+        result = self._batched(payload) if self.batcher else self.assess(payload)
+        return {field: result[field] for field in fields}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, so a client can send many requests over one connection
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; don't let Nagle hold the body back
+    disable_nagle_algorithm = True
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {'status': "ok", 'endpoints': sorted(ENDPOINTS)})
+        else:
+            self._send(404, {'error': f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            self._send(200, self.server.service.call(self.path, json.loads(body)))
+        except LookupError as e:
+            self._send(404, {'error': str(e)})
+        except ValueError as e:
+            # Includes malformed JSON
+            self._send(400, {'error': str(e)})
+        except Exception as e:
+            self._send(500, {'error': f"{type(e).__name__}: {e}"})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, service=None, verbose=False):
+    """HTTP server for a ScoringService, one thread per connection"""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.service = service or ScoringService()
+    server.verbose = verbose
+    return server
+
+
+def serve_in_background(service=None, host=DEFAULT_HOST, port=0):
+    """Start a server on a daemon thread (port 0 picks a free one), returns (server, url)"""
+    server = make_server(host, port, service)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+class ScoringClient:
+    """Calls the scoring endpoints over HTTP (url) or in-process (service)
+
+    HTTP connections are kept alive, one per calling thread.
+    """
+
+    def __init__(self, url=None, service=None, timeout=10):
+        if url is None and service is None:
+            raise ValueError("Pass the service's url or a ScoringService")
+        self.url = url
+        self.service = service
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            parts = urlsplit(self.url)
+            connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def _post(self, endpoint, payload):
+        # Bytes, so http.client sends headers and body in a single packet
+        body = json.dumps(payload).encode("utf-8")
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request("POST", f"/{endpoint}", body, {"Content-Type": "application/json"})
+                response = connection.getresponse()
+                data = json.loads(response.read())
+                break
+            except (http.client.HTTPException, ConnectionError):
+                # The server closed an idle keep-alive connection, reconnect once
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+        if response.status == 400:
+            raise ValueError(data['error'])
+        if response.status != 200:
+            raise RuntimeError(f"Scoring service returned {response.status}: {data.get('error')}")
+        return data
+
+    def call(self, endpoint, payload):
+        """Result of an endpoint ('risk', 'risk/batch', ...) for answers or a list of them"""
+        if self.url is None:
+            return self.service.call(endpoint, payload)
+        return self._post(endpoint, payload)
+
+    def predict_cluster(self, answers):
+        return self.call("predict_cluster", answers)
+
+    def risk(self, answers):
+        return self.call("risk", answers)
+
+    def recommendations(self, answers):
+        return self.call("recommendations", answers)
+
+    def assess(self, answers):
+        return self.call("assess", answers)
+
+    def batch(self, endpoint, rows):
+        """Results of an endpoint for a list of answers, in one call"""
+        return self.call(f"{endpoint}/batch", rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve cluster, risk and recommendation scoring over HTTP")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="interface to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument("--warm", action="store_true", help="load the models before taking requests")
+    parser.add_argument("--max-batch", type=int, default=0,
+                        help="score up to this many concurrent single requests together (0: off)")
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT * 1000,
+                        help="longest a single request waits for others to batch with")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    service = ScoringService(max_batch=args.max_batch, max_wait=args.max_wait_ms / 1000)
+    server = make_server(args.host, args.port, service, verbose=args.verbose)
+    if args.warm:
+        server.service.warm()
+    print(f"Scoring service on http://{args.host}:{server.server_address[1]} "
+          f"(endpoints: {', '.join(sorted(ENDPOINTS))}, each with /batch)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+Precomputed dashboard summary
+
+Every count, mean, spread, quantile and histogram the dashboard pages show is
+computed once per data version and saved as a small JSON artifact next to the
+columnar cache. Pages read numbers from the summary instead of scanning rows,
+so they render in constant time however large the datasets grow.
+
+Usage:
+    python -m wellness.summary
+"""
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from wellness.columnar import CACHE_DIR
+from wellness.risk import RISK_LEVELS, RISK_VERSION, research_risk
+
+SUMMARY_FORMAT = 2
+SUMMARY_PATH = os.path.join(CACHE_DIR, "summary.json")
+HISTOGRAM_BINS = 30
+
+DATASETS = ["Teen", "Social Media"]
+
+# Column pairs the dashboard correlates, as (x, y) per dataset
+PAIRS = {
+    'screen_sleep': {"Teen": ('Daily_Usage_Hours', 'Sleep_Hours'),
+                     "Social Media": ('Screen.Time(hrs)', ' Sleep Duration ')}
+}
+
+
+def column_stats(values, edges):
+    """Count, moments, box-plot quartiles/fences and histogram of one column"""
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return {'count': 0}
+
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    # Whiskers end at the most extreme points within 1.5 IQR, like plotly's box traces
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+
+    return {
+        'count': int(len(values)),
+        'mean': float(values.mean()),
+        'std': float(values.std(ddof=1)) if len(values) > 1 else 0.0,
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'q1': float(q1),
+        'median': float(median),
+        'q3': float(q3),
+        'lower_fence': float(inside.min()),
+        'upper_fence': float(inside.max()),
+        'outliers': int(len(values) - len(inside)),
+        'histogram': np.histogram(values, bins=edges)[0].tolist()
+    }
+
+
+def pair_sums(x, y):
+    """Sufficient statistics of a regression of y on x (rows where both are present)
+
+    Sums add up across datasets, so the combined correlation and line are exact.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[valid], y[valid]
+    if len(x) == 0:
+        return {'n': 0}
+    return {
+        'n': int(len(x)),
+        'sum_x': float(x.sum()),
+        'sum_y': float(y.sum()),
+        'sum_xx': float(x @ x),
+        'sum_yy': float(y @ y),
+        'sum_xy': float(x @ y),
+        'min_x': float(x.min()),
+        'max_x': float(x.max()),
+        'min_y': float(y.min()),
+        'max_y': float(y.max())
+    }
+
+
+def linear_fit(sums):
+    """Slope, intercept and Pearson r from pair_sums"""
+    n = sums['n']
+    sxx = sums['sum_xx'] - sums['sum_x'] ** 2 / n
+    syy = sums['sum_yy'] - sums['sum_y'] ** 2 / n
+    sxy = sums['sum_xy'] - sums['sum_x'] * sums['sum_y'] / n
+    slope = sxy / sxx
+    intercept = (sums['sum_y'] - slope * sums['sum_x']) / n
+    return slope, intercept, sxy / np.sqrt(sxx * syy)
+
+
+def dataset_summary(frame, dataset_type, bins=HISTOGRAM_BINS):
+    """Summary of one research dataset, overall and per cluster"""
+    clusters = frame['cluster'].to_numpy()
+    cluster_ids = sorted(int(c) for c in np.unique(clusters))
+
+    columns = {}
+    for name in frame.columns:
+        if name == 'cluster' or frame[name].dtype.kind not in 'biuf':
+            continue
+        values = frame[name].to_numpy(dtype=float)
+        # Shared bin edges, so per-cluster histograms line up with the overall one
+        edges = np.histogram_bin_edges(values[~np.isnan(values)], bins=bins)
+        columns[name] = {
+            'edges': edges.tolist(),
+            'all': column_stats(values, edges),
+            'clusters': {str(c): column_stats(values[clusters == c], edges) for c in cluster_ids}
+        }
+
+    pairs = {}
+    for name, columns_by_dataset in PAIRS.items():
+        x, y = columns_by_dataset[dataset_type]
+        pairs[name] = pair_sums(frame[x], frame[y])
+
+    risk_levels = research_risk(frame, dataset_type)['risk_level_code']
+    return {
+        'rows': int(len(frame)),
+        'cluster_counts': {str(c): int((clusters == c).sum()) for c in cluster_ids},
+        'risk_level_counts': np.bincount(risk_levels, minlength=len(RISK_LEVELS)).tolist(),
+        'columns': columns,
+        'pairs': pairs
+    }
+
+
+def build_summary(datasets, version):
+    """Summary of the teen and social media datasets for one data version"""
+    return {
+        'format': SUMMARY_FORMAT,
+        'version': version,
+        'risk_version': RISK_VERSION,
+        'datasets': {
+            "Teen": dataset_summary(datasets.teen_df, "Teen"),
+            "Social Media": dataset_summary(datasets.social_df, "Social Media")
+        }
+    }
+
+
+class DashboardSummary:
+    """Read-only accessors over a summary dict"""
+
+    def __init__(self, data):
+        self.data = data
+        self.version = data['version']
+
+    def rows(self, dataset_type):
+        return self.data['datasets'][dataset_type]['rows']
+
+    def cluster_counts(self, dataset_type):
+        """Users per cluster, in cluster order"""
+        counts = self.data['datasets'][dataset_type]['cluster_counts']
+        return [counts[c] for c in sorted(counts, key=int)]
+
+    def risk_level_counts(self, dataset_type=None):
+        """Users per RISK_LEVELS entry, for one dataset or both"""
+        names = DATASETS if dataset_type is None else [dataset_type]
+        return np.sum([self.data['datasets'][name]['risk_level_counts'] for name in names], axis=0)
+
+    def stats(self, dataset_type, column, cluster=None):
+        """column_stats for a column, overall or for one cluster"""
+        summary = self.data['datasets'][dataset_type]['columns'][column]
+        return summary['all'] if cluster is None else summary['clusters'][str(cluster)]
+
+    def mean(self, dataset_type, column, cluster=None):
+        return self.stats(dataset_type, column, cluster)['mean']
+
+    def pair_sums(self, pair, dataset_type=None):
+        """pair_sums of a PAIRS entry, for one dataset or both combined"""
+        names = DATASETS if dataset_type is None else [dataset_type]
+        parts = [self.data['datasets'][name]['pairs'][pair] for name in names]
+        parts = [part for part in parts if part['n']]
+        combined = {'n': sum(part['n'] for part in parts)}
+        for stat in ('sum_x', 'sum_y', 'sum_xx', 'sum_yy', 'sum_xy'):
+            combined[stat] = sum(part[stat] for part in parts)
+        for stat, pick in (('min_x', min), ('max_x', max), ('min_y', min), ('max_y', max)):
+            combined[stat] = pick(part[stat] for part in parts)
+        return combined
+
+    def correlation(self, pair, dataset_type=None):
+        """(slope, intercept, r) of the regression over every row, see linear_fit"""
+        return linear_fit(self.pair_sums(pair, dataset_type))
+
+    def histogram(self, dataset_type, column, cluster=None):
+        """(bin edges, counts) for a column"""
+        return (self.data['datasets'][dataset_type]['columns'][column]['edges'],
+                self.stats(dataset_type, column, cluster)['histogram'])
+
+
+def save_summary(summary, path=SUMMARY_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = path + ".tmp"
+    with open(temporary, 'w') as f:
+        json.dump(summary, f)
+    os.replace(temporary, path)
+
+
+def load_summary(datasets, version, path=SUMMARY_PATH):
+    """Summary for this data version, rebuilt and saved when the saved one is stale"""
+    try:
+        with open(path, 'r') as f:
+            summary = json.load(f)
+        if (summary.get('format') == SUMMARY_FORMAT and summary.get('version') == version
+                and summary.get('risk_version') == RISK_VERSION):
+            return DashboardSummary(summary)
+    except (OSError, ValueError):
+        pass
+
+    summary = build_summary(datasets, version)
+    try:
+        save_summary(summary, path)
+    except OSError:
+        # A read-only deployment still gets the in-memory summary
+        pass
+    return DashboardSummary(summary)
+
+
+def main():
+    from wellness.datastore import DatasetStore
+
+    store = DatasetStore()
+    datasets = store.load()
+    start = time.perf_counter()
+    summary = build_summary(datasets, store.version)
+    save_summary(summary)
+    print(f"Built dashboard summary for data version {store.version} in {time.perf_counter() - start:.2f}s "
+          f"-> {SUMMARY_PATH} ({os.path.getsize(SUMMARY_PATH) / 1024:.1f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Script time per rerun
+
+The app records how long each rerun spends in the whole script, in the page
+that ran, and in fragments that rerun on their own, so the cost of every
+interaction can be compared. Times are kept per session in session state;
+RenderStats keeps each page's cold (first) and warm render times for the
+whole process.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+RENDER_TIMES_KEY = "render_times"
+
+
+def record(state, name, seconds):
+    state.setdefault(RENDER_TIMES_KEY, {})[name] = seconds
+
+
+@contextmanager
+def timed(state, name):
+    """Record the seconds spent in the block (or decorated function) under name
+
+    Also recorded when the block is cut short, e.g. by st.stop().
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(state, name, time.perf_counter() - start)
+
+
+def render_times(state):
+    """Last recorded times in milliseconds, by name"""
+    return {name: seconds * 1000 for name, seconds in state.get(RENDER_TIMES_KEY, {}).items()}
+
+
+class RenderStats:
+    """Cold and warm render times per page, shared by every session in the process
+
+    The first render of a page is cold (it imports the page and fills the
+    caches it uses); the last `keep` later renders are kept as warm times.
+    """
+
+    def __init__(self, keep=200):
+        self.keep = keep
+        self._cold = {}
+        self._warm = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            if name not in self._cold:
+                self._cold[name] = seconds
+            else:
+                self._warm.setdefault(name, deque(maxlen=self.keep)).append(seconds)
+
+    @contextmanager
+    def timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def report(self):
+        """{page: {'renders', 'cold_ms', 'warm_ms' (median, None before a second render)}}"""
+        with self._lock:
+            return {
+                name: {
+                    'renders': 1 + len(self._warm.get(name, ())),
+                    'cold_ms': cold * 1000,
+                    'warm_ms': float(np.median(self._warm[name])) * 1000 if self._warm.get(name) else None
+                }
+                for name, cold in self._cold.items()
+            }